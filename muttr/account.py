@@ -4,6 +4,7 @@ import json
 import os
 
 from muttr.config import APP_SUPPORT_DIR
+from muttr.filecache import StampedCache
 
 ACCOUNT_PATH = os.path.join(APP_SUPPORT_DIR, "account.json")
 
@@ -19,29 +20,51 @@ ACCOUNT_DEFAULTS = {
 }
 
 
-def load_account():
-    """Load account data from disk."""
+# Merged account data for ACCOUNT_PATH, reused until the file's stat stamp
+# changes so the fn-key path never re-parses account.json.
+_snapshot = StampedCache()
+
+
+def _merged(stored):
+    """Return *stored* merged over ACCOUNT_DEFAULTS."""
     data = dict(ACCOUNT_DEFAULTS)
     data["preferences"] = dict(ACCOUNT_DEFAULTS["preferences"])
+    data.update(stored)
+    if "preferences" in stored:
+        merged_prefs = dict(ACCOUNT_DEFAULTS["preferences"])
+        merged_prefs.update(stored["preferences"])
+        data["preferences"] = merged_prefs
+    return data
+
+
+def _read():
+    stored = {}
     if os.path.exists(ACCOUNT_PATH):
         try:
             with open(ACCOUNT_PATH, "r") as f:
                 stored = json.load(f)
-            data.update(stored)
-            if "preferences" in stored:
-                merged_prefs = dict(ACCOUNT_DEFAULTS["preferences"])
-                merged_prefs.update(stored["preferences"])
-                data["preferences"] = merged_prefs
         except (json.JSONDecodeError, OSError):
             pass
+    return _merged(stored)
+
+
+def _copy(data):
+    data = dict(data)
+    data["preferences"] = dict(data["preferences"])
     return data
 
 
+def load_account():
+    """Load account data from disk."""
+    return _copy(_snapshot.get(ACCOUNT_PATH, _read))
+
+
 def save_account(data):
     """Persist account data and notify listeners."""
     os.makedirs(APP_SUPPORT_DIR, exist_ok=True)
     with open(ACCOUNT_PATH, "w") as f:
         json.dump(data, f, indent=2)
+    _snapshot.put(ACCOUNT_PATH, _merged(data))
     from muttr import events
     events.emit("account_changed", account=data)
 
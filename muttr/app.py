@@ -1,36 +1,87 @@
-"""Main entry point — NSApplication run loop wiring all components."""
+"""Main entry point — NSApplication run loop wiring all components.
 
+Only what is needed to reach "Ready" (Cocoa, hotkey, recorder, overlay,
+menu bar, transcriber) is imported at launch.  Modules used once dictation
+starts are imported where they are used and warmed in the background after
+the model loads; see ``_DEFERRED_MODULES``.  ``python -m muttr.startup``
+reports what launch imports cost.
+"""
+
+import importlib
+import os
 import threading
 import time as _time
-
-import Cocoa
-
-from muttr.hotkey import HotkeyListener
-from muttr.recorder import Recorder
-from muttr.transcriber import create_transcriber
-from muttr.cleanup import clean_text
-from muttr.inserter import insert_text
-from muttr.overlay import Overlay
-from muttr.menubar import MenuBar
-from muttr.context import build_context_prompt
-from muttr.cadence import (
-    CadenceTracker, SpeechMetrics, SpeechProfile,
-    load_speech_profile, save_speech_profile,
-)
-from muttr.confidence import (
-    TranscriptionResult, WordInfo, extract_word_confidence, should_show_review,
+from datetime import date as _date
+
+_LAUNCHED = _time.perf_counter()
+
+import Cocoa  # noqa: E402
+
+from muttr.hotkey import HotkeyListener  # noqa: E402
+from muttr.recorder import LEVEL, Recorder  # noqa: E402
+from muttr.trace import Trace  # noqa: E402
+from muttr.workqueue import WorkQueue  # noqa: E402
+from muttr.transcriber import create_transcriber, model_pool, transcript_cache  # noqa: E402
+from muttr.overlay import Overlay  # noqa: E402
+from muttr.menubar import MenuBar  # noqa: E402
+from muttr.murmur import MurmurMode  # noqa: E402
+from muttr import config, account, events, keychain  # noqa: E402
+
+# Imported on first use; preloaded off the main thread once the app is ready
+# so the first dictation does not pay for them.
+_DEFERRED_MODULES = (
+    "muttr.cleanup",
+    "muttr.inserter",
+    "muttr.context",
+    "muttr.cadence",
+    "muttr.confidence",
+    "muttr.vad",
+    "muttr.sounds",
+    "muttr.history",
+    "muttr.budget",
+    "muttr.ghostwriter",
 )
-from muttr.murmur import MurmurMode
-from muttr import sounds
-from muttr import config, history, account, budget, ghostwriter
+
+
+# How long the transcription thread waits for the main thread to paste
+_INSERT_TIMEOUT_S = 5.0
+
+
+def _warm_deferred_imports():
+    for name in _DEFERRED_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"MuttR: Could not preload {name}: {e}")
+
+
+def _prepare_history_key():
+    # Importing history pulls in cryptography, so this runs off the main thread.
+    from muttr import history
+    history.prepare_key()
+    # Index rows from before the search index existed, and load its
+    # vocabulary, so the first search doesn't do either.
+    history.start_search_index()
+
+
+def _trimmed(audio):
+    """Silence-trimmed audio for decoding, with its map back to *audio*."""
+    from muttr.vad import trim_silence
+    return trim_silence(audio)
 
 
 class AppDelegate(Cocoa.NSObject):
     """Keeps the app alive when launched as a .app bundle."""
 
+    on_terminate = None
+
     def applicationShouldTerminate_(self, sender):
         return Cocoa.NSTerminateNow
 
+    def applicationWillTerminate_(self, notification):
+        if self.on_terminate is not None:
+            self.on_terminate()
+
     def applicationDidFinishLaunching_(self, notification):
         pass
 
@@ -41,9 +92,16 @@ class MuttRApp:
         self.recorder = Recorder()
         self._engine_name = self._cfg.get("transcription_engine", "whisper")
         self._model_size = self._cfg.get("model", "base.en")
+        self._decode_profile = self._cfg.get("decode_profile", "balanced")
+        self._decode_workers = self._cfg.get("parallel_decode_workers", 1)
+        # Engine settings of a backend still loading in reload_engine_if_changed
+        self._loading_settings = None
+        self._apply_cache_settings(self._cfg)
         self.transcriber = create_transcriber(
             engine=self._engine_name,
             model_size=self._model_size,
+            profile=self._decode_profile,
+            workers=self._decode_workers,
         )
         self.overlay = Overlay()
         self.menubar = MenuBar.alloc().init()
@@ -55,63 +113,142 @@ class MuttRApp:
         )
         self._record_start = None
         self._model_ready = threading.Event()
-        self._cadence_tracker: CadenceTracker | None = None
+        self._cadence_tracker = None  # cadence.CadenceTracker while recording
+        self._stream = None
         self._murmur = MurmurMode()
         self._ghostwriter_active = False
+        self._work = WorkQueue("muttr-bookkeeping")
+        self._words_remaining = None
+        self._budget_day = None
+        events.on("license_changed", lambda **_: self._work.submit(self._refresh_budget))
 
     @property
     def cleanup_level(self):
         return config.get("cleanup_level", 1)
 
     def run(self):
+        startup = Trace("startup", imports_ms=round((_time.perf_counter() - _LAUNCHED) * 1000, 3))
         app = Cocoa.NSApplication.sharedApplication()
         app.setActivationPolicy_(Cocoa.NSApplicationActivationPolicyAccessory)
 
         # Set delegate to keep the app alive when launched as .app bundle
         self._delegate = AppDelegate.alloc().init()
+        self._delegate.on_terminate = self._shutdown
         app.setDelegate_(self._delegate)
 
+        # Read Keychain items and resolve the history key off the main thread
+        # before anything needs them
+        keychain.prefetch()
+        threading.Thread(target=_prepare_history_key, daemon=True).start()
+
         # Load Whisper model in background
         print(f"MuttR: Loading Whisper model ({self._model_size})...")
         def _load_model():
             self.transcriber.load()
             self._model_ready.set()
             print("MuttR: Model loaded and ready.")
+            self._work.submit(self._refresh_budget)
+            self._work.submit(_warm_deferred_imports)
+            self._preload_alternate_models()
         threading.Thread(target=_load_model, daemon=True).start()
 
-        self.overlay.setup()
-        self.menubar.setup()
+        with startup.span("ui"):
+            self.overlay.setup()
+            self.menubar.setup()
 
         if not config.get("onboarding_completed", False):
-            from muttr.onboarding import OnboardingWindowController
-            self._onboarding = OnboardingWindowController.alloc().init()
-            self._onboarding.show()
-
-        self.hotkey.start()
-
-        print("MuttR: Ready. Hold fn to record, release to transcribe.")
+            with startup.span("onboarding"):
+                from muttr.onboarding import OnboardingWindowController
+                self._onboarding = OnboardingWindowController.alloc().init()
+                self._onboarding.show()
+
+        with startup.span("hotkey"):
+            self.hotkey.start()
+
+        record = startup.finish()
+        print(f"MuttR: Ready in {(_time.perf_counter() - _LAUNCHED):.2f}s "
+              f"({record['attrs']['imports_ms']:.0f} ms imports).")
+        print("MuttR: Hold fn to record, release to transcribe.")
         print("MuttR: Requires Accessibility + Microphone permissions.")
 
         app.run()
 
     def reload_engine_if_changed(self):
-        """Check config and swap the transcription backend if the user changed it."""
+        """Check config and swap the transcription backend if the user changed it.
+
+        Models already resident in the pool are swapped in immediately.
+        Otherwise the new model loads in the background while dictation
+        keeps using the current one.  The engine settings are only updated
+        once the new backend is in use, so a load that fails is retried on
+        the next call.
+        """
         cfg = config.load()
-        new_engine = cfg.get("transcription_engine", "whisper")
-        new_model = cfg.get("model", "base.en")
-        if new_engine == self._engine_name and new_model == self._model_size:
+        self._apply_cache_settings(cfg)
+        wanted = (
+            cfg.get("transcription_engine", "whisper"),
+            cfg.get("model", "base.en"),
+            cfg.get("decode_profile", "balanced"),
+            cfg.get("parallel_decode_workers", 1),
+        )
+        if wanted == self._engine_settings():
+            self._loading_settings = None  # drop a load the user switched away from
             return
+        if wanted == self._loading_settings:
+            return
+        new_engine, new_model, new_profile, new_workers = wanted
         print(f"MuttR: Switching engine {self._engine_name} -> {new_engine}")
-        self._engine_name = new_engine
-        self._model_size = new_model
-        self._model_ready.clear()
-        self.transcriber = create_transcriber(engine=new_engine, model_size=new_model)
+        transcriber = create_transcriber(
+            engine=new_engine, model_size=new_model, profile=new_profile,
+            workers=new_workers,
+        )
+        if transcriber.is_resident():
+            transcriber.load()
+            self._loading_settings = None
+            self._use_transcriber(transcriber, wanted)
+            return
+        self._loading_settings = wanted
         def _load_model():
-            self.transcriber.load()
-            self._model_ready.set()
-            print("MuttR: Model loaded and ready.")
+            try:
+                transcriber.load()
+            except Exception as exc:
+                print(f"MuttR: Loading {new_engine} model {new_model} failed, "
+                      f"keeping {self._model_size}: {exc}")
+                if self._loading_settings == wanted:
+                    self._loading_settings = None
+                return
+            # Skip the swap if the user switched again while we loaded.
+            if self._loading_settings == wanted:
+                self._loading_settings = None
+                self._use_transcriber(transcriber, wanted)
+                print("MuttR: Model loaded and ready.")
         threading.Thread(target=_load_model, daemon=True).start()
 
+    def _engine_settings(self):
+        return (self._engine_name, self._model_size, self._decode_profile, self._decode_workers)
+
+    def _use_transcriber(self, transcriber, settings):
+        self.transcriber = transcriber
+        (self._engine_name, self._model_size,
+         self._decode_profile, self._decode_workers) = settings
+
+    def _apply_cache_settings(self, cfg):
+        model_pool().set_budget(cfg.get("model_pool_budget_mb", 1024))
+        cache = transcript_cache()
+        cache.set_capacity(cfg.get("transcript_cache_size", 64))
+        cache.set_directory(
+            os.path.join(config.APP_SUPPORT_DIR, "transcript-cache")
+            if cfg.get("transcript_cache_disk", False) else None
+        )
+
+    def _preload_alternate_models(self):
+        if not config.get("preload_alternate_model", False):
+            return
+        for model_size in sorted(config.VALID_MODELS - {self._model_size}):
+            create_transcriber(
+                engine=self._engine_name, model_size=model_size, profile=self._decode_profile,
+                workers=self._decode_workers,
+            ).preload()
+
     # ------------------------------------------------------------------
     # Hotkey callbacks
     # ------------------------------------------------------------------
@@ -125,6 +262,7 @@ class MuttRApp:
         self._record_start = _time.time()
         # Start cadence tracking for this session
         # update_interval_ms ~64ms matches the recorder's block size at 16kHz
+        from muttr.cadence import CadenceTracker
         self._cadence_tracker = CadenceTracker(update_interval_ms=64.0)
 
         # Murmur mode: calibrate noise floor from initial silence
@@ -135,9 +273,23 @@ class MuttRApp:
         # Sound feedback
         prefs = account.load_account()["preferences"]
         if prefs.get("sound_feedback", False):
+            from muttr import sounds
             sounds.play_start()
 
-        self.recorder.start()
+        # Streaming: decode committed segments while fn is still held
+        self._stream = None
+        if config.get("streaming_transcription", True) and not self._murmur.active:
+            from muttr.context import build_context_prompt
+            try:
+                self._stream = self.transcriber.start_stream(
+                    prompt_factory=build_context_prompt,
+                    preprocess=_trimmed if config.get("vad_trim", True) else None,
+                    word_timestamps=config.get("confidence_review", False),
+                )
+            except Exception as e:
+                print(f"MuttR: Streaming unavailable, falling back: {e}")
+
+        self.recorder.start(on_block=self._stream.feed if self._stream else None)
 
         # Overlay toggle
         if prefs.get("show_overlay", True):
@@ -150,11 +302,16 @@ class MuttRApp:
         self._record_start = None
         audio = self.recorder.stop()
         self._stop_level_updates()
+        if self.recorder.dropped_blocks:
+            print(f"MuttR: {self.recorder.dropped_blocks} audio block(s) dropped (input overflow)")
+        stream = self._stream
+        self._stream = None
 
         prefs = account.load_account()["preferences"]
 
         # Sound feedback
         if prefs.get("sound_feedback", False):
+            from muttr import sounds
             sounds.play_stop()
 
         # Overlay toggle
@@ -162,6 +319,8 @@ class MuttRApp:
             self.overlay.show_transcribing()
 
         if audio is None or len(audio) < 1600:  # < 0.1s of audio
+            if stream is not None:
+                stream.cancel()
             self.overlay.hide()
             return
 
@@ -179,12 +338,13 @@ class MuttRApp:
         # Transcribe in background to keep UI responsive
         threading.Thread(
             target=self._transcribe_and_insert,
-            args=(audio, duration, is_replace),
+            args=(audio, duration, is_replace, stream),
             daemon=True,
         ).start()
 
     def _on_double_tap(self):
         """Called on double-tap fn — Ghostwriter mode."""
+        from muttr import ghostwriter
         if not ghostwriter.is_enabled():
             return
 
@@ -216,8 +376,17 @@ class MuttRApp:
     # Transcription pipeline
     # ------------------------------------------------------------------
 
-    def _transcribe_and_insert(self, audio, duration, is_replace=False):
-        """Run transcription and insertion off the main thread."""
+    def _transcribe_and_insert(self, audio, duration, is_replace=False, stream=None):
+        """Run transcription and insertion off the main thread.
+
+        If *stream* is given, most of the audio has already been decoded
+        while recording and only the uncommitted tail is decoded here.
+        Each stage is timed into a ``muttr.trace.Trace``.
+        """
+        from muttr.cleanup import clean_text
+        from muttr.confidence import low_confidence_words
+
+        trace = Trace("dictation", audio_s=round(duration, 2), streamed=stream is not None)
         try:
             engine = self.transcriber.name
 
@@ -225,80 +394,143 @@ class MuttRApp:
             cadence = self._cadence_tracker
             self._cadence_tracker = None
             if cadence is not None:
-                try:
+                with trace.span("cadence", suppress=True):
                     cadence.finish_session()
-                except Exception:
-                    pass
-
-            # Context stitching: build initial_prompt from clipboard + history
-            initial_prompt = ""
-            try:
-                initial_prompt = build_context_prompt()
-            except Exception:
-                pass
-
-            # Transcribe with optional context prompt
-            kwargs = {}
-            if initial_prompt:
-                kwargs["initial_prompt"] = initial_prompt
 
-            raw_result = self.transcriber.transcribe(audio, **kwargs)
-
-            raw_text = raw_result if isinstance(raw_result, str) else str(raw_result)
-            result = TranscriptionResult(text=raw_text)
-
-            cleaned = clean_text(result.text, level=self.cleanup_level)
+            if stream is not None:
+                with trace.span("stream_finish"):
+                    transcript = stream.finish()
+            else:
+                # Context stitching: build initial_prompt from clipboard + history
+                initial_prompt = ""
+                with trace.span("context", suppress=True):
+                    from muttr.context import build_context_prompt
+                    initial_prompt = build_context_prompt()
+
+                # Transcribe with optional context prompt
+                kwargs = {}
+                if initial_prompt:
+                    kwargs["initial_prompt"] = initial_prompt
+
+                trim = None
+                if config.get("vad_trim", True):
+                    with trace.span("vad"):
+                        trim = _trimmed(audio)
+
+                # Word alignment costs extra decode time; only confidence
+                # review needs it.  Coaching uses the segment probability.
+                kwargs["word_timestamps"] = config.get("confidence_review", False)
+                with trace.span("transcribe"):
+                    transcript = self.transcriber.transcribe_result(
+                        trim.audio if trim is not None else audio, **kwargs,
+                    )
+                # Word times back on the untrimmed recording
+                if trim is not None and trim.trimmed:
+                    transcript = transcript.mapped(trim.to_original_times)
+
+            if config.get("confidence_review", False):
+                low = low_confidence_words(transcript)
+                if low:
+                    print(f"MuttR: Low-confidence words — {', '.join(low)}")
+
+            with trace.span("cleanup"):
+                cleaned = clean_text(transcript.text, level=self.cleanup_level)
 
             if not cleaned or not cleaned.strip():
                 return  # nothing to insert or log
 
-            # Log to history
-            try:
-                history.add_entry(
-                    raw_text=result.text or "",
-                    cleaned_text=cleaned,
-                    engine=engine,
-                    duration_s=round(duration, 2),
-                )
-            except Exception:
-                pass  # never let history logging break the pipeline
-
-            # Cadence coaching feedback
-            try:
-                if config.get("cadence_feedback", True):
-                    metrics = SpeechMetrics.analyze(audio, cleaned, duration)
-                    profile = load_speech_profile()
-                    profile.update(metrics)
-                    feedback = profile.get_feedback(metrics)
-                    if feedback:
-                        print(f"MuttR: Speech feedback — {feedback}")
-                    save_speech_profile(profile)
-            except Exception:
-                pass
-
-            # Check word budget before inserting
+            # Check word budget before inserting (in-memory, no SQLite)
             word_count = len(cleaned.split())
-            if budget.is_over_budget():
+            with trace.span("budget"):
+                over_budget = self._is_over_budget()
+            if over_budget:
                 print("MuttR: Word budget exceeded — upgrade for more words")
                 self._perform_on_main(self._show_budget_exceeded)
-                return
-
-            self._perform_on_main(lambda: insert_text(cleaned))
-
-            # Record usage after successful insert
-            try:
-                budget.record_usage(word_count)
-            except Exception:
-                pass
+            else:
+                self._insert_on_main(cleaned, trace)
+                if self._words_remaining is not None:
+                    self._words_remaining -= word_count
+
+            # History, coaching and usage accounting run after insertion,
+            # in order, on the bookkeeping queue.
+            self._work.submit(
+                self._record_dictation,
+                raw_text=transcript.text or "",
+                cleaned=cleaned,
+                engine=engine,
+                audio=audio,
+                duration=duration,
+                word_count=word_count,
+                inserted=not over_budget,
+                confidence=transcript.segment_probability,
+            )
 
         except Exception as e:
+            trace.error = f"{type(e).__name__}: {e}"
             print(f"MuttR: Transcription error: {e}")
         finally:
             self._perform_on_main(self.overlay.hide)
+            trace.finish()
+
+    def _record_dictation(self, raw_text, cleaned, engine, audio, duration, word_count,
+                          inserted=True, confidence=0.0):
+        """Bookkeeping for a transcribed dictation; runs on the work queue.
+
+        Usage is only recorded for dictations that were actually inserted.
+        """
+        from muttr import budget, history
+        from muttr.cadence import SpeechMetrics, load_speech_profile, save_speech_profile
+
+        trace = Trace("bookkeeping", words=word_count)
+
+        # Log to history; never let history logging break the pipeline
+        with trace.span("history", suppress=True):
+            history.add_entry(
+                raw_text=raw_text,
+                cleaned_text=cleaned,
+                engine=engine,
+                duration_s=round(duration, 2),
+            )
+
+        # Cadence coaching feedback
+        with trace.span("coaching", suppress=True):
+            if config.get("cadence_feedback", True):
+                metrics = SpeechMetrics.analyze(audio, cleaned, duration, confidence=confidence)
+                profile = load_speech_profile()
+                profile.update(metrics)
+                feedback = profile.get_feedback(metrics)
+                if feedback:
+                    print(f"MuttR: Speech feedback — {feedback}")
+                save_speech_profile(profile)
+
+        if inserted:
+            with trace.span("record_usage", suppress=True):
+                budget.record_usage(word_count)
+                self._refresh_budget()
+        trace.finish()
+
+    def _refresh_budget(self):
+        """Reload the in-memory word budget from the budget database."""
+        from muttr import budget
+        self._words_remaining = budget.words_remaining_today()
+        self._budget_day = _date.today()
+
+    def _is_over_budget(self):
+        """Budget check from the in-memory counter, reloaded at day rollover."""
+        if self._budget_day != _date.today():
+            self._refresh_budget()
+        return self._words_remaining is not None and self._words_remaining <= 0
+
+    def _shutdown(self):
+        """Flush pending bookkeeping before the process exits."""
+        if not self._work.shutdown(timeout=5.0):
+            print("MuttR: Timed out flushing background work at shutdown")
+        from muttr import history
+        if not history.flush_pending(timeout=5.0):
+            print("MuttR: History key not ready at shutdown; queued entries were not saved")
 
     def _show_budget_exceeded(self):
         """Show a notification that the word budget has been exceeded."""
-        remaining = budget.words_remaining_today()
         alert = Cocoa.NSAlert.alloc().init()
         alert.setMessageText_("Word Limit Reached")
         alert.setInformativeText_(
@@ -315,12 +547,16 @@ class MuttRApp:
 
     def _start_level_updates(self):
         """Periodically push audio levels to the overlay and cadence tracker."""
+        seq = 0  # meter_since() clamps to the start of this recording
+
         def update_level(timer):
-            level = self.recorder.level
-            self.overlay.update_level(level)
-            # Feed level to cadence tracker
+            nonlocal seq
+            self.overlay.update_level(self.recorder.level)
+            # Feed the cadence tracker every block metered since the last tick
+            seq, frames = self.recorder.meter_since(seq)
             if self._cadence_tracker is not None:
-                self._cadence_tracker.update(level)
+                for level in frames[:, LEVEL].tolist():
+                    self._cadence_tracker.update(level)
 
         self._level_timer = Cocoa.NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
             1.0 / 30, True, update_level
@@ -331,6 +567,27 @@ class MuttRApp:
             self._level_timer.invalidate()
             self._level_timer = None
 
+    def _insert_on_main(self, text, trace):
+        """Insert *text* on the main thread and wait for it to finish.
+
+        The "insert" span is timed on the main thread, so it measures the
+        paste itself rather than the dispatch.
+        """
+        from muttr.inserter import insert_text
+
+        done = threading.Event()
+
+        def _insert():
+            try:
+                with trace.span("insert", suppress=True):
+                    insert_text(text)
+            finally:
+                done.set()
+
+        self._perform_on_main(_insert)
+        if not done.wait(_INSERT_TIMEOUT_S):
+            print("MuttR: Text insertion is taking longer than expected")
+
     def _perform_on_main(self, func):
         """Run a function on the main thread."""
         Cocoa.NSOperationQueue.mainQueue().addOperationWithBlock_(func)
@@ -0,0 +1,241 @@
+"""Pipeline benchmark: per-stage latency percentiles, RTF, peak RSS and throughput.
+
+Runs each utterance through the same stages as a dictation -- context
+building, transcription, cleanup and a history write -- and reports
+p50/p95/p99 latency per stage.  Audio comes from a directory of 16 kHz mono
+16-bit WAV files, or synthetic tone bursts when none is given.  History
+writes go to a throwaway database, never the user's.
+
+    python -m muttr.bench --corpus path/to/wavs --repeat 3 --output bench.json
+
+Save JSON results per commit and diff them to catch regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+from muttr.transcriber import DEFAULT_DECODE_PROFILE, DEFAULT_MODEL, SAMPLE_RATE
+
+STAGES = ("context", "transcribe", "cleanup", "history")
+
+# Used for the text stages when transcription is skipped or returns nothing
+# (e.g. on synthetic audio), so cleanup/history still see realistic input.
+SAMPLE_TEXTS = (
+    "um so I was thinking we should uh move the meeting to Thursday",
+    "hey can you send me the the latest version of the deck before lunch",
+    "new paragraph the quarterly numbers look good but we need to cut costs",
+    "bullet point check the logs bullet point restart the server",
+    "I mean like the API is fine it's just the uh the latency that's bad",
+)
+
+
+def load_wav_corpus(directory):
+    """Return [(name, float32 audio)] for every 16 kHz mono 16-bit WAV in *directory*."""
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        if not name.lower().endswith(".wav"):
+            continue
+        with wave.open(os.path.join(directory, name), "rb") as wav:
+            if (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) != (SAMPLE_RATE, 1, 2):
+                print(f"skipping {name}: expected 16 kHz mono 16-bit PCM", file=sys.stderr)
+                continue
+            pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+        corpus.append((name, pcm.astype(np.float32) / 32768.0))
+    return corpus
+
+
+def synthetic_corpus(durations=(2.0, 5.0, 10.0)):
+    """Return tone bursts separated by pauses, one per duration in seconds."""
+    rng = np.random.default_rng(0)
+    corpus = []
+    for seconds in durations:
+        n = int(seconds * SAMPLE_RATE)
+        t = np.arange(n) / SAMPLE_RATE
+        envelope = (np.sin(2 * np.pi * 0.5 * t) > -0.3).astype(np.float32)
+        audio = 0.1 * np.sin(2 * np.pi * 220 * t) * envelope
+        audio += rng.standard_normal(n) * 0.005
+        corpus.append((f"synthetic-{seconds:g}s", audio.astype(np.float32)))
+    return corpus
+
+
+def percentiles(samples):
+    """Return count, mean and p50/p95/p99 of *samples* (seconds) in milliseconds."""
+    if not samples:
+        return {"count": 0}
+    ms = np.asarray(samples) * 1000.0
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {
+        "count": len(samples),
+        "mean_ms": round(float(ms.mean()), 3),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+    }
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux.
+    return round(peak / (1 << 20) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (subprocess.SubprocessError, OSError):
+        return None
+
+
+def _timed(timings, stage, fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    timings[stage].append(time.perf_counter() - started)
+    return result
+
+
+def run(corpus, model_size=DEFAULT_MODEL, profile=DEFAULT_DECODE_PROFILE,
+        cleanup_level=1, repeat=1, transcribe=True):
+    """Benchmark every utterance in *corpus* *repeat* times and return a report dict."""
+    from muttr import history
+    from muttr.cleanup import clean_text
+    from muttr.context import build_context_prompt
+
+    transcriber = None
+    load_s = None
+    if transcribe:
+        from muttr.transcriber import create_transcriber
+
+        # Uncached, so repeated utterances are really decoded and RTF stays honest.
+        transcriber = create_transcriber(model_size=model_size, profile=profile, cache=False)
+        started = time.perf_counter()
+        transcriber.load()
+        load_s = time.perf_counter() - started
+        # Warm-up so the first measured decode is not paying for lazy init.
+        transcriber.transcribe(corpus[0][1])
+
+    timings = {stage: [] for stage in STAGES}
+    audio_s = 0.0
+    tmpdir = tempfile.mkdtemp(prefix="muttr-bench-")
+    saved_paths = (history.DB_PATH, history.APP_SUPPORT_DIR)
+    history.DB_PATH = os.path.join(tmpdir, "history.db")
+    history.APP_SUPPORT_DIR = tmpdir
+    started = time.perf_counter()
+    try:
+        for i in range(repeat):
+            for j, (_, audio) in enumerate(corpus):
+                audio_s += len(audio) / SAMPLE_RATE
+                prompt = _timed(timings, "context", build_context_prompt)
+                text = ""
+                if transcriber is not None:
+                    text = _timed(timings, "transcribe", transcriber.transcribe,
+                                  audio, initial_prompt=prompt)
+                if not text:
+                    text = SAMPLE_TEXTS[(i * len(corpus) + j) % len(SAMPLE_TEXTS)]
+                cleaned = _timed(timings, "cleanup", clean_text, text, level=cleanup_level)
+                _timed(timings, "history", history.add_entry, text, cleaned,
+                       duration_s=len(audio) / SAMPLE_RATE)
+    finally:
+        wall_s = time.perf_counter() - started
+        history.close()
+        history.DB_PATH, history.APP_SUPPORT_DIR = saved_paths
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    utterances = repeat * len(corpus)
+    transcribe_s = sum(timings["transcribe"])
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "model": model_size if transcribe else None,
+            "profile": profile if transcribe else None,
+            "cleanup_level": cleanup_level,
+            "utterances": utterances,
+        },
+        "stages": {stage: percentiles(samples) for stage, samples in timings.items()},
+        "model_load_s": round(load_s, 3) if load_s is not None else None,
+        "rtf": round(transcribe_s / audio_s, 4) if transcriber is not None and audio_s else None,
+        "audio_s": round(audio_s, 2),
+        "wall_s": round(wall_s, 3),
+        "throughput": {
+            "utterances_per_s": round(utterances / wall_s, 2) if wall_s else None,
+            "audio_s_per_s": round(audio_s / wall_s, 2) if wall_s else None,
+        },
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def format_report(report):
+    lines = [f"{'stage':<11} {'n':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+    for stage, stats in report["stages"].items():
+        if not stats["count"]:
+            lines.append(f"{stage:<11} {'-':>5}")
+            continue
+        lines.append(
+            f"{stage:<11} {stats['count']:>5} {stats['p50_ms']:>9.2f} "
+            f"{stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f}"
+        )
+    if report["rtf"] is not None:
+        lines.append(f"RTF: {report['rtf']:.4f} (model load {report['model_load_s']:.2f}s)")
+    tput = report["throughput"]
+    lines.append(
+        f"Throughput: {tput['utterances_per_s']} utterances/s, "
+        f"{tput['audio_s_per_s']} audio s/s"
+    )
+    lines.append(f"Peak RSS: {report['peak_rss_mb']} MB")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m muttr.bench", description=__doc__.splitlines()[0],
+    )
+    parser.add_argument("--corpus", help="directory of 16 kHz mono WAV files "
+                        "(default: synthetic audio)")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--profile", default=DEFAULT_DECODE_PROFILE)
+    parser.add_argument("--cleanup-level", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-transcribe", action="store_true",
+                        help="skip Whisper and time only the text stages")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    corpus = load_wav_corpus(args.corpus) if args.corpus else synthetic_corpus()
+    if not corpus:
+        parser.error(f"no usable WAV files in {args.corpus}")
+
+    report = run(
+        corpus,
+        model_size=args.model,
+        profile=args.profile,
+        cleanup_level=args.cleanup_level,
+        repeat=args.repeat,
+        transcribe=not args.no_transcribe,
+    )
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()
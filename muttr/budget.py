@@ -2,6 +2,7 @@
 
 import os
 import sqlite3
+import threading
 from datetime import date, timedelta
 
 from muttr.config import APP_SUPPORT_DIR
@@ -28,64 +29,92 @@ def _connect():
     return conn
 
 
-def record_usage(word_count: int) -> None:
-    """Record words used in a transcription."""
-    today = date.today().isoformat()
+# In-memory copy of word_usage for the rollover window, loaded with one
+# range query and kept current by record_usage(), so budget checks on the
+# dictation path and in the menu never touch SQLite.
+_ledger_lock = threading.Lock()
+_ledger = {"path": None, "day": None, "usage": None}
+
+
+def _load_window(today: date) -> dict[str, int]:
+    """Return {iso date: words used} for today and the rollover window."""
+    first = (today - timedelta(days=ROLLOVER_DAYS)).isoformat()
     conn = _connect()
     try:
-        conn.execute(
-            "INSERT INTO word_usage (date, words_used) VALUES (?, ?)"
-            " ON CONFLICT(date) DO UPDATE SET words_used = words_used + ?",
-            (today, word_count, word_count),
-        )
-        conn.commit()
+        rows = conn.execute(
+            "SELECT date, words_used FROM word_usage WHERE date BETWEEN ? AND ?",
+            (first, today.isoformat()),
+        ).fetchall()
     finally:
         conn.close()
+    return {row["date"]: row["words_used"] for row in rows}
+
+
+def _usage_window() -> dict[str, int]:
+    """The ledger for today, reloaded when DB_PATH or the date changes."""
+    today = date.today()
+    with _ledger_lock:
+        if _ledger["path"] != DB_PATH or _ledger["day"] != today:
+            _ledger.update(path=DB_PATH, day=today, usage=_load_window(today))
+        return _ledger["usage"]
+
+
+def _reset_ledger() -> None:
+    """Forget the in-memory ledger. Useful for tests."""
+    with _ledger_lock:
+        _ledger.update(path=None, day=None, usage=None)
+
+
+def record_usage(word_count: int) -> None:
+    """Record words used in a transcription."""
+    today = date.today().isoformat()
+    # Under the ledger lock so a concurrent ledger load cannot count it twice.
+    with _ledger_lock:
+        conn = _connect()
+        try:
+            conn.execute(
+                "INSERT INTO word_usage (date, words_used) VALUES (?, ?)"
+                " ON CONFLICT(date) DO UPDATE SET words_used = words_used + ?",
+                (today, word_count, word_count),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        if _ledger["path"] == DB_PATH and _ledger["usage"] is not None:
+            usage = _ledger["usage"]
+            usage[today] = usage.get(today, 0) + word_count
 
 
 def _get_usage(day: str) -> int:
-    """Get word usage for a specific day."""
-    conn = _connect()
-    try:
-        row = conn.execute(
-            "SELECT words_used FROM word_usage WHERE date = ?", (day,)
-        ).fetchone()
-        return row["words_used"] if row else 0
-    finally:
-        conn.close()
+    """Get word usage for a day in the rollover window."""
+    return _usage_window().get(day, 0)
 
 
 def _has_record(day: str) -> bool:
-    """Return True if there is a usage record for this day."""
-    conn = _connect()
-    try:
-        row = conn.execute(
-            "SELECT 1 FROM word_usage WHERE date = ?", (day,)
-        ).fetchone()
-        return row is not None
-    finally:
-        conn.close()
+    """Return True if there is a usage record for this day (within the window)."""
+    return day in _usage_window()
 
 
-def _get_rollover_budget() -> int:
+def _get_rollover_budget(daily_limit: int | None = None) -> int:
     """Calculate rollover words from unused budget in the past 7 days.
 
     Only counts days that have a usage record — days before the app was
-    installed don't contribute rollover.
+    installed don't contribute rollover.  Pass *daily_limit* when the
+    caller already has it, to skip the license lookup.
     """
-    daily_limit = license.get_daily_word_limit()
+    if daily_limit is None:
+        daily_limit = license.get_daily_word_limit()
     if daily_limit is None:
         return 0  # unlimited tier, no rollover needed
 
+    usage = _usage_window()
     today = date.today()
     rollover = 0
     for i in range(1, ROLLOVER_DAYS + 1):
-        day = (today - timedelta(days=i)).isoformat()
-        if not _has_record(day):
+        used = usage.get((today - timedelta(days=i)).isoformat())
+        if used is None:
             continue  # no record = app wasn't used that day
-        used = _get_usage(day)
-        unused = max(0, daily_limit - used)
-        rollover += unused
+        rollover += max(0, daily_limit - used)
 
     return rollover
 
@@ -97,7 +126,7 @@ def words_remaining_today() -> int | None:
         return None  # unlimited
 
     today_used = _get_usage(date.today().isoformat())
-    rollover = _get_rollover_budget()
+    rollover = _get_rollover_budget(daily_limit)
     total_budget = daily_limit + rollover
     remaining = total_budget - today_used
     return max(0, remaining)
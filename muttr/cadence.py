@@ -145,6 +145,21 @@ def get_auto_stop_ms() -> int:
     return max(_FLOOR_MS, min(_CEILING_MS, int(raw)))
 
 
+def frame_rms(audio: np.ndarray, frame_len: int) -> np.ndarray:
+    """Return the RMS of each complete *frame_len*-sample frame of *audio*.
+
+    This is the same energy measure as ``SpeechMetrics.analyze``, computed
+    for every frame at once.  Compare against ``RMS_FLOOR`` to find pauses.
+    """
+    n_frames = len(audio) // frame_len
+    frames = audio[:n_frames * frame_len].reshape(n_frames, frame_len)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+
+
+# Public alias of the pause floor for frame-level silence detection.
+RMS_FLOOR = _RMS_FLOOR
+
+
 class CadenceTracker:
     """Tracks intra-speech pauses during a recording session.
 
@@ -5,10 +5,26 @@ Slider levels:
                   paragraph/line-break commands, proper noun capitalization
     1  Moderate - all Light + filler word removal + list formatting
     2  Aggressive - all Moderate + false-start removal + stronger punctuation smoothing
+
+The word-level stages (proper nouns, whitespace, repeated words, fillers,
+false starts) share one token stream: the text is split into words and the
+separators between them once, and each stage walks that list.  Proper nouns
+and fillers are found through word tries keyed on lowercase words, so a
+stage only looks at the words that can start a match.  The structural
+stages (paragraph commands, lists, punctuation) stay regex passes over the
+text and are skipped with a plain substring check when their trigger words
+do not occur.
 """
 
+import itertools
+import multiprocessing
+import operator
+import os
 import re
-from typing import Optional
+import sys
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional
 
 # ---------------------------------------------------------------------------
 # Proper-noun dictionaries (users can extend CUSTOM_PROPER_NOUNS)
@@ -204,8 +220,145 @@ CUSTOM_PROPER_NOUNS: dict[str, str] = {}
 _PROPER_NOUN_MAP: dict[str, str] = {}
 
 
+# ---------------------------------------------------------------------------
+# Token stream
+# ---------------------------------------------------------------------------
+
+# Splitting on a capturing \w+ pattern alternates separators and words:
+# parts[0::2] are the separators (the first and last may be empty) and
+# parts[1::2] the words, so word k is parts[2 * k + 1] with parts[2 * k]
+# before it and parts[2 * k + 2] after it.  Word edges are exactly where
+# the regex \b falls, which is what lets the stages below reproduce the
+# regex passes they replaced.
+_WORD_SPLIT = re.compile(r"(\w+)")
+
+# re.IGNORECASE also matches these non-ASCII characters against ASCII
+# letters; fold them before lower() so lookups and keyword pre-checks
+# treat them the way the patterns would.
+_IGNORECASE_EXTRA = str.maketrans({
+    "\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k",
+})
+
+# Trie key marking the end of a phrase
+_END = None
+
+
+def _folded(text: str) -> str:
+    """Lowercase *text* for substring pre-checks against stage keywords."""
+    return text.translate(_IGNORECASE_EXTRA).lower()
+
+
+def _tokenize(text: str) -> list[str]:
+    return _WORD_SPLIT.split(text)
+
+
+def _folded_words(parts: list[str]) -> list[str]:
+    """Return the words of *parts* case-folded, as re.IGNORECASE sees them."""
+    words = parts[1::2]
+    fold = str.lower if "".join(words).isascii() else _folded
+    return list(map(fold, words))
+
+
+def _indexes(flags: Iterable[bool], start: int = 0) -> list[int]:
+    """Return the positions (counted from *start*) of true *flags*."""
+    return list(itertools.compress(itertools.count(start), flags))
+
+
+def _phrase_trie(phrases: dict[str, object]) -> dict:
+    """Nest *phrases* into a trie of folded words and exact separators.
+
+    ``{"new york": v}`` becomes ``{"new": {" ": {"york": {_END: v}}}}``.
+    Phrases that do not start and end with a word character cannot match
+    whole words and are left out.
+    """
+    trie: dict = {}
+    for phrase, value in phrases.items():
+        parts = _tokenize(phrase)
+        if len(parts) < 3 or parts[0] or parts[-1]:
+            continue
+        node = trie
+        for i, part in enumerate(parts[1:-1]):
+            node = node.setdefault(_folded(part) if i % 2 == 0 else part, {})
+        node[_END] = value
+    return trie
+
+
+def _match_phrase(trie: dict, parts: list[str], low: list[str], k: int):
+    """Return ``(last word, value)`` for the longest phrase at word *k*, or None."""
+    node = trie.get(low[k])
+    match = None
+    last = len(low) - 1
+    while node is not None:
+        if _END in node:
+            match = (k, node[_END])
+        if k == last:
+            break
+        node = node.get(parts[2 * k + 2])
+        if node is None:
+            break
+        k += 1
+        node = node.get(low[k])
+    return match
+
+
+_SAME_WORD = re.compile(r"(\w+) \1", re.IGNORECASE)
+_GAP_TAIL = re.compile(r",?\s*\Z")
+_GAP_HEAD = re.compile(r"\s*,?\s*")
+
+
+def _same_word(a: str, b: str) -> bool:
+    """True if *b* repeats *a* as an IGNORECASE backreference compares them."""
+    if a.isascii() and b.isascii():
+        return a.lower() == b.lower()
+    return _SAME_WORD.fullmatch(a + " " + b) is not None
+
+
+def _cut_words(parts: list[str], spans: list[tuple[int, int]]) -> list[str]:
+    """Replace each ``(first, last)`` word span with a single space.
+
+    Matches ``re.sub(r",?\\s*<span>\\s*,?\\s*", " ", text)``: a comma and
+    whitespace before the span and whitespace, a comma and whitespace after
+    it go with it, except text an earlier cut already replaced.  *spans*
+    must be in order and must not overlap.
+    """
+    out: list[str] = []
+    pos = 0   # next index of parts to copy
+    keep = 0  # leading characters of out[-1] a cut must leave alone
+    for first, last in spans:
+        before = 2 * first
+        if pos <= before:
+            out.extend(parts[pos:before + 1])
+            keep = 0
+        # else the previous cut ended at the word before and out[-1] is the
+        # separator it left behind
+        gap = out[-1]
+        head = gap[:_GAP_TAIL.search(gap, keep).start()] + " "
+        after = parts[2 * last + 2]
+        out[-1] = head + after[_GAP_HEAD.match(after).end():]
+        keep = len(head)
+        pos = 2 * last + 3
+    out.extend(parts[pos:])
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Proper-noun matching
+# ---------------------------------------------------------------------------
+
+# Nouns without a space, looked up by the whole word they would be written
+# as: letters, optionally joined by hyphens or apostrophes ("wi-fi").
+_SINGLE_NOUNS: dict[str, str] = {}
+# Multi-word nouns (like "New York"), matched as whole words.
+_MULTI_WORD_TRIE: dict = {}
+# Folded first word of every noun; no other word can start a match.
+_NOUN_STARTS: frozenset = frozenset()
+# Dictionary values split into tokens, filled as nouns are written.
+_NOUN_VALUE_PARTS: dict[str, list[str]] = {}
+
+
 def _rebuild_proper_noun_map() -> None:
     """Rebuild the internal lookup from all source lists."""
+    global _MULTI_WORD_TRIE, _NOUN_STARTS
     _PROPER_NOUN_MAP.clear()
     for name in DAYS_OF_WEEK + MONTHS + COMMON_FIRST_NAMES:
         _PROPER_NOUN_MAP[name.lower()] = name
@@ -214,6 +367,16 @@ def _rebuild_proper_noun_map() -> None:
     _PROPER_NOUN_MAP.update(BRAND_NAMES)
     _PROPER_NOUN_MAP.update({k.lower(): v for k, v in CUSTOM_PROPER_NOUNS.items()})
 
+    _NOUN_VALUE_PARTS.clear()
+    _SINGLE_NOUNS.clear()
+    _SINGLE_NOUNS.update({k: v for k, v in _PROPER_NOUN_MAP.items() if " " not in k})
+    _MULTI_WORD_TRIE = _phrase_trie(
+        {k: v for k, v in _PROPER_NOUN_MAP.items() if " " in k}
+    )
+    _NOUN_STARTS = frozenset(
+        _folded(parts[1]) for parts in map(_tokenize, _PROPER_NOUN_MAP) if len(parts) > 1
+    )
+
 
 _rebuild_proper_noun_map()
 
@@ -241,24 +404,27 @@ FILLER_WORDS = [
     r"\bkind of\b",
 ]
 
+# The filler stage matches FILLER_WORDS on the token stream; this is the
+# equivalent pattern over text.
 FILLER_PATTERN = re.compile(
     r",?\s*(?:" + "|".join(FILLER_WORDS) + r")\s*,?\s*",
     re.IGNORECASE,
 )
 
+_FILLER_TRIE = _phrase_trie({w.replace(r"\b", ""): True for w in FILLER_WORDS})
+
 # "like" needs context-aware handling: filler ("I was like going") vs
 # comparison ("looks like a cat") vs verb ("I like pizza").
-# Strategy: protect known non-filler patterns, strip the rest, restore.
-_LIKE_PROTECT = re.compile(
-    r"\b(looks?|looking|feels?|felt|feeling|seems?|seemed|seeming"
-    r"|sounds?|sounded|sounding|smells?|smelled|tastes?|tasted"
-    r"|just|more|much"
-    r"|something|anything|nothing|everything"
-    r"|[Ii]|you|we|they|he|she|it)\s+(like)\b",
-    re.IGNORECASE,
-)
-_LIKE_FILLER = re.compile(r",?\s*\blike\b\s*,?\s*", re.IGNORECASE)
-_LIKE_SENTINEL = "\x00COMP\x00"
+# Strategy: keep "like" after these words (whitespace between), strip the rest.
+_LIKE_KEEPERS = frozenset({
+    "look", "looks", "looking", "feel", "feels", "felt", "feeling",
+    "seem", "seems", "seemed", "seeming",
+    "sound", "sounds", "sounded", "sounding", "smell", "smells", "smelled",
+    "taste", "tastes", "tasted",
+    "just", "more", "much",
+    "something", "anything", "nothing", "everything",
+    "i", "you", "we", "they", "he", "she", "it",
+})
 
 # ---------------------------------------------------------------------------
 # Paragraph / line-break commands
@@ -345,6 +511,7 @@ _ORDINAL_ITEM = re.compile(
 _DIGIT_DOT_ITEM = re.compile(
     r"\s*(\d{1,2})\s*[.)]\s*",
 )
+_ANY_DIGIT = re.compile(r"\d")
 
 # "one) text" patterns
 _CARDINAL_PAREN_ITEM = re.compile(
@@ -357,28 +524,77 @@ _CARDINAL_PAREN_ITEM = re.compile(
 # Proper-noun capitalization
 # ---------------------------------------------------------------------------
 
-# We match "word" tokens to check against the map.  Multi-word proper nouns
-# (like "New York") need separate handling.
-_MULTI_WORD_NOUNS = {k: v for k, v in _PROPER_NOUN_MAP.items() if " " in k}
-_SINGLE_WORD_RE = re.compile(r"\b[A-Za-z][A-Za-z'-]*\b")
+def _is_letters(word: str) -> bool:
+    return word.isascii() and word.isalpha()
 
 
-def _capitalize_proper_nouns(text: str) -> str:
-    """Replace known proper nouns with their correct casing."""
-    # Multi-word nouns first (greedy, longest match first)
-    for lc, correct in sorted(_MULTI_WORD_NOUNS.items(), key=lambda x: -len(x[0])):
-        pattern = re.compile(re.escape(lc), re.IGNORECASE)
-        text = pattern.sub(correct, text)
+def _is_joiner(sep: str) -> bool:
+    """True for a separator that joins letters into one word ("-", "'")."""
+    return bool(sep) and not sep.strip("-'")
 
-    def _replace_single(m: re.Match) -> str:
-        word = m.group(0)
-        lc = word.lower()
-        if lc in _PROPER_NOUN_MAP and lc not in _MULTI_WORD_NOUNS:
-            return _PROPER_NOUN_MAP[lc]
-        return word
 
-    text = _SINGLE_WORD_RE.sub(_replace_single, text)
-    return text
+def _put_phrase(parts: list[str], first: int, last: int, value: str) -> bool:
+    """Write *value* over words *first*..*last*; True if re-tokenizing is needed."""
+    span = parts[2 * first + 1:2 * last + 2]
+    new = _NOUN_VALUE_PARTS.get(value)
+    if new is None:
+        new = _NOUN_VALUE_PARTS[value] = _tokenize(value)
+    if not new[0] and not new[-1] and new[2:-2:2] == span[1::2]:
+        parts[2 * first + 1:2 * last + 2:2] = new[1:-1:2]
+        return False
+    parts[2 * first + 1:2 * last + 2] = [value] + [""] * (len(span) - 1)
+    return True
+
+
+def _capitalize_proper_nouns(parts: list[str]) -> list[str]:
+    """Replace known proper nouns with their correct casing.
+
+    Multi-word nouns match whole words separated as in the dictionary, the
+    longest first.  Other nouns match the whole word as written: letters
+    joined by hyphens or apostrophes, so "wi-fi" matches while the "john"
+    in "john's" or "mary-john" does not.
+    """
+    low = _folded_words(parts)
+    starts = _indexes(map(_NOUN_STARTS.__contains__, low))
+    if not starts:
+        return parts
+    last_word = len(low) - 1
+    retokenize = False
+    done = -1
+    for k in starts:
+        if k <= done:
+            continue
+        match = _match_phrase(_MULTI_WORD_TRIE, parts, low, k)
+        if match is not None:
+            done, value = match
+            retokenize |= _put_phrase(parts, k, done, value)
+            continue
+
+        if not _is_letters(parts[2 * k + 1]) or (
+            k > 0 and _is_joiner(parts[2 * k]) and _is_letters(parts[2 * k - 1])
+        ):
+            continue  # not a word start, or inside a joined word
+        end, tail = k, ""
+        while end < last_word and _is_joiner(parts[2 * end + 2]):
+            if not _is_letters(parts[2 * end + 3]):
+                # "x-3" reads as the word "x-"
+                tail = parts[2 * end + 2]
+                break
+            end += 1
+        if end == k and not tail:
+            value = _SINGLE_NOUNS.get(low[k])
+        else:
+            value = _SINGLE_NOUNS.get("".join(parts[2 * k + 1:2 * end + 2]).lower() + tail)
+        if value is None:
+            continue
+        if tail:
+            parts[2 * end + 2] = ""  # replaced along with the word
+            retokenize = True
+        retokenize |= _put_phrase(parts, k, end, value)
+        done = end
+    if retokenize:
+        parts = _tokenize("".join(parts))
+    return parts
 
 
 # ---------------------------------------------------------------------------
@@ -387,19 +603,22 @@ def _capitalize_proper_nouns(text: str) -> str:
 
 def _has_bullet_markers(text: str) -> bool:
     """Return True if text contains at least 2 spoken bullet-list markers."""
-    bullet_count = len(_BULLET_ITEM.findall(text))
-    dash_count = len(_DASH_ITEM.findall(text))
-    return bullet_count >= 2 or dash_count >= 2
+    lowered = _folded(text)
+    if "bullet" in lowered and len(_BULLET_ITEM.findall(text)) >= 2:
+        return True
+    return "dash" in lowered and len(_DASH_ITEM.findall(text)) >= 2
 
 
 def _has_numbered_markers(text: str) -> bool:
     """Return True if text contains spoken numbered-list markers."""
+    lowered = _folded(text)
+    has_number = "number" in lowered
     return bool(
-        _NUMBER_WORD_ITEM.search(text)
-        or _NUMBER_DIGIT_ITEM.search(text)
-        or _ORDINAL_ITEM.search(text)
-        or _DIGIT_DOT_ITEM.search(text)
-        or _CARDINAL_PAREN_ITEM.search(text)
+        (has_number and _NUMBER_WORD_ITEM.search(text))
+        or (has_number and _NUMBER_DIGIT_ITEM.search(text))
+        or (any(o in lowered for o in _ORDINAL_MAP) and _ORDINAL_ITEM.search(text))
+        or (_ANY_DIGIT.search(text) and _DIGIT_DOT_ITEM.search(text))
+        or (")" in text and _CARDINAL_PAREN_ITEM.search(text))
     )
 
 
@@ -555,9 +774,13 @@ def _format_numbered_list(text: str) -> str:
 
 def _process_paragraph_commands(text: str) -> str:
     """Replace spoken paragraph/line commands with actual whitespace."""
-    text = _PERIOD_NEW_PARA.sub(".\n\n", text)
-    text = _NEW_PARAGRAPH.sub("\n\n", text)
-    text = _NEW_LINE.sub("\n", text)
+    lowered = _folded(text)
+    if "paragraph" in lowered:
+        if "period" in lowered:
+            text = _PERIOD_NEW_PARA.sub(".\n\n", text)
+        text = _NEW_PARAGRAPH.sub("\n\n", text)
+    if "line" in lowered:
+        text = _NEW_LINE.sub("\n", text)
     return text
 
 
@@ -565,36 +788,169 @@ def _process_paragraph_commands(text: str) -> str:
 # Core cleanup stages
 # ---------------------------------------------------------------------------
 
+_HORIZONTAL_WS = re.compile(r"[ \t]+")
+_EXCESS_BLANK_LINES = re.compile(r"\n{3,}")
+_SENTENCE_BREAK = re.compile(r"([.!?])\s+([a-z])")
+_NUMBERED_LINE = re.compile(r"^\d+\.\s")
+_MULTI_PERIOD = re.compile(r"\.{2,}")
+_SPACE_BEFORE_PUNCT = re.compile(r"\s+([.!?,;:])")
+_MISSING_SPACE_AFTER = re.compile(r"([.!?])([A-Z])")
+
+
 def _normalize_whitespace(text: str) -> str:
     """Collapse runs of spaces (but preserve explicit newlines)."""
-    lines = text.split("\n")
-    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in lines]
+    text = _HORIZONTAL_WS.sub(" ", text)
+    result = "\n".join(line.strip() for line in text.split("\n"))
     # Collapse more than 2 consecutive blank lines to 2
-    result = "\n".join(lines)
-    result = re.sub(r"\n{3,}", "\n\n", result)
+    result = _EXCESS_BLANK_LINES.sub("\n\n", result)
     return result.strip()
 
 
-def _remove_repeated_words(text: str) -> str:
-    """Collapse immediate repeated words: 'the the' -> 'the'."""
-    return re.sub(r"\b(\w+)(\s+\1)+\b", r"\1", text, flags=re.IGNORECASE)
+# Dictations repeat a handful of separators, so the per-separator rewrites
+# below are cached (up to _SEPARATOR_CACHE_SIZE entries each).
+_SEPARATOR_CACHE_SIZE = 1024
+_normalized_separators: dict[str, str] = {}
+
 
+def _normalize_separators(parts: list[str]) -> list[str]:
+    """_normalize_whitespace() on a token stream.
 
-def _remove_false_starts(text: str) -> str:
-    """Remove repeated short phrases: 'I was I was going' -> 'I was going'."""
-    return re.sub(
-        r"\b(\w+(?:\s+\w+)?)\s+\1\b", r"\1", text, flags=re.IGNORECASE
+    Every change it makes falls inside one separator, so each is normalized
+    on its own between placeholder words.
+    """
+    if len(parts) == 1:
+        return [_normalize_whitespace(parts[0])]
+    inner = parts[2:-1:2]
+    normalized = {}
+    for sep in set(inner):
+        norm = _normalized_separators.get(sep)
+        if norm is None:
+            norm = _normalize_whitespace("x" + sep + "x")[1:-1]
+            if len(_normalized_separators) < _SEPARATOR_CACHE_SIZE:
+                _normalized_separators[sep] = norm
+        normalized[sep] = norm
+    parts[2:-1:2] = map(normalized.__getitem__, inner)
+    parts[0] = _normalize_whitespace(parts[0] + "x")[:-1]
+    parts[-1] = _normalize_whitespace("x" + parts[-1])[1:]
+    return parts
+
+
+def _remove_repeated_words(parts: list[str]) -> list[str]:
+    """Collapse immediate repeated words: 'the the' -> 'the'.
+
+    A word repeated, ignoring case, after nothing but whitespace is dropped
+    along with that whitespace; the first occurrence is kept.
+    """
+    low = _folded_words(parts)
+    repeats = _indexes(map(operator.eq, low, low[1:]), 1)
+    if not repeats:
+        return parts
+    out: list[str] = []
+    pos = 0
+    done = -1
+    for k in repeats:
+        first = k - 1
+        if first <= done:
+            continue
+        word = parts[2 * first + 1]
+        end = first
+        while (
+            end + 1 < len(low)
+            and low[end + 1] == low[first]
+            and parts[2 * end + 2].isspace()
+            and _same_word(word, parts[2 * end + 3])
+        ):
+            end += 1
+        if end == first:
+            continue
+        out.extend(parts[pos:2 * first + 2])
+        pos = 2 * end + 2
+        done = end
+    if not out:
+        return parts
+    out.extend(parts[pos:])
+    return out
+
+
+def _remove_false_starts(parts: list[str]) -> list[str]:
+    """Remove repeated short phrases: 'I was I was going' -> 'I was going'.
+
+    A one- or two-word phrase repeated straight after itself (ignoring case,
+    whitespace between, the same spacing inside) keeps its first copy; the
+    two-word reading is tried first.
+    """
+    low = _folded_words(parts)
+    n = len(low)
+    starts = set(_indexes(map(operator.eq, low, low[1:])))
+    starts.update(
+        k for k in _indexes(map(operator.eq, low, low[2:]))
+        if k + 3 < n and low[k + 1] == low[k + 3]
     )
+    if not starts:
+        return parts
+    out: list[str] = []
+    pos = 0
+    done = -1
+    for k in sorted(starts):
+        if k <= done or not parts[2 * k + 2].isspace():
+            continue
+        if (
+            k + 3 < n
+            and parts[2 * k + 4].isspace()
+            and parts[2 * k + 6] == parts[2 * k + 2]
+            and low[k] == low[k + 2] and low[k + 1] == low[k + 3]
+            and _same_word(parts[2 * k + 1], parts[2 * k + 5])
+            and _same_word(parts[2 * k + 3], parts[2 * k + 7])
+        ):
+            keep, end = k + 1, k + 3
+        elif low[k] == low[k + 1] and _same_word(parts[2 * k + 1], parts[2 * k + 3]):
+            keep, end = k, k + 1
+        else:
+            continue
+        out.extend(parts[pos:2 * keep + 2])
+        pos = 2 * end + 2
+        done = end
+    if not out:
+        return parts
+    out.extend(parts[pos:])
+    return out
 
 
-def _remove_fillers(text: str) -> str:
-    """Strip filler words with surrounding punctuation/whitespace."""
-    text = FILLER_PATTERN.sub(" ", text)
-    # Context-aware "like" removal: protect comparison/verb uses, strip filler.
-    text = _LIKE_PROTECT.sub(lambda m: m.group(1) + " " + _LIKE_SENTINEL, text)
-    text = _LIKE_FILLER.sub(" ", text)
-    text = text.replace(_LIKE_SENTINEL, "like")
-    return text
+def _remove_fillers(parts: list[str]) -> list[str]:
+    """Strip filler words with surrounding punctuation/whitespace.
+
+    Each filler, with a comma and whitespace on either side, becomes one
+    space.  "like" is then dropped the same way unless it follows one of
+    _LIKE_KEEPERS across whitespace, where it is kept as " like".
+    """
+    low = _folded_words(parts)
+    if not _FILLER_TRIE.keys().isdisjoint(low):
+        spans = []
+        done = -1
+        for k in _indexes(map(_FILLER_TRIE.__contains__, low)):
+            if k > done:
+                match = _match_phrase(_FILLER_TRIE, parts, low, k)
+                if match is not None:
+                    done = match[0]
+                    spans.append((k, done))
+        if spans:
+            parts = _cut_words(parts, spans)
+            low = _folded_words(parts)
+    if "like" not in low:
+        return parts
+
+    spans = []
+    for k in _indexes(map("like".__eq__, low)):
+        if k > 0 and low[k - 1] in _LIKE_KEEPERS and parts[2 * k].isspace():
+            parts[2 * k] = " "
+            parts[2 * k + 1] = "like"
+        else:
+            spans.append((k, k))
+    return _cut_words(parts, spans)
+
+
+def _cap_after_break(m: re.Match) -> str:
+    return m.group(1) + " " + m.group(2).upper()
 
 
 def _sentence_case(text: str) -> str:
@@ -602,15 +958,6 @@ def _sentence_case(text: str) -> str:
     if not text:
         return text
 
-    def _cap_after_break(t: str) -> str:
-        # Capitalize after sentence-ending punctuation
-        result = re.sub(
-            r'([.!?])\s+([a-z])',
-            lambda m: m.group(1) + " " + m.group(2).upper(),
-            t,
-        )
-        return result
-
     # Capitalize first character of each paragraph
     lines = text.split("\n")
     processed = []
@@ -618,7 +965,8 @@ def _sentence_case(text: str) -> str:
         line = line.strip()
         if line:
             line = line[0].upper() + line[1:]
-            line = _cap_after_break(line)
+            # Capitalize after sentence-ending punctuation
+            line = _SENTENCE_BREAK.sub(_cap_after_break, line)
         processed.append(line)
 
     return "\n".join(processed)
@@ -636,7 +984,7 @@ def _ensure_terminal_punctuation(text: str) -> str:
         if stripped and stripped.startswith(("- ", "* ")):
             # Don't force punctuation on bullet items
             processed.append(stripped)
-        elif stripped and re.match(r"^\d+\.\s", stripped):
+        elif stripped and _NUMBERED_LINE.match(stripped):
             # Don't force punctuation on numbered list items
             processed.append(stripped)
         elif stripped and stripped[-1] not in ".!?":
@@ -649,17 +997,42 @@ def _ensure_terminal_punctuation(text: str) -> str:
 def _stronger_punctuation_smoothing(text: str) -> str:
     """Fix common punctuation issues from speech-to-text."""
     # Remove double periods
-    text = re.sub(r"\.{2,}", ".", text)
+    text = _MULTI_PERIOD.sub(".", text)
     # Fix space before punctuation
-    text = re.sub(r"\s+([.!?,;:])", r"\1", text)
+    text = _SPACE_BEFORE_PUNCT.sub(r"\1", text)
     # Fix missing space after punctuation (but not in numbers like 3.14 or URLs)
-    text = re.sub(r"([.!?])([A-Z])", r"\1 \2", text)
+    text = _MISSING_SPACE_AFTER.sub(r"\1 \2", text)
     # Fix comma-period combo
-    text = re.sub(r",\.", ".", text)
-    text = re.sub(r"\.,", ",", text)
+    text = text.replace(",.", ".")
+    text = text.replace(".,", ",")
     return text
 
 
+# Keyed on (separator, "A" before a capital, "x" before another word, "")
+_smoothed_separators: dict[tuple[str, str], str] = {}
+
+
+def _smooth_separators(parts: list[str]) -> list[str]:
+    """_stronger_punctuation_smoothing() on a token stream.
+
+    Its rewrites stay inside one separator; the only context they need from
+    outside it is whether the next word starts with a capital letter.
+    """
+    last = len(parts) - 1
+    for i in _indexes(map(" ".__ne__, parts[0::2])):
+        i *= 2
+        sep = parts[i]
+        nxt = "" if i == last else ("A" if "A" <= parts[i + 1][0] <= "Z" else "x")
+        smoothed = _smoothed_separators.get((sep, nxt))
+        if smoothed is None:
+            smoothed = _stronger_punctuation_smoothing("x" + sep + nxt)
+            smoothed = smoothed[1:len(smoothed) - len(nxt)]
+            if len(_smoothed_separators) < _SEPARATOR_CACHE_SIZE:
+                _smoothed_separators[sep, nxt] = smoothed
+        parts[i] = smoothed
+    return parts
+
+
 # ---------------------------------------------------------------------------
 # Token preservation (URLs, emails, code-like tokens)
 # ---------------------------------------------------------------------------
@@ -667,12 +1040,16 @@ def _stronger_punctuation_smoothing(text: str) -> str:
 _PRESERVE_PATTERN = re.compile(
     r"(?:https?://\S+|www\.\S+|\S+@\S+\.\S+|`[^`]+`)"
 )
+# Every _PRESERVE_PATTERN match contains one of these
+_PRESERVE_MARKERS = ("http", "www.", "@", "`")
 
 
 def _extract_preserved(text: str) -> tuple[str, list[tuple[str, str]]]:
     """Replace preserved tokens with placeholders; return modified text
     and mapping of placeholder->original."""
     tokens: list[tuple[str, str]] = []
+    if not any(marker in text for marker in _PRESERVE_MARKERS):
+        return text, tokens
     counter = 0
 
     def _replace(m: re.Match) -> str:
@@ -720,31 +1097,43 @@ def clean_text(text: str, level: int = 1) -> str:
     # --- All levels: paragraph/line-break commands ---
     result = _process_paragraph_commands(result)
 
+    # Word-level stages share one token stream (see _tokenize)
+    parts = _tokenize(result)
+
     # --- All levels: proper noun capitalization ---
-    result = _capitalize_proper_nouns(result)
+    parts = _capitalize_proper_nouns(parts)
 
     # --- Level 0 (Light) ---
-    result = _normalize_whitespace(result)
-    result = _remove_repeated_words(result)
+    parts = _normalize_separators(parts)
+    parts = _remove_repeated_words(parts)
 
     # --- Level 1+ (Moderate) ---
     if level >= 1:
-        result = _remove_fillers(result)
+        parts = _remove_fillers(parts)
+    result = "".join(parts)
 
+    if level >= 1:
         # List formatting (only at moderate+)
         # Check for list markers before normalizing them away
         if _has_bullet_markers(result):
             result = _format_bullet_list(result)
+            parts = None
         elif _has_numbered_markers(result):
             result = _format_numbered_list(result)
+            parts = None
 
     # --- Level 2 (Aggressive) ---
     if level >= 2:
-        result = _remove_false_starts(result)
-        result = _stronger_punctuation_smoothing(result)
+        if parts is None:
+            parts = _tokenize(result)
+        parts = _remove_false_starts(parts)
+        parts = _smooth_separators(parts)
 
     # --- All levels: final touches ---
-    result = _normalize_whitespace(result)
+    if parts is not None:
+        result = "".join(_normalize_separators(parts))
+    else:
+        result = _normalize_whitespace(result)
     result = _sentence_case(result)
     result = _ensure_terminal_punctuation(result)
 
@@ -756,3 +1145,97 @@ def clean_text(text: str, level: int = 1) -> str:
         return raw
 
     return result
+
+
+# ---------------------------------------------------------------------------
+# Batch API
+# ---------------------------------------------------------------------------
+
+BATCH_CHUNK_SIZE = 256
+
+
+def _init_batch_worker(custom_nouns: dict[str, str]) -> None:
+    """Pool initializer: mirror the parent's custom dictionary."""
+    CUSTOM_PROPER_NOUNS.clear()
+    add_proper_nouns(custom_nouns)
+
+
+def _clean_chunk(texts: list[str], level: int) -> list[str]:
+    return [clean_text(t, level=level) for t in texts]
+
+
+def clean_texts(
+    texts: Iterable[str],
+    level: int = 1,
+    workers: Optional[int] = None,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+    progress: Optional[Callable[[int], None]] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[str]:
+    """Clean many texts, yielding results in input order.
+
+    Args:
+        texts: Any iterable of raw transcripts; consumed lazily.
+        level: Cleanup aggressiveness, as for ``clean_text``.
+        workers: Worker processes (default: all cores).  ``1`` or fewer
+            cleans in-process, as does running from the frozen app bundle.
+        chunk_size: Texts sent to a worker per task.
+        progress: Called with the running count of cleaned texts after
+            each chunk.
+        executor: A process pool to share instead of starting one, with
+            *workers* processes whose ``CUSTOM_PROPER_NOUNS`` already
+            match the caller's.
+
+    Chunks are submitted to a process pool with at most two per worker in
+    flight, so arbitrarily large inputs stream with bounded memory.  The
+    pool uses the ``spawn`` start method (the app is multi-threaded) and
+    each worker is seeded with the current ``CUSTOM_PROPER_NOUNS``.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if getattr(sys, "frozen", False):
+        # A spawned worker would relaunch the py2app executable, which
+        # starts the app rather than a worker.
+        workers = 1
+    it = iter(texts)
+    chunks = iter(lambda: list(itertools.islice(it, chunk_size)), [])
+
+    if executor is not None:
+        yield from _clean_on_pool(executor, chunks, level, max(workers, 1), progress)
+        return
+    if workers <= 1:
+        done = 0
+        for chunk in chunks:
+            yield from _clean_chunk(chunk, level)
+            done += len(chunk)
+            if progress is not None:
+                progress(done)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_batch_worker,
+        initargs=(dict(CUSTOM_PROPER_NOUNS),),
+    ) as pool:
+        yield from _clean_on_pool(pool, chunks, level, workers, progress)
+
+
+def _clean_on_pool(pool, chunks, level, workers, progress):
+    in_flight: deque = deque()
+    done = 0
+    for chunk in chunks:
+        in_flight.append(pool.submit(_clean_chunk, chunk, level))
+        if len(in_flight) < workers * 2:
+            continue
+        results = in_flight.popleft().result()
+        yield from results
+        done += len(results)
+        if progress is not None:
+            progress(done)
+    while in_flight:
+        results = in_flight.popleft().result()
+        yield from results
+        done += len(results)
+        if progress is not None:
+            progress(done)
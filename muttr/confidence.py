@@ -7,6 +7,8 @@ and classifies words into confidence tiers for heatmap display.
 import logging
 from dataclasses import dataclass, field
 
+import numpy as np
+
 log = logging.getLogger(__name__)
 
 # Confidence thresholds (configurable via config)
@@ -91,6 +93,16 @@ def extract_word_confidence(segments) -> list[WordInfo]:
     return words
 
 
+def low_confidence_words(transcript) -> list[str]:
+    """Words of a ``muttr.transcriber.Transcript`` below the high-confidence threshold.
+
+    Reads the transcript's probability array directly instead of building a
+    ``WordInfo`` per word.
+    """
+    low = np.flatnonzero(transcript.probabilities < DEFAULT_HIGH_THRESHOLD)
+    return [transcript.words[i] for i in low]
+
+
 def should_show_review(result: TranscriptionResult) -> bool:
     """Determine whether the confidence review overlay should be shown.
 
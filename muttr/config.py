@@ -3,6 +3,8 @@
 import json
 import os
 
+from muttr.filecache import StampedCache
+
 APP_SUPPORT_DIR = os.path.expanduser("~/Library/Application Support/MuttR")
 CONFIG_PATH = os.path.join(APP_SUPPORT_DIR, "config.json")
 
@@ -11,6 +13,21 @@ DEFAULTS = {
     "model": "base.en",
     "paste_delay_ms": 60,
     "transcription_engine": "whisper",
+    # Decode speed/accuracy trade-off: "fast", "balanced" or "accurate"
+    "decode_profile": "balanced",
+    # Decode long dictations as parallel chunks on this many workers (1 = off)
+    "parallel_decode_workers": 1,
+    # Reuse transcripts of identical audio; the disk tier stores plaintext
+    # transcripts in the app support directory, so it is opt-in
+    "transcript_cache_size": 64,
+    "transcript_cache_disk": False,
+    # Model pool: keep recently used models resident for instant switching
+    "model_pool_budget_mb": 1024,
+    "preload_alternate_model": False,
+    # Streaming: decode finished segments while fn is still held
+    "streaming_transcription": True,
+    # Trim leading/trailing silence and long pauses before decoding
+    "vad_trim": True,
     # Context stitching: use clipboard + history to prime Whisper
     "context_stitching": True,
     # Adaptive silence: learn user's speaking cadence for auto-stop
@@ -24,29 +41,25 @@ DEFAULTS = {
     "murmur_gain": 3.0,
     "murmur_noise_gate_db": -50.0,
     "murmur_min_utterance_ms": 80,
+    # Append per-dictation stage timings to traces.jsonl
+    "trace_log": False,
     # First-run onboarding
     "onboarding_completed": False,
 }
 
 VALID_MODELS = {"base.en", "small.en"}
 VALID_ENGINES = {"whisper"}
+VALID_DECODE_PROFILES = {"fast", "balanced", "accurate"}
 
 
 def _ensure_dir():
     os.makedirs(APP_SUPPORT_DIR, exist_ok=True)
 
 
-def load():
-    """Load config from disk, returning validated dict with defaults applied."""
-    _ensure_dir()
+def _validated(stored):
+    """Return *stored* merged over DEFAULTS, coerced and validated."""
     data = dict(DEFAULTS)
-    if os.path.exists(CONFIG_PATH):
-        try:
-            with open(CONFIG_PATH, "r") as f:
-                stored = json.load(f)
-            data.update(stored)
-        except (json.JSONDecodeError, OSError):
-            pass
+    data.update(stored)
 
     # Coerce and validate
     data["cleanup_level"] = max(0, min(2, int(data.get("cleanup_level", 1))))
@@ -54,22 +67,66 @@ def load():
         data["model"] = DEFAULTS["model"]
     if data.get("transcription_engine") not in VALID_ENGINES:
         data["transcription_engine"] = DEFAULTS["transcription_engine"]
+    if data.get("decode_profile") not in VALID_DECODE_PROFILES:
+        data["decode_profile"] = DEFAULTS["decode_profile"]
     data["paste_delay_ms"] = max(10, min(500, int(data.get("paste_delay_ms", 60))))
+    data["model_pool_budget_mb"] = max(0, int(data.get("model_pool_budget_mb", 1024)))
+    data["transcript_cache_size"] = max(0, int(data.get("transcript_cache_size", 64)))
+    data["parallel_decode_workers"] = max(1, min(8, int(data.get("parallel_decode_workers", 1))))
 
     return data
 
 
+def _read():
+    _ensure_dir()
+    stored = {}
+    if os.path.exists(CONFIG_PATH):
+        try:
+            with open(CONFIG_PATH, "r") as f:
+                stored = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            pass
+    return _validated(stored)
+
+
+def _emit_changes(previous, data):
+    """Emit config_changed for every key that differs between the two."""
+    changed = [
+        key for key in data.keys() | previous.keys()
+        if data.get(key) != previous.get(key)
+    ]
+    if changed:
+        from muttr import events
+        for key in changed:
+            events.emit("config_changed", key=key, value=data.get(key))
+
+
+# Validated config for CONFIG_PATH, reused until the file's stat stamp
+# changes, so get() on the dictation path does no parsing or disk reads.
+_cache = StampedCache(on_replace=_emit_changes)
+
+
+def _current():
+    """Return the cached config, re-reading config.json only if it changed."""
+    return _cache.get(CONFIG_PATH, _read)
+
+
+def load():
+    """Load config from disk, returning validated dict with defaults applied."""
+    return dict(_current())
+
+
 def save(data):
     """Persist config dict to disk."""
     _ensure_dir()
     with open(CONFIG_PATH, "w") as f:
         json.dump(data, f, indent=2)
+    _cache.put(CONFIG_PATH, _validated(data))
 
 
 def get(key, default=None):
     """Read a single config value."""
-    data = load()
-    return data.get(key, default)
+    return _current().get(key, default)
 
 
 def set_value(key, value):
@@ -0,0 +1,56 @@
+"""Parsed file contents cached against the file's stat stamp.
+
+config.json and account.json are read on the dictation path.  Each module
+keeps one ``StampedCache`` so those reads cost an ``os.stat`` until the file
+actually changes, whether through the module's own save or an outside edit.
+"""
+
+import os
+import threading
+
+
+def file_stamp(path):
+    """Return ``(mtime_ns, inode, size)`` for *path*, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_ino, st.st_size)
+
+
+class StampedCache:
+    """The parsed contents of one file, valid while its stamp is unchanged.
+
+    The path is part of the key, so pointing a module at another file (as
+    tests do) never serves the previous file's data.  *on_replace*, if
+    given, is called as ``on_replace(previous, data)`` outside the lock
+    whenever cached data for the same path is replaced.
+    """
+
+    def __init__(self, on_replace=None):
+        self._on_replace = on_replace
+        self._lock = threading.Lock()
+        self._path = None
+        self._stamp = None
+        self._data = None
+
+    def get(self, path, read):
+        """Return the cached data for *path*, calling ``read()`` if it changed."""
+        stamp = file_stamp(path)
+        with self._lock:
+            if self._path == path and self._stamp == stamp:
+                return self._data
+        data = read()
+        self._replace(path, stamp, data)
+        return data
+
+    def put(self, path, data):
+        """Cache *data* as the contents just written to *path*."""
+        self._replace(path, file_stamp(path), data)
+
+    def _replace(self, path, stamp, data):
+        with self._lock:
+            previous = self._data if self._path == path else None
+            self._path, self._stamp, self._data = path, stamp, data
+        if previous is not None and self._on_replace is not None:
+            self._on_replace(previous, data)
@@ -1,13 +1,22 @@
 """Transcription history stored in SQLite with encrypted field storage."""
 
 import base64
+import hashlib
+import hmac
 import logging
 import os
 import re
 import sqlite3
+import multiprocessing
 import subprocess
+import sys
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
 
+from muttr import keychain
 from muttr.config import APP_SUPPORT_DIR
 
 try:
@@ -23,8 +32,6 @@ log = logging.getLogger(__name__)
 
 DB_PATH = os.path.join(APP_SUPPORT_DIR, "history.db")
 
-_KEYCHAIN_SERVICE = "MuttR"
-_KEYCHAIN_ACCOUNT = "encryption-key"
 _PBKDF2_SALT = b"MuttR-field-encryption-v1"
 _PBKDF2_ITERATIONS = 480_000
 
@@ -39,11 +46,81 @@ CREATE TABLE IF NOT EXISTS transcriptions (
 )
 """
 
+_CREATE_TIMESTAMP_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_transcriptions_timestamp
+ON transcriptions (timestamp)
+"""
+
+# Search index: each distinct lowercase word is stored once, Fernet-encrypted
+# and addressed by a keyed HMAC digest, with per-entry hit counts in
+# search_postings.  No plaintext reaches disk.
+_CREATE_SEARCH_TERMS = """
+CREATE TABLE IF NOT EXISTS search_terms (
+    id INTEGER PRIMARY KEY,
+    digest TEXT NOT NULL UNIQUE,
+    term TEXT NOT NULL
+)
+"""
+
+_CREATE_SEARCH_POSTINGS = """
+CREATE TABLE IF NOT EXISTS search_postings (
+    term_id INTEGER NOT NULL,
+    entry_id INTEGER NOT NULL,
+    hits INTEGER NOT NULL,
+    PRIMARY KEY (term_id, entry_id)
+) WITHOUT ROWID
+"""
+
+_CREATE_POSTINGS_ENTRY_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_search_postings_entry
+ON search_postings (entry_id)
+"""
+
+# Backfill checkpoint for databases that predate the index: rows with
+# id >= indexed_from are indexed.  Removed once the backfill completes.
+_CREATE_SEARCH_INDEX_STATE = """
+CREATE TABLE IF NOT EXISTS search_index_state (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    indexed_from INTEGER NOT NULL
+)
+"""
+
+# PRAGMA user_version once search_postings covers every row.
+_SEARCH_INDEX_VERSION = 1
+_SEARCH_KEY_CONTEXT = b"MuttR-search-index-v1"
+_TOKEN_RE = re.compile(r"\w+")
+# SQLite's default limit on host parameters is 999.
+_MAX_SQL_PARAMS = 900
+# Rows indexed per transaction when backfilling an older database.
+INDEX_BATCH_SIZE = 200
+
+_STATEMENT_CACHE_SIZE = 64
+ROW_CACHE_SIZE = 256
+
 # ---------------------------------------------------------------------------
 # Encryption helpers
 # ---------------------------------------------------------------------------
 
 _fernet_instance = None
+_fernet_key = None
+_search_key = None
+# Set once no key can be had, so later calls neither retry nor warn again.
+_encryption_unavailable = False
+# Serializes key resolution so concurrent callers never derive the key twice.
+_key_lock = threading.Lock()
+
+# Background key resolution started by prepare_key().  While it runs,
+# add_entry() queues (entry_id, args) in _pending_writes instead of waiting
+# for it, and reads wait up to KEY_WAIT_TIMEOUT seconds for it.
+_key_future = None
+_pending_lock = threading.Lock()
+_pending_writes = deque()
+_flush_lock = threading.Lock()
+KEY_WAIT_TIMEOUT = 0.5
+
+
+class HistoryNotReady(Exception):
+    """Raised by reads while prepare_key() is still resolving the key."""
 
 
 def _get_hardware_uuid():
@@ -73,61 +150,27 @@ def _derive_fernet_key(machine_id: str) -> bytes:
     return base64.urlsafe_b64encode(key_bytes)
 
 
-def _keychain_read() -> str | None:
-    """Read the encryption key from macOS Keychain.  Returns None if absent."""
-    try:
-        result = subprocess.run(
-            [
-                "security",
-                "find-generic-password",
-                "-s", _KEYCHAIN_SERVICE,
-                "-a", _KEYCHAIN_ACCOUNT,
-                "-w",
-            ],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except (subprocess.SubprocessError, OSError):
-        pass
-    return None
-
-
-def _keychain_write(key: str) -> None:
-    """Store the encryption key in macOS Keychain."""
-    try:
-        subprocess.run(
-            [
-                "security",
-                "add-generic-password",
-                "-s", _KEYCHAIN_SERVICE,
-                "-a", _KEYCHAIN_ACCOUNT,
-                "-w", key,
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except (subprocess.SubprocessError, OSError) as exc:
-        log.warning("Failed to store encryption key in Keychain: %s", exc)
-
-
 def _get_fernet():
     """Return a cached Fernet instance, creating (and persisting) the key if needed."""
-    global _fernet_instance
     if _fernet_instance is not None:
         return _fernet_instance
 
-    if not _HAS_CRYPTO:
+    if not _HAS_CRYPTO or _encryption_unavailable:
         return None
 
+    with _key_lock:
+        if _fernet_instance is not None or _encryption_unavailable:
+            return _fernet_instance
+        return _resolve_key()
+
+
+def _resolve_key():
+    global _encryption_unavailable
     # 1. Try to retrieve an existing key from the Keychain.
-    stored_key = _keychain_read()
+    stored_key = keychain.read(keychain.ENCRYPTION_KEY_ACCOUNT)
     if stored_key:
         try:
-            _fernet_instance = Fernet(stored_key.encode("utf-8"))
-            return _fernet_instance
+            return _install_key(stored_key.encode("utf-8"))
         except Exception:
             log.warning("Stored Keychain key is invalid; regenerating.")
 
@@ -136,14 +179,119 @@ def _get_fernet():
         hw_uuid = _get_hardware_uuid()
     except RuntimeError:
         log.warning("Cannot determine hardware UUID; encryption disabled.")
+        _encryption_unavailable = True
         return None
 
     key = _derive_fernet_key(hw_uuid)
-    _keychain_write(key.decode("utf-8"))
+    try:
+        keychain.write(keychain.ENCRYPTION_KEY_ACCOUNT, key.decode("utf-8"))
+    except keychain.KeychainError as exc:
+        log.warning("Failed to store encryption key in Keychain: %s", exc)
+    return _install_key(key)
+
+
+def prepare_key():
+    """Resolve the encryption key on a background thread and return a Future.
+
+    The Future's result is the Fernet instance, or None without encryption.
+    Until it is done, add_entry() queues writes instead of blocking on the
+    Keychain, ``ioreg`` or PBKDF2; they are written once the key is ready.
+    get_recent() and search() wait briefly for it, then raise
+    HistoryNotReady.
+    """
+    global _key_future
+    with _pending_lock:
+        if _key_future is not None:
+            return _key_future
+        future = _key_future = Future()
+
+    def _run():
+        try:
+            future.set_result(_get_fernet())
+        except Exception as exc:
+            log.exception("Resolving the history encryption key failed")
+            future.set_exception(exc)
+        _write_pending()
+
+    threading.Thread(target=_run, name="muttr-history-key", daemon=True).start()
+    return future
+
+
+def flush_pending(timeout=None):
+    """Wait for the key and write any queued entries.
+
+    Returns False if the key was not ready within *timeout* seconds.
+    """
+    future = _key_future
+    if future is not None:
+        try:
+            future.exception(timeout)
+        except TimeoutError:
+            return False
+    _write_pending()
+    return True
+
+
+def _key_pending():
+    return _key_future is not None and not _key_future.done()
+
+
+def _await_key():
+    """Wait up to KEY_WAIT_TIMEOUT for the key, then write queued entries.
+
+    Raises HistoryNotReady if the key is still being resolved.
+    """
+    if not flush_pending(KEY_WAIT_TIMEOUT):
+        raise HistoryNotReady("History encryption key is still being resolved")
+
+
+def _write_pending():
+    # Entries stay queued until committed, so add_entry() keeps reserving
+    # ids above them; _flush_lock makes a concurrent caller wait for them.
+    with _flush_lock:
+        while True:
+            with _pending_lock:
+                if not _pending_writes:
+                    return
+                entry_id, args = _pending_writes[0]
+            try:
+                _write_entry(*args, entry_id=entry_id)
+            except Exception:
+                log.exception("Writing a queued history entry failed")
+            with _pending_lock:
+                _pending_writes.popleft()
+
+
+def _reserve_id():
+    """Return the id for a new queued entry.  Caller holds ``_pending_lock``.
+
+    Ids come from the AUTOINCREMENT sequence, which needs no key, so a
+    queued entry gets the id it would have had if written right away.
+    """
+    seq = _connect().execute(
+        "SELECT COALESCE(MAX(seq), 0) FROM sqlite_sequence WHERE name = 'transcriptions'"
+    ).fetchone()[0]
+    if _pending_writes:
+        seq = max(seq, _pending_writes[-1][0])
+    return seq + 1
+
+
+def _install_key(key: bytes):
+    """Cache the Fernet instance and the search-index HMAC key for *key*."""
+    global _fernet_instance, _fernet_key, _search_key
     _fernet_instance = Fernet(key)
+    _fernet_key = key
+    _search_key = hmac.new(key, _SEARCH_KEY_CONTEXT, hashlib.sha256).digest()
     return _fernet_instance
 
 
+def _get_search_key():
+    """Return the HMAC key for search-term digests, or None without encryption."""
+    if _get_fernet() is None:
+        return None
+    return _search_key
+
+
 def _encrypt(text: str) -> str:
     """Encrypt *text* and return the Fernet token as a UTF-8 string.
 
@@ -165,6 +313,10 @@ def _decrypt(data: str) -> str:
     fernet = _get_fernet()
     if fernet is None:
         return data
+    return _decrypt_with(fernet, data)
+
+
+def _decrypt_with(fernet, data: str) -> str:
     try:
         return fernet.decrypt(data.encode("utf-8")).decode("utf-8")
     except (InvalidToken, Exception):
@@ -177,15 +329,64 @@ def _decrypt(data: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+# One long-lived connection per thread.  sqlite3 connections cannot be
+# shared across threads, but reusing one per thread keeps its compiled
+# statement cache warm and skips the open + schema check on every call.
+_local = threading.local()
+_schema_lock = threading.Lock()
+# Held around every write transaction.  SQLite's busy handler polls with
+# growing sleeps and can keep missing the short gaps between back-to-back
+# transactions (e.g. a search-index backfill); waiting on this lock hands
+# the database to the next writer as soon as the current one commits.
+_write_lock = threading.Lock()
+_schema_ready: set[str] = set()
+
+
+def _init_schema(conn):
+    with _schema_lock:
+        if DB_PATH in _schema_ready:
+            return
+        with conn:
+            conn.execute(_CREATE_TABLE)
+            conn.execute(_CREATE_TIMESTAMP_INDEX)
+            conn.execute(_CREATE_SEARCH_TERMS)
+            conn.execute(_CREATE_SEARCH_POSTINGS)
+            conn.execute(_CREATE_POSTINGS_ENTRY_INDEX)
+            conn.execute(_CREATE_SEARCH_INDEX_STATE)
+            # A fresh database is trivially fully indexed; older ones are
+            # backfilled in the background (see start_search_index).
+            if conn.execute("SELECT 1 FROM transcriptions LIMIT 1").fetchone() is None:
+                conn.execute(f"PRAGMA user_version = {_SEARCH_INDEX_VERSION}")
+        _schema_ready.add(DB_PATH)
+
+
 def _connect():
+    """Return this thread's connection to ``DB_PATH``, opening it if needed."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        if _local.path == DB_PATH:
+            return conn
+        conn.close()
+
     os.makedirs(APP_SUPPORT_DIR, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, cached_statements=_STATEMENT_CACHE_SIZE)
     conn.row_factory = sqlite3.Row
-    conn.execute(_CREATE_TABLE)
-    conn.commit()
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    _init_schema(conn)
+    _local.conn = conn
+    _local.path = DB_PATH
     return conn
 
 
+def close():
+    """Close the calling thread's connection (e.g. at shutdown)."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+
 def _decrypt_row(row_dict: dict) -> dict:
     """Return a copy of *row_dict* with text fields decrypted."""
     row_dict["raw_text"] = _decrypt(row_dict["raw_text"])
@@ -193,100 +394,779 @@ def _decrypt_row(row_dict: dict) -> dict:
     return row_dict
 
 
+# ---------------------------------------------------------------------------
+# Decrypted row cache
+# ---------------------------------------------------------------------------
+
+# LRU of decrypted entries keyed by (DB_PATH, id) so re-reading recent
+# history costs no Fernet work.  Every write path invalidates or updates it;
+# the generation counter stops a reader that decrypted a row before an
+# invalidation from caching the stale copy afterwards.
+_row_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_row_cache_lock = threading.Lock()
+_row_cache_generation = 0
+_cache_hits = 0
+_cache_misses = 0
+
+
+def _cache_store(entry, generation=None):
+    with _row_cache_lock:
+        if generation is not None and generation != _row_cache_generation:
+            return
+        key = (DB_PATH, entry["id"])
+        _row_cache[key] = entry
+        _row_cache.move_to_end(key)
+        while len(_row_cache) > ROW_CACHE_SIZE:
+            _row_cache.popitem(last=False)
+
+
+def _cache_invalidate(entry_ids=None):
+    """Drop *entry_ids* (or every entry for ``DB_PATH``) from the cache."""
+    global _row_cache_generation
+    with _row_cache_lock:
+        _row_cache_generation += 1
+        if entry_ids is None:
+            for key in [k for k in _row_cache if k[0] == DB_PATH]:
+                del _row_cache[key]
+        else:
+            for entry_id in entry_ids:
+                _row_cache.pop((DB_PATH, entry_id), None)
+
+
+def _cached_row(row) -> dict:
+    """Return a decrypted copy of *row*, decrypting only on a cache miss."""
+    global _cache_hits, _cache_misses
+    key = (DB_PATH, row["id"])
+    with _row_cache_lock:
+        entry = _row_cache.get(key)
+        if entry is not None:
+            _row_cache.move_to_end(key)
+            _cache_hits += 1
+            return dict(entry)
+        _cache_misses += 1
+        generation = _row_cache_generation
+    entry = _decrypt_row(dict(row))
+    _cache_store(entry, generation)
+    return dict(entry)
+
+
+def cache_stats():
+    """Return row-cache counters as ``{"hits", "misses", "size"}``."""
+    with _row_cache_lock:
+        return {"hits": _cache_hits, "misses": _cache_misses, "size": len(_row_cache)}
+
+
+# ---------------------------------------------------------------------------
+# Search index
+# ---------------------------------------------------------------------------
+
+_index_lock = threading.Lock()
+_indexed: set[str] = set()
+_index_threads: dict[str, threading.Thread] = {}
+
+# Decrypted vocabulary, shared by all threads and topped up incrementally
+# from search_terms so each query decrypts only terms added since the last.
+_vocab_lock = threading.Lock()
+_vocab = {"path": None, "key": None, "last_id": 0, "terms": {}}
+
+
+def _tokens(text):
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _term_digest(key, term):
+    return hmac.digest(key, term.encode("utf-8"), "sha256").hex()
+
+
+def _chunks(items, size=_MAX_SQL_PARAMS):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _index_ready(conn):
+    """Return True once the search index covers every row of ``DB_PATH``."""
+    if DB_PATH in _indexed:
+        return True
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= _SEARCH_INDEX_VERSION:
+        _indexed.add(DB_PATH)
+        return True
+    return False
+
+
+def _is_indexed(conn, entry_id):
+    """Return True if the search index covers row *entry_id*.
+
+    While an older database is being backfilled only rows from the
+    checkpoint up are covered; writers keep those postings current and
+    leave the rest to the backfill.
+    """
+    if _index_ready(conn):
+        return True
+    row = conn.execute("SELECT indexed_from FROM search_index_state").fetchone()
+    return row is not None and entry_id >= row[0]
+
+
+def _index_entries(conn, key, entries, crypt=None):
+    """(Re)write postings for *entries*, an iterable of (id, raw, cleaned).
+
+    Must be called inside a transaction on *conn*.  Digests and term ids
+    are resolved once per distinct term across the whole batch; new terms
+    are encrypted with *crypt* (see ``_crypto_pool``) when given.
+    """
+    per_entry = []
+    digest_of = {}
+    for entry_id, raw_text, cleaned_text in entries:
+        hits = {}
+        for term in _tokens(raw_text) + _tokens(cleaned_text):
+            hits[term] = hits.get(term, 0) + 1
+        for term in hits:
+            if term not in digest_of:
+                digest_of[term] = _term_digest(key, term)
+        per_entry.append((entry_id, hits))
+    conn.executemany(
+        "DELETE FROM search_postings WHERE entry_id = ?",
+        [(entry_id,) for entry_id, _hits in per_entry],
+    )
+
+    term_ids = {}
+    for chunk in _chunks(list(digest_of.values())):
+        marks = ",".join("?" * len(chunk))
+        for r in conn.execute(
+            f"SELECT digest, id FROM search_terms WHERE digest IN ({marks})", chunk,
+        ):
+            term_ids[r["digest"]] = r["id"]
+    new_terms = [term for term, digest in digest_of.items() if digest not in term_ids]
+    if crypt is not None:
+        tokens = crypt("encrypt", new_terms)
+    else:
+        tokens = [_encrypt(term) for term in new_terms]
+    for term, token in zip(new_terms, tokens):
+        cur = conn.execute(
+            "INSERT INTO search_terms (digest, term) VALUES (?, ?)",
+            (digest_of[term], token),
+        )
+        term_ids[digest_of[term]] = cur.lastrowid
+
+    conn.executemany(
+        "INSERT INTO search_postings (term_id, entry_id, hits) VALUES (?, ?, ?)",
+        [
+            (term_ids[digest_of[term]], entry_id, n)
+            for entry_id, hits in per_entry
+            for term, n in hits.items()
+        ],
+    )
+
+
+def _backfill_step(conn, key, batch_size):
+    """Index the next *batch_size* unindexed rows, newest first.
+
+    Rows are read and decrypted before the write lock is taken; the write
+    transaction only rewrites postings and advances the checkpoint, so
+    writers wait at most one short transaction and an interrupted backfill
+    resumes where it stopped.  Returns True once every row is indexed.
+    """
+    if _index_ready(conn):
+        return True
+    row = conn.execute("SELECT indexed_from FROM search_index_state").fetchone()
+    if row is not None:
+        upper = row[0]
+    else:
+        upper = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM transcriptions").fetchone()[0]
+    select = (
+        "SELECT id, raw_text, cleaned_text FROM transcriptions "
+        "WHERE id < ? ORDER BY id DESC LIMIT ?"
+    )
+    rows = conn.execute(select, (upper, batch_size)).fetchall()
+    plain = {
+        r["id"]: (r["raw_text"], r["cleaned_text"], _decrypt(r["raw_text"]), _decrypt(r["cleaned_text"]))
+        for r in rows
+    }
+
+    with _write_lock:
+        return _backfill_write(conn, key, select, upper, row is None, batch_size, plain)
+
+
+def _backfill_write(conn, key, select, upper, first, batch_size, plain):
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        if first:
+            # Rows written since MAX(id) was read were not indexed by their writers.
+            upper = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM transcriptions").fetchone()[0]
+        rows = conn.execute(select, (upper, batch_size)).fetchall()
+        if not rows:
+            conn.execute("DELETE FROM search_index_state")
+            conn.execute(f"PRAGMA user_version = {_SEARCH_INDEX_VERSION}")
+            return True
+        entries = []
+        for r in rows:
+            known = plain.get(r["id"])
+            if known is not None and known[:2] == (r["raw_text"], r["cleaned_text"]):
+                entries.append((r["id"], known[2], known[3]))
+            else:  # written or changed since the read above
+                entries.append((r["id"], _decrypt(r["raw_text"]), _decrypt(r["cleaned_text"])))
+        _index_entries(conn, key, entries)
+        conn.execute(
+            "INSERT OR REPLACE INTO search_index_state (id, indexed_from) VALUES (0, ?)",
+            (rows[-1]["id"],),
+        )
+    return False
+
+
+def build_search_index(batch_size=INDEX_BATCH_SIZE):
+    """Index rows written before the search index existed, on this thread.
+
+    Only needed for databases that predate the index.  Rows are indexed
+    newest first ``batch_size`` at a time, and searches made meanwhile see
+    every row indexed so far.  The decrypted vocabulary is loaded
+    afterwards so the first search does not pay for it.
+    """
+    conn = _connect()
+    key = _get_search_key()
+    if key is None:
+        return
+    started = time.monotonic()
+    backfilled = not _index_ready(conn)
+    while not _backfill_step(conn, key, batch_size):
+        pass
+    _indexed.add(DB_PATH)
+    if backfilled:
+        log.info("Built history search index in %.2fs", time.monotonic() - started)
+    with _vocab_lock:
+        _refresh_vocabulary(conn, key)
+
+
+def start_search_index():
+    """Run build_search_index() on a background thread (once per database)."""
+    path = DB_PATH
+    with _index_lock:
+        thread = _index_threads.get(path)
+        if thread is not None:
+            return thread
+
+        def _run():
+            try:
+                build_search_index()
+            except Exception:
+                log.exception("Building the history search index failed")
+            finally:
+                with _index_lock:
+                    _index_threads.pop(path, None)
+
+        thread = _index_threads[path] = threading.Thread(
+            target=_run, name="muttr-history-index", daemon=True,
+        )
+        thread.start()
+        return thread
+
+
+def _reset_vocabulary():
+    with _vocab_lock:
+        _vocab.update(path=None, key=None, last_id=0, terms={})
+
+
+def _refresh_vocabulary(conn, key):
+    """Decrypt terms added since the last call.  Caller holds ``_vocab_lock``."""
+    if _vocab["path"] != DB_PATH or _vocab["key"] != key:
+        _vocab.update(path=DB_PATH, key=key, last_id=0, terms={})
+    rows = conn.execute(
+        "SELECT id, term FROM search_terms WHERE id > ? ORDER BY id",
+        (_vocab["last_id"],),
+    ).fetchall()
+    terms = _vocab["terms"]
+    for r in rows:
+        terms[_decrypt(r["term"])] = r["id"]
+    if rows:
+        _vocab["last_id"] = rows[-1]["id"]
+
+
+def _matching_terms(conn, key, words):
+    """Map each query word to the ids of indexed terms containing it."""
+    with _vocab_lock:
+        _refresh_vocabulary(conn, key)
+        terms = _vocab["terms"]
+        return {
+            word: [term_id for term, term_id in terms.items() if word in term]
+            for word in words
+        }
+
+
+def _ranked_candidates(conn, key, query):
+    """Return entry ids that may contain *query*, best match first.
+
+    Every word of the query must occur inside an indexed term of the entry;
+    entries are ranked by total term hits, then newest first.  This is a
+    superset of the substring matches, so callers still verify each entry.
+    """
+    scores = None
+    for term_ids in _matching_terms(conn, key, set(_tokens(query))).values():
+        word_scores = {}
+        for chunk in _chunks(term_ids):
+            marks = ",".join("?" * len(chunk))
+            for entry_id, hits in conn.execute(
+                "SELECT entry_id, SUM(hits) FROM search_postings "
+                f"WHERE term_id IN ({marks}) GROUP BY entry_id",
+                chunk,
+            ):
+                word_scores[entry_id] = word_scores.get(entry_id, 0) + hits
+        if scores is None:
+            scores = word_scores
+        else:
+            scores = {e: scores[e] + h for e, h in word_scores.items() if e in scores}
+        if not scores:
+            return []
+    return sorted(scores, key=lambda e: (-scores[e], -e))
+
+
+def _matches(entry, query_lower):
+    return (
+        query_lower in entry["raw_text"].lower()
+        or query_lower in entry["cleaned_text"].lower()
+    )
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
 def add_entry(raw_text, cleaned_text, engine="whisper", duration_s=0.0):
-    """Record a transcription. Returns the new row id."""
+    """Record a transcription. Returns the new row id.
+
+    While prepare_key() is still resolving the key the entry is queued,
+    keeping its timestamp, and written under the returned id once the key
+    is ready.
+    """
+    args = (time.time(), raw_text, cleaned_text, engine, duration_s)
+    with _pending_lock:
+        if _key_pending() or _pending_writes:
+            entry_id = _reserve_id()
+            _pending_writes.append((entry_id, args))
+            return entry_id
+    return _write_entry(*args)
+
+
+def _write_entry(timestamp, raw_text, cleaned_text, engine, duration_s, entry_id=None):
     conn = _connect()
-    try:
+    key = _get_search_key()
+    with _write_lock, conn:
         cur = conn.execute(
-            "INSERT INTO transcriptions (timestamp, raw_text, cleaned_text, engine, duration_s) "
-            "VALUES (?, ?, ?, ?, ?)",
+            "INSERT INTO transcriptions (id, timestamp, raw_text, cleaned_text, engine, duration_s) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
             (
-                time.time(),
+                entry_id,
+                timestamp,
                 _encrypt(raw_text),
                 _encrypt(cleaned_text),
                 engine,
                 duration_s,
             ),
         )
-        conn.commit()
-        return cur.lastrowid
-    finally:
-        conn.close()
+        # Checked after the INSERT so a concurrent backfill step either already
+        # committed or will pick this row up once our write lock is released.
+        if key is not None and _is_indexed(conn, cur.lastrowid):
+            _index_entries(conn, key, [(cur.lastrowid, raw_text, cleaned_text)])
+    _cache_store({
+        "id": cur.lastrowid,
+        "timestamp": timestamp,
+        "raw_text": raw_text,
+        "cleaned_text": cleaned_text,
+        "engine": engine,
+        "duration_s": duration_s,
+    })
+    return cur.lastrowid
 
 
 def get_recent(limit=50, offset=0):
-    """Return recent transcriptions, newest first."""
-    conn = _connect()
-    try:
-        rows = conn.execute(
-            "SELECT * FROM transcriptions ORDER BY timestamp DESC LIMIT ? OFFSET ?",
-            (limit, offset),
-        ).fetchall()
-        return [_decrypt_row(dict(r)) for r in rows]
-    finally:
-        conn.close()
+    """Return recent transcriptions, newest first.
+
+    Raises HistoryNotReady if prepare_key() has not resolved the key within
+    KEY_WAIT_TIMEOUT seconds.
+    """
+    _await_key()
+    rows = _connect().execute(
+        "SELECT * FROM transcriptions ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+        (limit, offset),
+    ).fetchall()
+    return [_cached_row(r) for r in rows]
 
 
 def search(query, limit=50):
-    """Full-text search across raw and cleaned text.
+    """Full-text search across raw and cleaned text, best matches first.
 
     Because the text columns are encrypted, SQL LIKE cannot operate on
-    ciphertext.  We therefore fetch all rows, decrypt in Python, and filter
-    in-memory.  This is acceptable for a local desktop app with moderate
-    data volumes.
+    ciphertext.  Instead the words of each entry are indexed under keyed
+    HMAC digests; the query's words are looked up in the (decrypted,
+    in-memory) vocabulary, candidates are ranked by hit count and recency,
+    and only those are decrypted to confirm the substring match.  When the
+    index yields no candidates, the rows it does not cover yet (all of them
+    until an older database is backfilled, see start_search_index) are
+    decrypted and filtered newest first.  Without encryption, or for
+    queries with no word characters, every row is filtered that way.
+    Raises HistoryNotReady like get_recent().
     """
+    _await_key()
     conn = _connect()
-    try:
-        rows = conn.execute(
-            "SELECT * FROM transcriptions ORDER BY timestamp DESC",
-        ).fetchall()
+    key = _get_search_key()
+    if key is None or not _tokens(query):
+        return _search_all(conn, query, limit)
 
-        query_lower = query.lower()
-        results = []
-        for r in rows:
-            entry = _decrypt_row(dict(r))
-            if (
-                query_lower in entry["raw_text"].lower()
-                or query_lower in entry["cleaned_text"].lower()
-            ):
+    if not _index_ready(conn):
+        start_search_index()
+    query_lower = query.lower()
+    candidates = _ranked_candidates(conn, key, query)
+    if not candidates:
+        return _search_all(conn, query, limit, below=_unindexed_below(conn))
+    results = []
+    for chunk in _chunks(candidates, max(limit, 1)):
+        marks = ",".join("?" * len(chunk))
+        rows = {
+            r["id"]: r
+            for r in conn.execute(
+                f"SELECT * FROM transcriptions WHERE id IN ({marks})", chunk,
+            )
+        }
+        for entry_id in chunk:
+            if entry_id not in rows:
+                continue
+            entry = _cached_row(rows[entry_id])
+            if _matches(entry, query_lower):
                 results.append(entry)
                 if len(results) >= limit:
-                    break
-        return results
-    finally:
-        conn.close()
+                    return results
+    return results
+
+
+def _unindexed_below(conn):
+    """Return the id below which rows are not indexed yet (0 once all are)."""
+    if _index_ready(conn):
+        return 0
+    row = conn.execute("SELECT indexed_from FROM search_index_state").fetchone()
+    if row is not None:
+        return row[0]
+    return conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM transcriptions").fetchone()[0]
+
+
+def _search_all(conn, query, limit, below=None):
+    """Filter rows newest first, only those with id < *below* if given."""
+    sql = "SELECT * FROM transcriptions"
+    params = ()
+    if below is not None:
+        if below <= 0:
+            return []
+        sql += " WHERE id < ?"
+        params = (below,)
+    sql += " ORDER BY timestamp DESC"
+
+    query_lower = query.lower()
+    results = []
+    for r in conn.execute(sql, params):
+        entry = _cached_row(r)
+        if _matches(entry, query_lower):
+            results.append(entry)
+            if len(results) >= limit:
+                break
+    return results
 
 
 def delete_entry(entry_id):
     """Delete a single transcription by id."""
     conn = _connect()
-    try:
+    with _write_lock, conn:
         conn.execute("DELETE FROM transcriptions WHERE id = ?", (entry_id,))
-        conn.commit()
-    finally:
-        conn.close()
+        conn.execute("DELETE FROM search_postings WHERE entry_id = ?", (entry_id,))
+    _cache_invalidate([entry_id])
 
 
 def clear_all():
     """Delete all transcription history."""
     conn = _connect()
-    try:
+    with _write_lock, conn:
         conn.execute("DELETE FROM transcriptions")
-        conn.commit()
-    finally:
-        conn.close()
+        conn.execute("DELETE FROM search_postings")
+        conn.execute("DELETE FROM search_terms")
+    _reset_vocabulary()
+    _cache_invalidate()
 
 
 def count():
-    """Return total number of transcriptions."""
+    """Return total number of transcriptions, including queued ones."""
+    row = _connect().execute("SELECT COUNT(*) FROM transcriptions").fetchone()
+    with _pending_lock:
+        return row[0] + len(_pending_writes)
+
+
+# ---------------------------------------------------------------------------
+# Bulk reprocessing
+# ---------------------------------------------------------------------------
+
+REPROCESS_BATCH_SIZE = 500
+
+
+def _iter_raw_texts(conn, page_size, crypt):
+    """Yield (id, decrypted raw_text) for every row, oldest first."""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            "SELECT id, raw_text FROM transcriptions WHERE id > ? ORDER BY id LIMIT ?",
+            (last_id, page_size),
+        ).fetchall()
+        if not rows:
+            return
+        raw_texts = crypt("decrypt", [r["raw_text"] for r in rows])
+        yield from zip((r["id"] for r in rows), raw_texts)
+        last_id = rows[-1]["id"]
+
+
+def _init_reprocess_worker(key, custom_nouns):
+    """Pool initializer: seed both the crypto and the cleanup state."""
+    from muttr.cleanup import CUSTOM_PROPER_NOUNS, add_proper_nouns
+
+    _init_crypto_worker(key)
+    CUSTOM_PROPER_NOUNS.clear()
+    add_proper_nouns(custom_nouns)
+
+
+@contextmanager
+def _reprocess_pool(workers):
+    """Yield one process pool for cleanup and crypto, or None for in-process."""
+    if workers <= 1:
+        yield None
+        return
+    from muttr.cleanup import CUSTOM_PROPER_NOUNS
+
+    _get_fernet()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_reprocess_worker,
+        initargs=(_fernet_key, dict(CUSTOM_PROPER_NOUNS)),
+    ) as pool:
+        yield pool
+
+
+def reprocess_cleanup(level, workers=None, batch_size=REPROCESS_BATCH_SIZE, progress=None):
+    """Re-run cleanup over every stored raw_text and rewrite cleaned_text.
+
+    Use after changing ``cleanup_level`` or the custom proper-noun
+    dictionary.  Rows are cleaned via ``cleanup.clean_texts`` and written
+    back ``batch_size`` rows per transaction; cleanup and bulk crypto share
+    one pool of *workers* processes (default: all cores).  *progress*, if
+    given, is called as ``progress(done, total)`` after each batch.
+    Returns the number of rows updated.
+    """
+    from muttr.cleanup import clean_texts
+
+    workers = _pool_workers(workers)
     conn = _connect()
+    total = conn.execute("SELECT COUNT(*) FROM transcriptions").fetchone()[0]
+    ids = deque()
+    done = 0
+    batch = []
+    with _reprocess_pool(workers) as pool, _crypto_pool(workers, pool) as crypt:
+        raw_texts = _iter_raw_texts(conn, batch_size, crypt)
+
+        def _texts():
+            for entry_id, raw in raw_texts:
+                ids.append((entry_id, raw))
+                yield raw
+
+        for cleaned in clean_texts(_texts(), level=level, workers=workers, executor=pool):
+            entry_id, raw = ids.popleft()
+            batch.append((entry_id, raw, cleaned))
+            if len(batch) >= batch_size:
+                _write_cleaned(conn, batch, crypt)
+                done += len(batch)
+                batch = []
+                if progress is not None:
+                    progress(done, total)
+        if batch:
+            _write_cleaned(conn, batch, crypt)
+            done += len(batch)
+            if progress is not None:
+                progress(done, total)
+    return done
+
+
+def _write_cleaned(conn, batch, crypt):
+    """Store a batch of (id, raw_text, cleaned_text) and refresh its postings."""
+    key = _get_search_key()
+    tokens = crypt("encrypt", [cleaned for _id, _raw, cleaned in batch])
+    with _write_lock, conn:
+        conn.executemany(
+            "UPDATE transcriptions SET cleaned_text = ? WHERE id = ?",
+            [(token, entry_id) for (entry_id, _raw, _cleaned), token in zip(batch, tokens)],
+        )
+        if key is not None:
+            covered = [entry for entry in batch if _is_indexed(conn, entry[0])]
+            if covered:
+                _index_entries(conn, key, covered, crypt)
+    _cache_invalidate([entry_id for entry_id, _raw, _cleaned in batch])
+
+
+# ---------------------------------------------------------------------------
+# Bulk import / export
+# ---------------------------------------------------------------------------
+
+BULK_BATCH_SIZE = 5000
+# Texts per worker task when encrypting or decrypting on a process pool.
+CRYPTO_CHUNK_SIZE = 1024
+
+_worker_fernet = None
+
+
+def _init_crypto_worker(key):
+    global _worker_fernet
+    _worker_fernet = Fernet(key) if key is not None else None
+
+
+def _crypt_texts(fernet, op, texts):
+    if fernet is None:
+        return list(texts)
+    if op == "encrypt":
+        return [fernet.encrypt(t.encode("utf-8")).decode("utf-8") for t in texts]
+    return [_decrypt_with(fernet, t) for t in texts]
+
+
+def _crypt_worker_chunk(op, texts):
+    return _crypt_texts(_worker_fernet, op, texts)
+
+
+def _pool_workers(workers):
+    """Resolve a worker count: all cores by default, 1 in the frozen app.
+
+    A spawned worker would relaunch the py2app executable, which starts the
+    app rather than a worker, so bundles do the work in-process.
+    """
+    if getattr(sys, "frozen", False):
+        return 1
+    if workers is None:
+        return os.cpu_count() or 1
+    return workers
+
+
+@contextmanager
+def _crypto_pool(workers=None, executor=None):
+    """Yield ``crypt(op, texts)`` that encrypts or decrypts a list of texts.
+
+    Lists spanning several ``CRYPTO_CHUNK_SIZE`` chunks are split across a
+    process pool of *workers* (default: all cores), started on first use
+    and seeded with the key, or across *executor* if given, whose workers
+    must already be seeded (see ``_init_crypto_worker``).  Smaller lists,
+    or ``workers <= 1``, are done in-process.  Without encryption texts
+    pass through unchanged.
+    """
+    workers = _pool_workers(workers)
+    fernet = _get_fernet()
+    pool = executor
+
+    def crypt(op, texts):
+        nonlocal pool
+        if fernet is None or workers <= 1 or len(texts) <= CRYPTO_CHUNK_SIZE:
+            return _crypt_texts(fernet, op, texts)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_crypto_worker,
+                initargs=(_fernet_key,),
+            )
+        chunks = [texts[i:i + CRYPTO_CHUNK_SIZE] for i in range(0, len(texts), CRYPTO_CHUNK_SIZE)]
+        return [t for part in pool.map(_crypt_worker_chunk, [op] * len(chunks), chunks)
+                for t in part]
+
     try:
-        row = conn.execute("SELECT COUNT(*) FROM transcriptions").fetchone()
-        return row[0]
+        yield crypt
     finally:
-        conn.close()
+        if pool is not None and pool is not executor:
+            pool.shutdown()
+
+
+def _batches(items, size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def import_entries(rows, workers=None, batch_size=BULK_BATCH_SIZE):
+    """Insert *rows*, yielding each new row id in input order.
+
+    *rows* is any iterable of dicts with ``raw_text`` and ``cleaned_text``
+    and optionally ``timestamp``, ``engine`` and ``duration_s`` -- the shape
+    ``export_entries()`` yields, so an export can be imported as-is.  Text
+    is encrypted in bulk (see ``_crypto_pool``) and each ``batch_size``
+    rows are committed, and indexed for search, in one transaction.  Ids of
+    a batch are yielded once it is committed.
+    """
+    flush_pending()  # keep queued single writes ahead of the import
+    conn = _connect()
+    key = _get_search_key()
+    with _crypto_pool(workers) as crypt:
+        for batch in _batches(rows, batch_size):
+            now = time.time()
+            texts = []
+            for row in batch:
+                texts += (row["raw_text"], row["cleaned_text"])
+            tokens = crypt("encrypt", texts)
+            ids = []
+            with _write_lock, conn:
+                for i, row in enumerate(batch):
+                    cur = conn.execute(
+                        "INSERT INTO transcriptions "
+                        "(timestamp, raw_text, cleaned_text, engine, duration_s) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (
+                            row.get("timestamp", now),
+                            tokens[2 * i],
+                            tokens[2 * i + 1],
+                            row.get("engine", "whisper"),
+                            row.get("duration_s", 0.0),
+                        ),
+                    )
+                    ids.append(cur.lastrowid)
+                if key is not None and _is_indexed(conn, ids[0]):
+                    _index_entries(conn, key, [
+                        (entry_id, row["raw_text"], row["cleaned_text"])
+                        for entry_id, row in zip(ids, batch)
+                    ], crypt)
+            yield from ids
+
+
+def add_entries(rows, workers=None, batch_size=BULK_BATCH_SIZE):
+    """Insert many transcriptions at once. Returns the new row ids.
+
+    See ``import_entries()`` for the row format and batching.
+    """
+    return list(import_entries(rows, workers=workers, batch_size=batch_size))
+
+
+def export_entries(workers=None, batch_size=BULK_BATCH_SIZE):
+    """Yield every transcription as a decrypted dict, oldest first.
+
+    Rows are read ``batch_size`` at a time and decrypted in bulk, without
+    filling the row cache.
+    """
+    conn = _connect()
+    last_id = 0
+    with _crypto_pool(workers) as crypt:
+        while True:
+            rows = conn.execute(
+                "SELECT * FROM transcriptions WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, batch_size),
+            ).fetchall()
+            if not rows:
+                return
+            texts = []
+            for r in rows:
+                texts += (r["raw_text"], r["cleaned_text"])
+            plain = crypt("decrypt", texts)
+            for i, r in enumerate(rows):
+                entry = dict(r)
+                entry["raw_text"] = plain[2 * i]
+                entry["cleaned_text"] = plain[2 * i + 1]
+                yield entry
+            last_id = rows[-1]["id"]
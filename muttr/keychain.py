@@ -0,0 +1,274 @@
+"""Keychain access shared by history and license.
+
+Items are generic passwords under the ``MuttR`` service, one per account.
+Values are cached in process after the first read, so only the first
+lookup of an item reaches the backend.  ``prefetch()`` does those reads on a
+background thread at launch, so UI and dictation threads find them cached.
+A lookup made while a read is in flight waits for it instead of starting
+another.
+
+The backend is pluggable.  On macOS it is the native Security framework
+through ``pyobjc-framework-Security`` (a requirement), falling back to the
+``security`` CLI if that binding cannot be imported.  Elsewhere it is an
+in-memory store, and ``FileBackend`` can stand in for tests.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+
+log = logging.getLogger(__name__)
+
+SERVICE = "MuttR"
+ENCRYPTION_KEY_ACCOUNT = "encryption-key"
+LICENSE_KEY_ACCOUNT = "license-key"
+DEFAULT_ACCOUNTS = (ENCRYPTION_KEY_ACCOUNT, LICENSE_KEY_ACCOUNT)
+
+
+class KeychainError(Exception):
+    """A keychain item could not be written or deleted."""
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+class SecurityCLIBackend:
+    """The macOS ``security`` command-line tool (one process per call)."""
+
+    def read(self, account: str) -> str | None:
+        try:
+            result = subprocess.run(
+                ["security", "find-generic-password", "-s", SERVICE, "-a", account, "-w"],
+                capture_output=True, text=True,
+            )
+        except (subprocess.SubprocessError, OSError):
+            return None
+        if result.returncode == 0:
+            return result.stdout.strip()
+        return None
+
+    def write(self, account: str, value: str) -> None:
+        self.delete(account)
+        try:
+            subprocess.run(
+                ["security", "add-generic-password", "-s", SERVICE, "-a", account, "-w", value],
+                capture_output=True, text=True, check=True,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            raise KeychainError(f"could not store {account}: {e}") from e
+
+    def delete(self, account: str) -> None:
+        try:
+            subprocess.run(
+                ["security", "delete-generic-password", "-s", SERVICE, "-a", account],
+                capture_output=True,
+            )
+        except (subprocess.SubprocessError, OSError):
+            pass  # nothing stored, or no keychain to delete from
+
+
+class NativeBackend:
+    """The Security framework through PyObjC, without spawning processes."""
+
+    def __init__(self):
+        import Security
+
+        self._sec = Security
+
+    def _query(self, account: str) -> dict:
+        sec = self._sec
+        return {
+            sec.kSecClass: sec.kSecClassGenericPassword,
+            sec.kSecAttrService: SERVICE,
+            sec.kSecAttrAccount: account,
+        }
+
+    def read(self, account: str) -> str | None:
+        sec = self._sec
+        query = self._query(account)
+        query[sec.kSecReturnData] = True
+        query[sec.kSecMatchLimit] = sec.kSecMatchLimitOne
+        status, data = sec.SecItemCopyMatching(query, None)
+        if status != 0 or data is None:
+            return None
+        return bytes(data).decode("utf-8")
+
+    def write(self, account: str, value: str) -> None:
+        sec = self._sec
+        self.delete(account)
+        item = self._query(account)
+        item[sec.kSecValueData] = value.encode("utf-8")
+        status, _ = sec.SecItemAdd(item, None)
+        if status != 0:
+            raise KeychainError(f"could not store {account}: OSStatus {status}")
+
+    def delete(self, account: str) -> None:
+        self._sec.SecItemDelete(self._query(account))
+
+
+class MemoryBackend:
+    """Process-local store; nothing survives a restart."""
+
+    def __init__(self, items: dict[str, str] | None = None):
+        self._items = dict(items or {})
+        self._lock = threading.Lock()
+
+    def read(self, account: str) -> str | None:
+        with self._lock:
+            return self._items.get(account)
+
+    def write(self, account: str, value: str) -> None:
+        with self._lock:
+            self._items[account] = value
+
+    def delete(self, account: str) -> None:
+        with self._lock:
+            self._items.pop(account, None)
+
+
+class FileBackend:
+    """Items in a JSON file readable only by the owner (tests, non-macOS)."""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        try:
+            with open(self._path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, items: dict) -> None:
+        try:
+            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            tmp = self._path + ".tmp"
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(items, f)
+            os.replace(tmp, self._path)
+        except OSError as e:
+            raise KeychainError(f"could not write {self._path}: {e}") from e
+
+    def read(self, account: str) -> str | None:
+        with self._lock:
+            return self._load().get(account)
+
+    def write(self, account: str, value: str) -> None:
+        with self._lock:
+            items = self._load()
+            items[account] = value
+            self._save(items)
+
+    def delete(self, account: str) -> None:
+        with self._lock:
+            items = self._load()
+            if items.pop(account, None) is not None:
+                self._save(items)
+
+
+def default_backend():
+    """Native Security framework, else the ``security`` CLI, off macOS memory."""
+    if sys.platform != "darwin":
+        return MemoryBackend()
+    try:
+        return NativeBackend()
+    except ImportError as e:
+        log.warning("Security framework binding unavailable (%s); using the security CLI", e)
+        return SecurityCLIBackend()
+
+
+# ---------------------------------------------------------------------------
+# Cached access
+# ---------------------------------------------------------------------------
+
+_MISSING = object()
+
+_lock = threading.Lock()
+_backend = None
+_values: dict[str, object] = {}  # account -> value, or None when absent
+_loading: dict[str, threading.Event] = {}
+
+
+def _get_backend():
+    global _backend
+    with _lock:
+        if _backend is None:
+            _backend = default_backend()
+        return _backend
+
+
+def set_backend(backend) -> None:
+    """Use *backend* from now on and drop every cached value."""
+    global _backend
+    with _lock:
+        _backend = backend
+        _values.clear()
+
+
+def read(account: str) -> str | None:
+    """Return the item for *account*, or None if it is not stored."""
+    while True:
+        with _lock:
+            value = _values.get(account, _MISSING)
+            if value is not _MISSING:
+                return value
+            loading = _loading.get(account)
+            if loading is None:
+                loading = _loading[account] = threading.Event()
+                break
+        loading.wait()
+
+    try:
+        value = _get_backend().read(account)
+        with _lock:
+            _values[account] = value
+    finally:
+        with _lock:
+            del _loading[account]
+        loading.set()
+    return value
+
+
+def write(account: str, value: str) -> None:
+    """Store *value* for *account*.  Raises KeychainError on failure."""
+    _get_backend().write(account, value)
+    with _lock:
+        _values[account] = value
+
+
+def delete(account: str) -> None:
+    """Remove the item for *account*, if any."""
+    _get_backend().delete(account)
+    with _lock:
+        _values[account] = None
+
+
+def is_cached(account: str) -> bool:
+    with _lock:
+        return account in _values
+
+
+def prefetch(accounts=DEFAULT_ACCOUNTS) -> threading.Thread:
+    """Read *accounts* into the cache on a background thread."""
+    def _run():
+        for account in accounts:
+            try:
+                read(account)
+            except Exception:
+                log.exception("Prefetching keychain item %s failed", account)
+
+    thread = threading.Thread(target=_run, name="muttr-keychain", daemon=True)
+    thread.start()
+    return thread
+
+
+def clear_cache() -> None:
+    """Forget cached values so the next read() goes to the backend. Useful for tests."""
+    with _lock:
+        _values.clear()
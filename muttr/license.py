@@ -9,9 +9,10 @@ Signature: HMAC-SHA256 of "MUTTR-{tier}-{expiry}" using shared secret
 import hashlib
 import hmac
 import os
-import subprocess
+import threading
 import time
 
+from muttr import keychain
 from muttr.config import APP_SUPPORT_DIR
 
 # Shared secret for HMAC validation (embedded in app)
@@ -32,35 +33,22 @@ _WORD_LIMITS = {
     TIER_LIFETIME: None,   # unlimited
 }
 
-_KEYCHAIN_SERVICE = "MuttR"
-_KEYCHAIN_ACCOUNT = "license-key"
+
+# The stored key and its validation result, read from the Keychain once.
+# The result is re-evaluated only when the key reaches its expiry, and is
+# reset by activate()/deactivate(), so get_tier() normally spawns nothing.
+_state_lock = threading.Lock()
+_state = {"loaded": False, "key": None, "result": None, "recheck_at": None}
 
 
 def _store_in_keychain(key: str) -> None:
-    """Store license key in macOS Keychain."""
-    # Delete existing entry first (ignore errors if not found)
-    subprocess.run(
-        ["security", "delete-generic-password", "-s", _KEYCHAIN_SERVICE,
-         "-a", _KEYCHAIN_ACCOUNT],
-        capture_output=True,
-    )
-    subprocess.run(
-        ["security", "add-generic-password", "-s", _KEYCHAIN_SERVICE,
-         "-a", _KEYCHAIN_ACCOUNT, "-w", key],
-        capture_output=True, check=True,
-    )
+    """Store the license key in the Keychain."""
+    keychain.write(keychain.LICENSE_KEY_ACCOUNT, key)
 
 
 def _load_from_keychain() -> str | None:
-    """Load license key from macOS Keychain."""
-    result = subprocess.run(
-        ["security", "find-generic-password", "-s", _KEYCHAIN_SERVICE,
-         "-a", _KEYCHAIN_ACCOUNT, "-w"],
-        capture_output=True, text=True,
-    )
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return None
+    """Load the license key from the Keychain (cached after the first read)."""
+    return keychain.read(keychain.LICENSE_KEY_ACCOUNT)
 
 
 def _compute_signature(tier: str, expiry: str) -> str:
@@ -106,21 +94,51 @@ def validate_key(key: str) -> dict | None:
     }
 
 
+def _recheck_at(result: dict | None) -> float | None:
+    """When a cached *result* must be validated again, or None for never."""
+    if result and result["valid"] and result["tier"] != TIER_LIFETIME and result["expiry"] > 0:
+        return result["expiry"]
+    return None
+
+
+def _current_result() -> dict | None:
+    """Validation result for the stored key, from the cache when still current."""
+    expired = False
+    with _state_lock:
+        if not _state["loaded"]:
+            key = _load_from_keychain()
+            result = validate_key(key) if key else None
+            _state.update(loaded=True, key=key, result=result, recheck_at=_recheck_at(result))
+        elif _state["recheck_at"] is not None and time.time() >= _state["recheck_at"]:
+            result = validate_key(_state["key"])
+            _state.update(result=result, recheck_at=_recheck_at(result))
+            expired = True
+        result = _state["result"]
+    if expired:
+        _emit_changed()
+    return result
+
+
+def _emit_changed() -> None:
+    from muttr import events
+    events.emit("license_changed", tier=get_tier())
+
+
 def activate(key: str) -> dict | None:
     """Validate and store a license key. Returns validation result."""
     result = validate_key(key)
     if result and result["valid"]:
         _store_in_keychain(key)
+        with _state_lock:
+            _state.update(loaded=True, key=key.strip(), result=result,
+                          recheck_at=_recheck_at(result))
+        _emit_changed()
     return result
 
 
 def get_tier() -> str:
     """Return the current license tier."""
-    key = _load_from_keychain()
-    if not key:
-        return TIER_FREE
-
-    result = validate_key(key)
+    result = _current_result()
     if result and result["valid"]:
         return result["tier"]
     return TIER_FREE
@@ -139,8 +157,7 @@ def is_licensed() -> bool:
 
 def deactivate() -> None:
     """Remove the stored license key."""
-    subprocess.run(
-        ["security", "delete-generic-password", "-s", _KEYCHAIN_SERVICE,
-         "-a", _KEYCHAIN_ACCOUNT],
-        capture_output=True,
-    )
+    keychain.delete(keychain.LICENSE_KEY_ACCOUNT)
+    with _state_lock:
+        _state.update(loaded=True, key=None, result=None, recheck_at=None)
+    _emit_changed()
@@ -3,7 +3,7 @@
 import Cocoa
 import objc
 
-from muttr import config, history, account, budget
+from muttr import config, account
 from muttr.resources import get_resource_path
 
 
@@ -300,6 +300,7 @@ class SettingsWindowController(Cocoa.NSObject):
         # History
         self._history_table = None
         self._history_data = []
+        self._history_retry_pending = False
         self._search_field = None
         self._history_count_label = None
         self._history_scroll = None
@@ -1012,13 +1013,7 @@ class SettingsWindowController(Cocoa.NSObject):
         config.set_value("model", models[sender.indexOfSelectedItem()])
 
     def searchChanged_(self, sender):
-        query = str(self._search_field.stringValue()).strip()
-        if query:
-            self._history_data = history.search(query)
-        else:
-            self._history_data = history.get_recent()
-        self._rebuild_history_cards()
-        self._update_history_count()
+        self._refresh_history()
 
     def clearHistory_(self, sender):
         alert = Cocoa.NSAlert.alloc().init()
@@ -1030,6 +1025,7 @@ class SettingsWindowController(Cocoa.NSObject):
         alert.addButtonWithTitle_("Cancel")
         alert.setAlertStyle_(Cocoa.NSAlertStyleWarning)
         if alert.runModal() == Cocoa.NSAlertFirstButtonReturn:
+            from muttr import history
             history.clear_all()
             self._refresh_history()
 
@@ -1080,13 +1076,32 @@ class SettingsWindowController(Cocoa.NSObject):
 
     @objc.python_method
     def _refresh_history(self):
-        self._history_data = history.get_recent()
+        from muttr import history
+        query = ""
+        if self._search_field is not None:
+            query = str(self._search_field.stringValue()).strip()
+        try:
+            self._history_data = history.search(query) if query else history.get_recent()
+        except history.HistoryNotReady:
+            # The key is still resolving at launch; try again shortly.
+            self._history_data = []
+            if not self._history_retry_pending:
+                self._history_retry_pending = True
+                Cocoa.NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
+                    0.5, False, lambda timer: self._retry_history(),
+                )
         self._rebuild_history_cards()
         self._update_history_count()
 
+    @objc.python_method
+    def _retry_history(self):
+        self._history_retry_pending = False
+        self._refresh_history()
+
     @objc.python_method
     def _update_history_count(self):
         if self._history_count_label:
+            from muttr import history
             total = history.count()
             noun = "recording" if total == 1 else "recordings"
             self._history_count_label.setStringValue_(f"{total} {noun}")
@@ -1288,6 +1303,7 @@ class MenuBar(Cocoa.NSObject):
     def menuNeedsUpdate_(self, menu):
         """Update dynamic menu items before display."""
         try:
+            from muttr import budget
             remaining = budget.words_remaining_today()
             if remaining is None:
                 self._budget_item.setTitle_("Unlimited words")
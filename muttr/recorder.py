@@ -1,25 +1,53 @@
 """Audio recording via sounddevice."""
 
-import threading
-
 import numpy as np
-import sounddevice as sd
 
 SAMPLE_RATE = 16000
 CHANNELS = 1
 BLOCK_SIZE = 1024
 
+# Initial arena size; doubled whenever a recording outgrows it.
+INITIAL_CAPACITY = SAMPLE_RATE * 30
+
+# Per-block meter frames kept for readers (~4 s of blocks), and the columns
+# of each frame.  LEVEL is mean absolute amplitude, as ``Recorder.level``
+# has always reported.
+METER_HISTORY = 64
+LEVEL, RMS, PEAK = 0, 1, 2
+
 
 class Recorder:
     def __init__(self):
-        self._chunks = []
         self._stream = None
-        self._lock = threading.Lock()
-        self._current_level = 0.0
+        self._on_block = None
+        # Samples are written in place into a preallocated float32 arena.
+        # Only the audio thread writes it while the stream runs, and stop()
+        # reads it after the stream has been stopped, so no lock is needed.
+        self._arena = np.empty(INITIAL_CAPACITY, dtype=np.float32)
+        self._length = 0
+        # Meter ring (a seqlock): the audio thread claims frame ``seq`` by
+        # bumping ``_meter_claimed``, fills slot ``seq % METER_HISTORY`` and
+        # then bumps ``_meter_seq``.  Readers take no lock; after copying
+        # they re-read ``_meter_claimed`` and discard any frame whose slot
+        # the writer has since claimed again.
+        self._meter = np.zeros((METER_HISTORY, 3), dtype=np.float32)
+        self._meter_seq = 0
+        self._meter_claimed = 0
+        self._meter_start = 0
+        self._scratch = np.empty(BLOCK_SIZE, dtype=np.float32)
+        self._dropped = 0
+
+    def start(self, on_block=None):
+        """Open the input stream.
 
-    def start(self):
-        self._chunks = []
-        self._current_level = 0.0
+        *on_block*, if given, is called from the audio thread with each new
+        block of mono float32 samples (used for streaming transcription).
+        The block is a view into the recording and must not be modified.
+        """
+        import sounddevice as sd
+
+        self._reset()
+        self._on_block = on_block
         self._stream = sd.InputStream(
             samplerate=SAMPLE_RATE,
             channels=CHANNELS,
@@ -30,24 +58,102 @@ class Recorder:
         self._stream.start()
 
     def stop(self):
+        """Stop recording and return the captured audio, or None if empty.
+
+        The result is a view of the arena, so this is constant time
+        regardless of utterance length; the next recording gets a new arena.
+        """
         if self._stream is not None:
             self._stream.stop()
             self._stream.close()
             self._stream = None
+        self._on_block = None
 
-        with self._lock:
-            if not self._chunks:
-                return None
-            audio = np.concatenate(self._chunks, axis=0).flatten()
-            self._chunks = []
-
+        if self._length == 0:
+            return None
+        audio = self._arena[:self._length]
+        self._arena = None
+        self._length = 0
         return audio
 
     @property
     def level(self):
-        return self._current_level
+        """Mean absolute amplitude of the latest block (0.0 before any)."""
+        return self.meter()[LEVEL]
+
+    def meter(self):
+        """Return ``(level, rms, peak)`` for the latest block of this recording."""
+        while True:
+            seq = self._meter_seq
+            if seq <= self._meter_start:
+                return (0.0, 0.0, 0.0)
+            level, rms, peak = self._meter[(seq - 1) % METER_HISTORY].tolist()
+            # Frame seq - 1 is intact unless the writer has claimed its slot again.
+            if self._meter_claimed - seq < METER_HISTORY:
+                return (level, rms, peak)
+
+    def meter_since(self, seq):
+        """Return ``(new_seq, frames)`` for meter frames written after *seq*.
+
+        *frames* is an ``(n, 3)`` copy indexed by LEVEL/RMS/PEAK, oldest
+        first, holding at most the last METER_HISTORY frames of the
+        current recording.  Frames the audio thread overwrote (or may have
+        been overwriting) while they were copied are left out.
+        """
+        end = self._meter_seq
+        start = max(seq, self._meter_start, end - METER_HISTORY)
+        frames = self._meter[np.arange(start, end) % METER_HISTORY]
+        # Frames before ``intact`` share a slot with a frame claimed since.
+        intact = self._meter_claimed - METER_HISTORY
+        if intact > start:
+            frames = frames[intact - start:]
+        return end, frames
+
+    @property
+    def dropped_blocks(self):
+        """Input overflows reported by the audio backend this recording."""
+        return self._dropped
+
+    def _reset(self):
+        if self._arena is None:
+            self._arena = np.empty(INITIAL_CAPACITY, dtype=np.float32)
+        self._length = 0
+        self._meter_start = self._meter_seq
+        self._dropped = 0
+
+    def _grow(self, needed):
+        capacity = len(self._arena)
+        while capacity < needed:
+            capacity *= 2
+        arena = np.empty(capacity, dtype=np.float32)
+        arena[:self._length] = self._arena[:self._length]
+        self._arena = arena
+
+    def _measure(self, block):
+        frames = len(block)
+        if frames > len(self._scratch):
+            self._scratch = np.empty(frames, dtype=np.float32)
+        magnitude = self._scratch[:frames]
+        np.abs(block, out=magnitude)
+        seq = self._meter_seq
+        self._meter_claimed = seq + 1
+        frame = self._meter[seq % METER_HISTORY]
+        frame[LEVEL] = magnitude.mean()
+        frame[RMS] = np.sqrt(np.dot(block, block) / frames)
+        frame[PEAK] = magnitude.max()
+        self._meter_seq = seq + 1
 
     def _audio_callback(self, indata, frames, time_info, status):
-        with self._lock:
-            self._chunks.append(indata.copy())
-        self._current_level = float(np.abs(indata).mean())
+        if status and status.input_overflow:
+            self._dropped += 1
+        start = self._length
+        end = start + frames
+        if end > len(self._arena):
+            self._grow(end)
+        block = self._arena[start:end]
+        block[:] = indata[:, 0]
+        self._length = end
+        on_block = self._on_block
+        if on_block is not None:
+            on_block(block)
+        self._measure(block)
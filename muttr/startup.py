@@ -0,0 +1,128 @@
+"""Startup benchmark: what launching the app costs in imports and memory.
+
+Imports a module (``muttr.app`` by default) in a fresh interpreter started
+with ``-X importtime`` and reports the time to import it, the resident set
+size afterwards and the most expensive imports.  Each repeat is a cold
+process, so the numbers match an app launch up to the "Ready" line (the
+Whisper model loads in the background and is not included).
+
+    python -m muttr.startup --repeat 5 --output startup.json
+
+Save JSON results per commit and diff them to catch launch regressions.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+import numpy as np
+
+# Runs in the child: time the import and report peak RSS as the last line.
+_CHILD = """
+import json, resource, sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+rss_mb = peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+print(json.dumps({{"import_s": elapsed, "rss_mb": rss_mb}}))
+"""
+
+
+def parse_importtime(stderr):
+    """Parse ``-X importtime`` output into one dict per imported module."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # the column header
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        imports.append({
+            "module": stripped,
+            "self_ms": int(parts[0]) / 1000,
+            "cumulative_ms": int(parts[1]) / 1000,
+            "depth": (len(name) - len(stripped) - 1) // 2,
+        })
+    return imports
+
+
+def measure(module="muttr.app", python=None):
+    """Import *module* in a cold interpreter; return timings, RSS and imports."""
+    proc = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", _CHILD.format(module=module)],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        lines = [line for line in proc.stderr.splitlines()
+                 if not line.startswith("import time:")]
+        raise RuntimeError(f"importing {module} failed: {lines[-1] if lines else proc.returncode}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["imports"] = parse_importtime(proc.stderr)
+    return result
+
+
+def run(module="muttr.app", repeat=3, top=25):
+    """Measure *repeat* cold imports of *module* and return a report dict."""
+    runs = [measure(module) for _ in range(repeat)]
+    import_ms = np.asarray([r["import_s"] for r in runs]) * 1000.0
+    imports = runs[-1]["imports"]
+    return {
+        "module": module,
+        "runs": repeat,
+        "import_ms": {
+            "min": round(float(import_ms.min()), 3),
+            "p50": round(float(np.percentile(import_ms, 50)), 3),
+            "max": round(float(import_ms.max()), 3),
+        },
+        "rss_mb": round(max(r["rss_mb"] for r in runs), 1),
+        "module_count": len(imports),
+        "top_imports": sorted(imports, key=lambda i: i["self_ms"], reverse=True)[:top],
+        "muttr_imports": [i for i in imports if i["module"].startswith("muttr")],
+    }
+
+
+def format_report(report):
+    t = report["import_ms"]
+    lines = [
+        f"import {report['module']}: p50 {t['p50']:.1f} ms "
+        f"(min {t['min']:.1f}, max {t['max']:.1f}) over {report['runs']} run(s)",
+        f"RSS after import: {report['rss_mb']} MB, {report['module_count']} modules",
+        "",
+        f"{'self ms':>9} {'cumul ms':>9}  module",
+    ]
+    for i in report["top_imports"]:
+        lines.append(f"{i['self_ms']:>9.2f} {i['cumulative_ms']:>9.2f}  {i['module']}")
+    if report["muttr_imports"]:
+        lines += ["", f"{'cumul ms':>9}  muttr module"]
+        for i in report["muttr_imports"]:
+            lines.append(f"{i['cumulative_ms']:>9.2f}  {i['module']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m muttr.startup", description=__doc__.splitlines()[0],
+    )
+    parser.add_argument("--module", default="muttr.app", help="module to import")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=25, help="imports to list by self time")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        report = run(args.module, repeat=args.repeat, top=args.top)
+    except RuntimeError as e:
+        parser.exit(1, f"{e}\n")
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Lightweight per-dictation stage timing.
+
+A ``Trace`` collects named spans while a dictation runs.  ``finish()`` keeps
+the record in an in-memory ring buffer, emits ``trace_recorded`` on the event
+bus and, when the ``trace_log`` config key is on, appends it as one JSON line
+to ``traces.jsonl`` in the app support directory.  A span costs two
+``perf_counter`` calls, so tracing stays on in production.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+TRACE_HISTORY = 100
+TRACE_LOG_NAME = "traces.jsonl"
+
+_traces: deque = deque(maxlen=TRACE_HISTORY)
+_lock = threading.Lock()
+
+
+class Trace:
+    """Timings for one run of a pipeline, e.g. a single dictation."""
+
+    def __init__(self, name: str, **attrs):
+        self.name = name
+        self.attrs = dict(attrs)
+        self.spans: list[dict] = []
+        self.error: str | None = None
+        self._timestamp = time.time()
+        self._t0 = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, suppress: bool = False):
+        """Time the enclosed block as stage *name*.
+
+        An exception is recorded on the span and re-raised, or swallowed if
+        *suppress* is true (for best-effort side effects).
+        """
+        start = time.perf_counter()
+        record = {"name": name, "start_ms": round((start - self._t0) * 1000, 3)}
+        try:
+            yield record
+        except Exception as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+            if not suppress:
+                raise
+            log.debug("Suppressed error in span %s", name, exc_info=True)
+        finally:
+            record["duration_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            self.spans.append(record)
+
+    def finish(self, **attrs) -> dict:
+        """Record the trace and return it as a dict."""
+        self.attrs.update(attrs)
+        record = {
+            "name": self.name,
+            "timestamp": self._timestamp,
+            "total_ms": round((time.perf_counter() - self._t0) * 1000, 3),
+            "spans": self.spans,
+            "attrs": self.attrs,
+            "error": self.error,
+        }
+        with _lock:
+            _traces.append(record)
+
+        from muttr import events
+        events.emit("trace_recorded", trace=record)
+        _maybe_dump(record)
+        return record
+
+
+def recent_traces(limit: int | None = None) -> list[dict]:
+    """Return recorded traces, oldest first (the last *limit* if given)."""
+    with _lock:
+        traces = list(_traces)
+    return traces[-limit:] if limit else traces
+
+
+def clear() -> None:
+    """Forget all recorded traces. Useful for tests."""
+    with _lock:
+        _traces.clear()
+
+
+def _maybe_dump(record: dict) -> None:
+    from muttr import config
+
+    if not config.get("trace_log", False):
+        return
+    try:
+        os.makedirs(config.APP_SUPPORT_DIR, exist_ok=True)
+        path = os.path.join(config.APP_SUPPORT_DIR, TRACE_LOG_NAME)
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+    except (OSError, TypeError, ValueError) as e:
+        log.warning("Could not write trace log: %s", e)
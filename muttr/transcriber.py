@@ -1,15 +1,521 @@
 """Transcription backend: Whisper (faster-whisper)."""
 
+import collections
+import hashlib
+import json
 import logging
-from typing import Protocol
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Callable, Protocol
 
 import numpy as np
 
+from muttr.cadence import RMS_FLOOR, frame_rms
+
+if TYPE_CHECKING:
+    from muttr.vad import TrimResult
+
 log = logging.getLogger(__name__)
 
 DEFAULT_MODEL = "base.en"
 SAMPLE_RATE = 16000
 
+# Streaming: commit a segment once this much audio is pending and it ends
+# in silence; force a cut before Whisper's 30 s context window fills up.
+_STREAM_MIN_COMMIT_S = 6.0
+_STREAM_MAX_WINDOW_S = 24.0
+# Never cut closer than this to the live edge (the user may still be mid-word)
+_STREAM_TAIL_GUARD_S = 1.0
+_STREAM_POLL_S = 0.25
+# Carry this much committed text forward as the prompt for the next segment
+_STREAM_PROMPT_CHARS = 200
+
+# Chunked decoding of long dictations across workers: windows stay under
+# Whisper's 30 s context and end in a pause where possible; hard cuts
+# overlap so no word is lost, and the repeated words are dropped.
+_CHUNK_MIN_S = 45.0
+_CHUNK_WINDOW_S = 25.0
+_CHUNK_OVERLAP_S = 1.0
+_CHUNK_MAX_OVERLAP_WORDS = 8
+
+# Transcript cache: finished transcripts kept per audio fingerprint
+DEFAULT_TRANSCRIPT_CACHE_SIZE = 64
+_DISK_CACHE_MAX_FILES = 512
+
+# Silence detection for segment boundaries (30 ms frames below the
+# cadence pause floor, as in muttr.vad)
+_SILENCE_FRAME = 480
+_SILENCE_MIN_FRAMES = 10  # 300 ms
+
+
+# Approximate resident size (MB) of each int8 Whisper model, used to keep
+# the model pool within its memory budget.
+MODEL_MEMORY_MB = {
+    "tiny.en": 75,
+    "base.en": 150,
+    "small.en": 500,
+    "medium.en": 1500,
+}
+_UNKNOWN_MODEL_MB = 500
+# Resident size relative to int8 weights.
+_COMPUTE_TYPE_SCALE = {"int8": 1, "int8_float32": 1, "float32": 3}
+DEFAULT_POOL_BUDGET_MB = 1024
+
+# Named speed/accuracy trade-offs.  beam_size, best_of and temperature are
+# decode options; compute_type, cpu_threads and num_workers are model options
+# (cpu_threads=0 lets CTranslate2 choose).  "balanced" matches the settings
+# MuttR has always used.
+_TEMPERATURE_FALLBACK = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+DECODE_PROFILES = {
+    "fast": {
+        "beam_size": 1,
+        "best_of": 1,
+        "temperature": (0.0,),
+        "compute_type": "int8",
+        "cpu_threads": 0,
+        "num_workers": 1,
+    },
+    "balanced": {
+        "beam_size": 5,
+        "best_of": 5,
+        "temperature": _TEMPERATURE_FALLBACK,
+        "compute_type": "int8",
+        "cpu_threads": 0,
+        "num_workers": 1,
+    },
+    "accurate": {
+        "beam_size": 8,
+        "best_of": 5,
+        "temperature": _TEMPERATURE_FALLBACK,
+        "compute_type": "float32",
+        "cpu_threads": 0,
+        "num_workers": 1,
+    },
+}
+DEFAULT_DECODE_PROFILE = "balanced"
+
+
+# ---------------------------------------------------------------------------
+# Model pool
+# ---------------------------------------------------------------------------
+
+class ModelPool:
+    """Keeps recently used Whisper models resident up to a memory budget.
+
+    Models are keyed by their construction options and evicted
+    least-recently-used first.  Concurrent requests for a model that is
+    still loading wait for that load instead of starting another.
+    """
+
+    def __init__(self, budget_mb: int = DEFAULT_POOL_BUDGET_MB):
+        self._budget_mb = budget_mb
+        self._models: OrderedDict[tuple, object] = OrderedDict()
+        self._loading: dict[tuple, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_size: str, device: str = "cpu", compute_type: str = "int8",
+            cpu_threads: int = 0, num_workers: int = 1):
+        """Return the model for this configuration, loading it if needed."""
+        key = (model_size, device, compute_type, cpu_threads, num_workers)
+        while True:
+            with self._lock:
+                model = self._models.get(key)
+                if model is not None:
+                    self._models.move_to_end(key)
+                    return model
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = threading.Event()
+                    break
+            loading.wait()
+
+        try:
+            model = self._load(*key)
+            with self._lock:
+                self._models[key] = model
+                self._evict()
+        finally:
+            with self._lock:
+                del self._loading[key]
+            loading.set()
+        return model
+
+    def preload(self, model_size: str, **options) -> threading.Thread:
+        """Load a model on a background thread so a later get() is instant.
+
+        *options* are the keyword arguments of :meth:`get`.
+        """
+        def _run():
+            try:
+                self.get(model_size, **options)
+            except Exception:
+                log.exception("Preloading Whisper model %s failed", model_size)
+
+        thread = threading.Thread(target=_run, daemon=True)
+        thread.start()
+        return thread
+
+    def is_loaded(self, model_size: str, device: str = "cpu", compute_type: str = "int8",
+                  cpu_threads: int = 0, num_workers: int = 1) -> bool:
+        key = (model_size, device, compute_type, cpu_threads, num_workers)
+        with self._lock:
+            return key in self._models
+
+    def set_budget(self, budget_mb: int) -> None:
+        with self._lock:
+            self._budget_mb = budget_mb
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+    def _evict(self) -> None:
+        # Never evict the most recently used model, even if it alone
+        # exceeds the budget.
+        while len(self._models) > 1 and self._resident_mb() > self._budget_mb:
+            key, _ = self._models.popitem(last=False)
+            log.info("Evicted Whisper model %s from pool", key[0])
+
+    def _resident_mb(self) -> int:
+        return sum(
+            MODEL_MEMORY_MB.get(size, _UNKNOWN_MODEL_MB) * _COMPUTE_TYPE_SCALE.get(compute, 1)
+            for size, _device, compute, *_ in self._models
+        )
+
+    @staticmethod
+    def _load(model_size: str, device: str, compute_type: str,
+              cpu_threads: int, num_workers: int):
+        from faster_whisper import WhisperModel
+
+        log.info("Loading Whisper model %s (%s) ...", model_size, compute_type)
+        model = WhisperModel(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
+        )
+        log.info("Whisper model loaded.")
+        return model
+
+
+_model_pool = ModelPool()
+
+
+def model_pool() -> ModelPool:
+    """Return the process-wide model pool."""
+    return _model_pool
+
+
+# ---------------------------------------------------------------------------
+# Transcript cache
+# ---------------------------------------------------------------------------
+
+class TranscriptCache:
+    """Content-addressed cache of finished transcripts.
+
+    Keys are fingerprints of the int16-quantized PCM plus everything else
+    that changes the decode (model, profile, prompt, decode mode), so
+    re-dictating or retrying identical audio skips Whisper entirely.
+    Entries (text or ``Transcript``) are kept in memory with LRU eviction;
+    with a *directory* they are also written there as JSON, one file per
+    key, and survive restarts.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_TRANSCRIPT_CACHE_SIZE,
+                 directory: str | None = None):
+        self._max_entries = max_entries
+        self._directory = directory
+        self._entries: OrderedDict[str, object] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._disk_hits = self._misses = 0
+
+    @staticmethod
+    def fingerprint(audio: np.ndarray, *parts) -> str:
+        """Return the cache key for *audio* decoded with *parts* (model, prompt, ...).
+
+        Audio is quantized to int16 first, so float noise below one PCM step
+        does not change the key.
+        """
+        return TranscriptCache.finish_fingerprint(TranscriptCache.hasher(audio), *parts)
+
+    @staticmethod
+    def hasher(audio: np.ndarray | None = None):
+        """Return a PCM hasher; ``update_hasher`` feeds it audio incrementally."""
+        h = hashlib.blake2b(digest_size=16)
+        if audio is not None:
+            TranscriptCache.update_hasher(h, audio)
+        return h
+
+    @staticmethod
+    def update_hasher(h, audio: np.ndarray) -> None:
+        h.update(np.rint(np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes())
+
+    @staticmethod
+    def finish_fingerprint(h, *parts) -> str:
+        """Return the key for the audio fed to *h* decoded with *parts*."""
+        h = h.copy()
+        for part in parts:
+            h.update(b"\0" + str(part).encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> "str | Transcript | None":
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return text
+            directory = self._directory
+        text = self._read_disk(directory, key) if directory else None
+        with self._lock:
+            if text is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._remember(key, text)
+        return text
+
+    def put(self, key: str, value: "str | Transcript") -> None:
+        with self._lock:
+            self._remember(key, value)
+            directory = self._directory
+        if directory:
+            self._write_disk(directory, key, value)
+
+    def set_capacity(self, max_entries: int) -> None:
+        """Resize the memory tier; 0 keeps nothing in memory."""
+        with self._lock:
+            self._max_entries = max_entries
+            self._evict()
+
+    def set_directory(self, directory: str | None) -> None:
+        """Enable the on-disk tier in *directory*, or disable it with None."""
+        with self._lock:
+            self._directory = directory
+
+    def clear(self) -> None:
+        """Drop every memory entry and reset the counters (disk files are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._disk_hits = self._misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits + self._disk_hits) / lookups if lookups else 0.0,
+            }
+
+    def _remember(self, key: str, value) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _read_disk(directory: str, key: str) -> "str | Transcript | None":
+        path = os.path.join(directory, key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)  # mark as recently used for pruning
+            if "transcript" in entry:
+                return Transcript.from_dict(entry["transcript"])
+            return entry["text"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _write_disk(directory: str, key: str, value: "str | Transcript") -> None:
+        if isinstance(value, Transcript):
+            entry = {"transcript": value.to_dict()}
+        else:
+            entry = {"text": value}
+        try:
+            os.makedirs(directory, exist_ok=True)
+            tmp = os.path.join(directory, f".{key}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, os.path.join(directory, key))
+            with os.scandir(directory) as it:
+                files = [e for e in it if e.is_file() and not e.name.startswith(".")]
+            if len(files) > _DISK_CACHE_MAX_FILES:
+                files.sort(key=lambda e: e.stat().st_mtime)
+                for entry in files[:len(files) - _DISK_CACHE_MAX_FILES]:
+                    os.remove(entry.path)
+        except OSError as e:
+            log.warning("Could not write transcript cache entry: %s", e)
+
+
+_transcript_cache = TranscriptCache()
+
+
+def transcript_cache() -> TranscriptCache:
+    """Return the process-wide transcript cache."""
+    return _transcript_cache
+
+
+# ---------------------------------------------------------------------------
+# Structured result
+# ---------------------------------------------------------------------------
+
+def _empty(dtype):
+    return field(default_factory=lambda: np.zeros(0, dtype=dtype))
+
+
+@dataclass
+class Transcript:
+    """Text of one decode plus per-word timing and probability.
+
+    Words are stored as parallel arrays: ``words[i]`` spans ``starts[i]`` to
+    ``ends[i]`` seconds of the decoded audio with probability
+    ``probabilities[i]``.  Segment *j* covers words
+    ``segment_offsets[j]:segment_offsets[j + 1]`` and has average token
+    log-probability ``segment_logprobs[j]``.
+    """
+
+    text: str
+    words: tuple[str, ...] = ()
+    starts: np.ndarray = _empty(np.float32)
+    ends: np.ndarray = _empty(np.float32)
+    probabilities: np.ndarray = _empty(np.float32)
+    segment_offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int32))
+    segment_logprobs: np.ndarray = _empty(np.float32)
+
+    @classmethod
+    def from_segments(cls, segments) -> "Transcript":
+        """Build from faster-whisper segments (with or without word timestamps)."""
+        texts, words, starts, ends, probs, offsets, logprobs = [], [], [], [], [], [0], []
+        for segment in segments:
+            texts.append(segment.text.strip())
+            logprobs.append(getattr(segment, "avg_logprob", 0.0))
+            for w in getattr(segment, "words", None) or ():
+                words.append(w.word.strip())
+                starts.append(w.start)
+                ends.append(w.end)
+                probs.append(w.probability)
+            offsets.append(len(words))
+        return cls(
+            text=" ".join(t for t in texts if t),
+            words=tuple(words),
+            starts=np.asarray(starts, dtype=np.float32),
+            ends=np.asarray(ends, dtype=np.float32),
+            probabilities=np.asarray(probs, dtype=np.float32),
+            segment_offsets=np.asarray(offsets, dtype=np.int32),
+            segment_logprobs=np.asarray(logprobs, dtype=np.float32),
+        )
+
+    @classmethod
+    def join(cls, parts) -> "Transcript":
+        """Concatenate consecutive transcripts whose times are already absolute."""
+        parts = list(parts)
+        if not parts:
+            return cls(text="")
+        offsets, base = [np.zeros(1, dtype=np.int32)], 0
+        for part in parts:
+            offsets.append(part.segment_offsets[1:] + base)
+            base += len(part.words)
+        return cls(
+            text=" ".join(t for t in (part.text.strip() for part in parts) if t),
+            words=tuple(w for part in parts for w in part.words),
+            starts=np.concatenate([part.starts for part in parts]),
+            ends=np.concatenate([part.ends for part in parts]),
+            probabilities=np.concatenate([part.probabilities for part in parts]),
+            segment_offsets=np.concatenate(offsets).astype(np.int32),
+            segment_logprobs=np.concatenate([part.segment_logprobs for part in parts]),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Transcript":
+        """Inverse of :meth:`to_dict`."""
+        return cls(
+            text=data["text"],
+            words=tuple(data["words"]),
+            starts=np.asarray(data["starts"], dtype=np.float32),
+            ends=np.asarray(data["ends"], dtype=np.float32),
+            probabilities=np.asarray(data["probabilities"], dtype=np.float32),
+            segment_offsets=np.asarray(data["segment_offsets"], dtype=np.int32),
+            segment_logprobs=np.asarray(data["segment_logprobs"], dtype=np.float32),
+        )
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form (for the transcript cache's disk tier)."""
+        return {
+            "text": self.text,
+            "words": list(self.words),
+            "starts": self.starts.tolist(),
+            "ends": self.ends.tolist(),
+            "probabilities": self.probabilities.tolist(),
+            "segment_offsets": self.segment_offsets.tolist(),
+            "segment_logprobs": self.segment_logprobs.tolist(),
+        }
+
+    @property
+    def has_words(self) -> bool:
+        return len(self.words) > 0
+
+    @property
+    def mean_probability(self) -> float:
+        """Average word probability, or 0.0 without word data."""
+        return float(self.probabilities.mean()) if len(self.probabilities) else 0.0
+
+    @property
+    def segment_probability(self) -> float:
+        """Probability implied by the mean segment ``avg_logprob`` (0.0 without segments).
+
+        Available from every decode, including those without word timestamps.
+        """
+        if not len(self.segment_logprobs):
+            return 0.0
+        return float(np.exp(self.segment_logprobs.mean()))
+
+    def mapped(self, to_time: Callable[[np.ndarray], np.ndarray]) -> "Transcript":
+        """Copy with word start and end times passed through *to_time*."""
+        if not self.has_words:
+            return self
+        return replace(
+            self,
+            starts=np.asarray(to_time(self.starts), dtype=np.float32),
+            ends=np.asarray(to_time(self.ends), dtype=np.float32),
+        )
+
+    def shifted(self, seconds: float) -> "Transcript":
+        """Copy with word times moved *seconds* later."""
+        if not seconds:
+            return self
+        return self.mapped(lambda t: t + np.float32(seconds))
+
+    def without_leading_words(self, count: int) -> "Transcript":
+        """Copy without the first *count* words (stitching overlapping chunks)."""
+        if count <= 0:
+            return self
+        words = self.words[count:]
+        return replace(
+            self,
+            text=" ".join(self.text.split()[count:]),
+            words=words,
+            starts=self.starts[count:],
+            ends=self.ends[count:],
+            probabilities=self.probabilities[count:],
+            segment_offsets=np.clip(self.segment_offsets - count, 0, len(words)).astype(np.int32),
+        )
+
+    def __str__(self) -> str:
+        return self.text
+
 
 # ---------------------------------------------------------------------------
 # Backend protocol
@@ -20,6 +526,12 @@ class TranscriberBackend(Protocol):
 
     def load(self) -> None: ...
     def transcribe(self, audio: np.ndarray, **kwargs) -> str: ...
+    def transcribe_result(self, audio: np.ndarray, **kwargs) -> Transcript: ...
+    def start_stream(
+        self, prompt_factory: Callable[[], str] | None = None,
+        preprocess: Callable[[np.ndarray], "TrimResult"] | None = None,
+        word_timestamps: bool = False,
+    ) -> "StreamingTranscription": ...
     @property
     def name(self) -> str: ...
 
@@ -31,24 +543,54 @@ class TranscriberBackend(Protocol):
 class WhisperBackend:
     """Wraps faster-whisper for local CPU transcription."""
 
-    def __init__(self, model_size: str = DEFAULT_MODEL):
+    def __init__(self, model_size: str = DEFAULT_MODEL, pool: ModelPool | None = None,
+                 profile: str = DEFAULT_DECODE_PROFILE, workers: int = 1,
+                 cache: TranscriptCache | None = None):
+        """*workers* > 1 decodes dictations longer than ``_CHUNK_MIN_S`` as
+        parallel chunks, with that many model workers sharing the CPU cores.
+        With a *cache*, text transcripts are looked up there before decoding.
+        """
+        self._cache = cache
         self._model_size = model_size
+        self._workers = max(1, workers)
         self._model = None
+        self._pool = pool if pool is not None else _model_pool
+        if profile not in DECODE_PROFILES:
+            log.warning("Unknown decode profile %r; using %s", profile, DEFAULT_DECODE_PROFILE)
+            profile = DEFAULT_DECODE_PROFILE
+        self._profile = profile
 
     @property
     def name(self) -> str:
         return "whisper"
 
+    @property
+    def profile(self) -> str:
+        return self._profile
+
+    def _model_options(self) -> dict:
+        p = DECODE_PROFILES[self._profile]
+        cpu_threads = p["cpu_threads"]
+        if self._workers > 1 and cpu_threads == 0:
+            # Split the cores between workers instead of oversubscribing.
+            cpu_threads = max(1, (os.cpu_count() or 1) // self._workers)
+        return {
+            "device": "cpu",
+            "compute_type": p["compute_type"],
+            "cpu_threads": cpu_threads,
+            "num_workers": max(p["num_workers"], self._workers),
+        }
+
     def load(self) -> None:
-        from faster_whisper import WhisperModel
+        self._model = self._pool.get(self._model_size, **self._model_options())
 
-        log.info("Loading Whisper model %s ...", self._model_size)
-        self._model = WhisperModel(
-            self._model_size,
-            device="cpu",
-            compute_type="int8",
-        )
-        log.info("Whisper model loaded.")
+    def preload(self) -> None:
+        """Start loading this backend's model in the background."""
+        self._pool.preload(self._model_size, **self._model_options())
+
+    def is_resident(self) -> bool:
+        """True if load() would return immediately."""
+        return self._pool.is_loaded(self._model_size, **self._model_options())
 
     def transcribe(self, audio: np.ndarray, **kwargs) -> str:
         if self._model is None:
@@ -56,22 +598,344 @@ class WhisperBackend:
 
         initial_prompt = kwargs.get("initial_prompt") or None
         word_timestamps = kwargs.get("word_timestamps", False)
+        return_segments = word_timestamps and kwargs.get("_return_segments")
+
+        chunked = not word_timestamps and self._chunks(audio)
+        key = None
+        if self._cache is not None and not return_segments:
+            key = TranscriptCache.fingerprint(
+                audio, self._model_size, self._profile, initial_prompt or "",
+                "text", self._decode_mode(chunked),
+            )
+            text = self._cache.get(key)
+            if text is not None:
+                return text
+
+        if chunked:
+            text = self._decode_chunked(audio, initial_prompt).text
+        else:
+            segment_list = self._decode(audio, initial_prompt, word_timestamps)
+
+            # If word_timestamps requested, return segments for confidence analysis
+            if return_segments:
+                return segment_list
+
+            text = " ".join(segment.text.strip() for segment in segment_list)
+
+        if key is not None:
+            self._cache.put(key, text)
+        return text
+
+    def transcribe_result(self, audio: np.ndarray, initial_prompt: str | None = None,
+                          word_timestamps: bool = True) -> Transcript:
+        """Decode once and return text, segments and per-word confidence.
+
+        Long audio goes through the chunked path when ``workers`` > 1.
+        """
+        if self._model is None:
+            self.load()
+        initial_prompt = initial_prompt or None
+
+        chunked = self._chunks(audio)
+        key = None
+        if self._cache is not None:
+            key = TranscriptCache.fingerprint(
+                audio, self._model_size, self._profile, initial_prompt or "",
+                "words" if word_timestamps else "segments", self._decode_mode(chunked),
+            )
+            result = self._cache.get(key)
+            if result is not None:
+                return result
+
+        if chunked:
+            result = self._decode_chunked(audio, initial_prompt, word_timestamps)
+        else:
+            result = self._decode_result(audio, initial_prompt, word_timestamps)
+        if key is not None:
+            self._cache.put(key, result)
+        return result
+
+    def start_stream(
+        self, prompt_factory: Callable[[], str] | None = None,
+        preprocess: Callable[[np.ndarray], "TrimResult"] | None = None,
+        word_timestamps: bool = False,
+    ) -> "StreamingTranscription":
+        """Begin a streaming session fed with recorder blocks."""
+        if self._model is None:
+            self.load()
+        return StreamingTranscription(
+            lambda audio, prompt: self._decode_result(audio, prompt, word_timestamps),
+            prompt_factory=prompt_factory, preprocess=preprocess,
+            cache=self._cache,
+            cache_parts=(
+                self._model_size, self._profile,
+                "words" if word_timestamps else "segments",
+                "stream-preprocessed" if preprocess is not None else "stream",
+            ),
+        )
+
+    def _chunks(self, audio: np.ndarray) -> bool:
+        """True if *audio* is long enough to decode as parallel chunks."""
+        return self._workers > 1 and len(audio) > _CHUNK_MIN_S * SAMPLE_RATE
+
+    def _decode_mode(self, chunked: bool) -> str:
+        # Chunk boundaries change the text, so chunked results are keyed apart.
+        return f"chunked-{self._workers}" if chunked else "single"
 
+    def _decode(self, audio: np.ndarray, initial_prompt: str | None,
+                word_timestamps: bool = False) -> list:
+        p = DECODE_PROFILES[self._profile]
         segments, _ = self._model.transcribe(
             audio,
-            beam_size=5,
+            beam_size=p["beam_size"],
+            best_of=p["best_of"],
+            temperature=list(p["temperature"]),
             language="en",
             vad_filter=True,
             initial_prompt=initial_prompt,
             word_timestamps=word_timestamps,
         )
-        segment_list = list(segments)
+        return list(segments)
 
-        # If word_timestamps requested, return segments for confidence analysis
-        if word_timestamps and kwargs.get("_return_segments"):
-            return segment_list
+    def _decode_result(self, audio: np.ndarray, initial_prompt: str | None,
+                       word_timestamps: bool = False) -> Transcript:
+        return Transcript.from_segments(self._decode(audio, initial_prompt or None, word_timestamps))
 
-        return " ".join(segment.text.strip() for segment in segment_list)
+    def _decode_chunked(self, audio: np.ndarray, initial_prompt: str | None,
+                        word_timestamps: bool = False) -> Transcript:
+        """Decode *audio* as chunks on ``self._workers`` threads and stitch them."""
+        spans = _split_chunks(audio)
+        with ThreadPoolExecutor(max_workers=self._workers,
+                                thread_name_prefix="muttr-decode") as executor:
+            parts = list(executor.map(
+                lambda span: self._decode_result(
+                    audio[span[0]:span[1]], initial_prompt, word_timestamps,
+                ).shifted(span[0] / SAMPLE_RATE),
+                spans,
+            ))
+        stitched = [parts[0]]
+        for prev, span, part in zip(spans, spans[1:], parts[1:]):
+            if span[0] < prev[1]:
+                left = " ".join(p.text for p in stitched if p.text)
+                part = part.without_leading_words(_repeated_prefix_len(left, part.text))
+            stitched.append(part)
+        return Transcript.join(stitched)
+
+
+# ---------------------------------------------------------------------------
+# Streaming transcription
+# ---------------------------------------------------------------------------
+
+def _find_silence_cut(audio: np.ndarray, lo: int, hi: int) -> int | None:
+    """Return the sample index in the middle of the last pause in audio[lo:hi].
+
+    A pause is at least ``_SILENCE_MIN_FRAMES`` consecutive frames whose RMS
+    (``cadence.frame_rms``) is below ``cadence.RMS_FLOOR``.  Returns None if
+    there is no such pause.
+    """
+    if (hi - lo) // _SILENCE_FRAME < _SILENCE_MIN_FRAMES:
+        return None
+    rms = frame_rms(audio[lo:hi], _SILENCE_FRAME)
+    silent = np.concatenate(([0], (rms < RMS_FLOOR).astype(np.int8), [0]))
+    edges = np.diff(silent)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    long_runs = np.flatnonzero(ends - starts >= _SILENCE_MIN_FRAMES)
+    if len(long_runs) == 0:
+        return None
+    run = long_runs[-1]
+    mid_frame = (starts[run] + ends[run]) // 2
+    return lo + int(mid_frame) * _SILENCE_FRAME
+
+
+def _split_chunks(audio: np.ndarray) -> list[tuple[int, int]]:
+    """Split *audio* into ``(start, end)`` windows for parallel decoding.
+
+    Each window is at most ``_CHUNK_WINDOW_S`` long and ends in the last
+    pause of its second half.  Without a pause it is cut hard and the next
+    window starts ``_CHUNK_OVERLAP_S`` earlier.
+    """
+    n = len(audio)
+    window = int(_CHUNK_WINDOW_S * SAMPLE_RATE)
+    overlap = int(_CHUNK_OVERLAP_S * SAMPLE_RATE)
+    spans = []
+    start = 0
+    while start < n:
+        hi = start + window
+        if hi >= n:
+            spans.append((start, n))
+            break
+        cut = _find_silence_cut(audio, start + window // 2, hi)
+        if cut is not None:
+            spans.append((start, cut))
+            start = cut
+        else:
+            spans.append((start, hi))
+            start = hi - overlap
+    return spans
+
+
+def _repeated_prefix_len(left: str, right: str) -> int:
+    """Number of leading words of *right* that repeat the end of *left*."""
+    def norm(words):
+        return [w.strip(".,!?;:\"'").lower() for w in words]
+
+    left_words = norm(left.split()[-_CHUNK_MAX_OVERLAP_WORDS:])
+    right_norm = norm(right.split()[:_CHUNK_MAX_OVERLAP_WORDS])
+    for k in range(min(len(left_words), len(right_norm)), 0, -1):
+        if left_words[-k:] == right_norm[:k]:
+            return k
+    return 0
+
+
+def _drop_repeated_prefix(left: str, right: str) -> str:
+    """Return *right* without leading words that repeat the end of *left*."""
+    k = _repeated_prefix_len(left, right)
+    return " ".join(right.split()[k:]) if k else right
+
+
+class StreamingTranscription:
+    """Decodes committed segments in the background while recording.
+
+    ``feed()`` is called from the audio thread with each recorder block and
+    only appends to a deque.  A worker thread periodically looks for a pause
+    in the pending audio and decodes everything up to it, so when the user
+    releases fn, ``finish()`` only has to decode the short uncommitted tail.
+    *decode* returns a ``Transcript`` per segment; word times are moved to
+    the segment's offset in the recording.  *preprocess*, if given, trims
+    each committed segment before it is decoded and returns a
+    ``muttr.vad.TrimResult``, whose offset map puts word times back on the
+    untrimmed recording.
+
+    With a *cache*, ``finish()`` looks the whole recording up under its
+    fingerprint plus *cache_parts* and the initial prompt.  A hit skips
+    decoding the tail, and a miss stores the finished transcript.
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[np.ndarray, str | None], Transcript],
+        prompt_factory: Callable[[], str] | None = None,
+        preprocess: Callable[[np.ndarray], "TrimResult"] | None = None,
+        cache: TranscriptCache | None = None,
+        cache_parts: tuple = (),
+    ):
+        self._decode = decode
+        self._prompt_factory = prompt_factory
+        self._preprocess = preprocess
+        self._cache = cache
+        self._cache_parts = cache_parts
+        self._hash = TranscriptCache.hasher() if cache is not None else None
+        self._initial_prompt: str | None = None
+        self._blocks: collections.deque[np.ndarray] = collections.deque()
+        self._pending = np.empty(0, dtype=np.float32)
+        self._parts: list[Transcript] = []
+        self._committed_samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="muttr-stream", daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def committed_seconds(self) -> float:
+        """Audio already decoded in the background, in seconds."""
+        return self._committed_samples / SAMPLE_RATE
+
+    def feed(self, block: np.ndarray) -> None:
+        """Queue a block of float32 mono samples.  Safe to call from the audio thread."""
+        self._blocks.append(block)
+
+    def finish(self) -> Transcript:
+        """Stop the worker, decode the remaining tail and return the full transcript."""
+        self._stop.set()
+        self._thread.join()
+        self._drain()
+        key = None
+        if self._cache is not None:
+            key = TranscriptCache.finish_fingerprint(
+                self._hash, *self._cache_parts, self._initial_prompt_text(),
+            )
+            cached = self._cache.get(key)
+            if isinstance(cached, Transcript):
+                return cached
+        if len(self._pending) >= SAMPLE_RATE // 10:
+            self._commit(len(self._pending))
+        result = Transcript.join(self._parts)
+        if key is not None:
+            self._cache.put(key, result)
+        return result
+
+    def cancel(self) -> None:
+        """Abandon the session without decoding the tail."""
+        self._stop.set()
+
+    # -- worker ---------------------------------------------------------
+
+    def _run(self) -> None:
+        while not self._stop.wait(_STREAM_POLL_S):
+            self._drain()
+            cut = self._next_cut()
+            if cut is None:
+                continue
+            try:
+                self._commit(cut)
+            except Exception as exc:
+                # Leave the audio pending; finish() will retry it with the tail.
+                log.warning("Streaming segment decode failed: %s", exc)
+                return
+
+    def _drain(self) -> None:
+        blocks = []
+        while self._blocks:
+            blocks.append(self._blocks.popleft())
+        if blocks:
+            if self._hash is not None:
+                for block in blocks:
+                    TranscriptCache.update_hasher(self._hash, block)
+            self._pending = np.concatenate([self._pending, *blocks])
+
+    def _next_cut(self) -> int | None:
+        n = len(self._pending)
+        if n < int(_STREAM_MIN_COMMIT_S * SAMPLE_RATE):
+            return None
+        hi = n - int(_STREAM_TAIL_GUARD_S * SAMPLE_RATE)
+        cut = _find_silence_cut(self._pending, 0, hi)
+        if cut is not None and cut >= SAMPLE_RATE:
+            return cut
+        max_window = int(_STREAM_MAX_WINDOW_S * SAMPLE_RATE)
+        if n >= max_window:
+            return max_window
+        return None
+
+    def _commit(self, cut: int) -> None:
+        segment = self._pending[:cut]
+        trim = None
+        if self._preprocess is not None:
+            trim = self._preprocess(segment)
+            segment = trim.audio
+        part = self._decode(segment, self._prompt())
+        if trim is not None:
+            part = part.mapped(trim.to_original_times)
+        self._parts.append(part.shifted(self._committed_samples / SAMPLE_RATE))
+        self._pending = self._pending[cut:]
+        self._committed_samples += cut
+
+    def _prompt(self) -> str | None:
+        if self._parts:
+            text = " ".join(p.text.strip() for p in self._parts if p.text.strip())
+            return text[-_STREAM_PROMPT_CHARS:] or None
+        return self._initial_prompt_text() or None
+
+    def _initial_prompt_text(self) -> str:
+        if self._initial_prompt is None:
+            self._initial_prompt = ""
+            if self._prompt_factory is not None:
+                try:
+                    self._initial_prompt = self._prompt_factory() or ""
+                except Exception:
+                    pass
+        return self._initial_prompt
 
 
 # ---------------------------------------------------------------------------
@@ -95,6 +959,14 @@ class Transcriber:
     def transcribe(self, audio: np.ndarray, **kwargs) -> str:
         return self._backend.transcribe(audio, **kwargs)
 
+    def transcribe_result(self, audio: np.ndarray, **kwargs) -> Transcript:
+        return self._backend.transcribe_result(audio, **kwargs)
+
+    def start_stream(
+        self, prompt_factory: Callable[[], str] | None = None, **kwargs,
+    ) -> StreamingTranscription:
+        return self._backend.start_stream(prompt_factory=prompt_factory, **kwargs)
+
     @property
     def name(self) -> str:
         return self._backend.name
@@ -107,6 +979,16 @@ class Transcriber:
 def create_transcriber(
     engine: str = "whisper",
     model_size: str = DEFAULT_MODEL,
+    profile: str = DEFAULT_DECODE_PROFILE,
+    workers: int = 1,
+    cache: bool = True,
 ) -> TranscriberBackend:
-    """Create a Whisper transcription backend."""
-    return WhisperBackend(model_size=model_size)
+    """Create a Whisper transcription backend using the named decode profile.
+
+    *workers* > 1 enables parallel chunked decoding of long dictations.
+    With *cache* the backend shares the process-wide transcript cache.
+    """
+    return WhisperBackend(
+        model_size=model_size, profile=profile, workers=workers,
+        cache=transcript_cache() if cache else None,
+    )
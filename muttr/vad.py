@@ -0,0 +1,97 @@
+"""Energy-based voice-activity trimming before transcription.
+
+Drops leading and trailing silence and shortens long internal pauses so
+Whisper decodes fewer samples.  Frame energy is ``cadence.frame_rms``
+compared against the cadence pause floor.  ``TrimResult`` keeps the mapping
+from trimmed to original sample offsets so word timestamps can be mapped
+back onto the recording.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from muttr.cadence import RMS_FLOOR, frame_rms
+
+SAMPLE_RATE = 16000
+FRAME_LEN = 480  # 30 ms
+# Silence kept on either side of speech, so word onsets and decays survive.
+PAD_MS = 200
+# Internal pauses longer than this are cut down to 2 * PAD_MS.
+MAX_PAUSE_MS = 600
+
+
+@dataclass
+class TrimResult:
+    """Trimmed audio plus the original ``[start, end)`` sample range of each kept span."""
+
+    audio: np.ndarray
+    spans: np.ndarray  # (n, 2) int64 original sample offsets
+    original_length: int
+
+    @property
+    def trimmed(self) -> bool:
+        return len(self.audio) != self.original_length
+
+    def to_original(self, sample):
+        """Map a sample offset (or array of offsets) in ``audio`` to the original recording."""
+        if len(self.spans) == 0:
+            return sample
+        lengths = self.spans[:, 1] - self.spans[:, 0]
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        i = np.maximum(np.searchsorted(starts, sample, side="right") - 1, 0)
+        mapped = self.spans[i, 0] + (sample - starts[i])
+        return int(mapped) if np.ndim(mapped) == 0 else mapped
+
+    def to_original_time(self, seconds: float) -> float:
+        """Map a time in ``audio`` (e.g. a word timestamp) to the original."""
+        return self.to_original(int(round(seconds * SAMPLE_RATE))) / SAMPLE_RATE
+
+    def to_original_times(self, seconds: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`to_original_time`, e.g. for a transcript's word starts."""
+        samples = np.rint(np.asarray(seconds, dtype=np.float64) * SAMPLE_RATE).astype(np.int64)
+        return self.to_original(samples) / SAMPLE_RATE
+
+
+def _runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return (starts, ends) of the True runs in *mask*."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def trim_silence(audio: np.ndarray, floor: float = RMS_FLOOR,
+                 pad_ms: int = PAD_MS, max_pause_ms: int = MAX_PAUSE_MS) -> TrimResult:
+    """Return *audio* without leading/trailing silence and with long pauses shortened.
+
+    If no frame rises above *floor* the audio is returned untouched, leaving
+    the decision to Whisper's own VAD rather than discarding quiet speech.
+    """
+    n = len(audio)
+    untouched = TrimResult(audio, np.array([[0, n]], dtype=np.int64), n)
+    rms = frame_rms(audio, FRAME_LEN)
+    voiced = rms >= floor
+    if not voiced.any():
+        return untouched
+
+    pad = max(1, pad_ms * SAMPLE_RATE // 1000 // FRAME_LEN)
+    max_gap = max_pause_ms * SAMPLE_RATE // 1000 // FRAME_LEN
+    starts, ends = _runs(voiced)
+
+    # Bridge pauses short enough to keep, then pad what remains.
+    gaps = starts[1:] - ends[:-1]
+    keep = np.concatenate(([True], gaps > max_gap))
+    span_starts = np.maximum(starts[keep] - pad, 0)
+    span_ends = np.minimum(ends[np.concatenate((keep[1:], [True]))] + pad, len(rms))
+    span_starts[1:] = np.maximum(span_starts[1:], span_ends[:-1])  # padding must not overlap
+
+    spans = np.stack((span_starts, span_ends), axis=1).astype(np.int64) * FRAME_LEN
+    # The partial frame after the last whole frame goes with a span touching the end.
+    if spans[-1, 1] == len(rms) * FRAME_LEN:
+        spans[-1, 1] = n
+    if len(spans) == 1 and spans[0, 0] == 0 and spans[0, 1] == n:
+        return untouched
+    if len(spans) == 1:
+        trimmed = audio[spans[0, 0]:spans[0, 1]]
+    else:
+        trimmed = np.concatenate([audio[s:e] for s, e in spans])
+    return TrimResult(trimmed, spans, n)
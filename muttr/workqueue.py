@@ -0,0 +1,75 @@
+"""Ordered background queue for side effects that must not delay insertion."""
+
+import logging
+import queue
+import threading
+
+log = logging.getLogger(__name__)
+
+
+class WorkQueue:
+    """Runs submitted callables one at a time, in submission order, on a
+    single daemon thread.
+
+    A job that raises is logged and does not stop later jobs.  Call
+    ``shutdown()`` before the process exits so queued work is not lost.
+    """
+
+    def __init__(self, name: str = "muttr-work"):
+        self._name = name
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, fn, *args, **kwargs) -> None:
+        """Queue ``fn(*args, **kwargs)``.  After shutdown it runs inline."""
+        with self._lock:
+            if not self._closed:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name=self._name, daemon=True,
+                    )
+                    self._thread.start()
+                self._queue.put((fn, args, kwargs))
+                return
+        self._call(fn, args, kwargs)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until everything submitted so far has run.
+
+        Returns False if *timeout* expired first.
+        """
+        with self._lock:
+            if self._thread is None or self._closed:
+                return True
+            done = threading.Event()
+            self._queue.put((done.set, (), {}))
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float | None = 5.0) -> bool:
+        """Drain queued work, then stop the worker thread."""
+        flushed = self.flush(timeout)
+        with self._lock:
+            if self._closed:
+                return flushed
+            self._closed = True
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(None)
+        if thread is not None and flushed:
+            thread.join(timeout)
+        return flushed
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            self._call(*job)
+
+    def _call(self, fn, args, kwargs) -> None:
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            log.exception("Background job %r failed", getattr(fn, "__name__", fn))
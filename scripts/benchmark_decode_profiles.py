@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Report Whisper real-time factor (RTF) for each decode profile.
+
+Decodes every 16 kHz mono 16-bit WAV file in a corpus directory with each
+profile in ``muttr.transcriber.DECODE_PROFILES`` and prints the total
+decode time, audio duration and RTF (decode time / audio time; lower is
+faster).  Run from the repository root:
+
+    python scripts/benchmark_decode_profiles.py path/to/corpus --model base.en
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from muttr.bench import load_wav_corpus  # noqa: E402
+from muttr.transcriber import (  # noqa: E402
+    DECODE_PROFILES,
+    DEFAULT_MODEL,
+    SAMPLE_RATE,
+    ModelPool,
+    WhisperBackend,
+)
+
+
+def bench_profile(profile, model_size, corpus, repeat):
+    # A private pool per profile so each is measured with only its own model
+    # resident, and model load time is excluded by the warm-up decode.
+    backend = WhisperBackend(model_size, pool=ModelPool(), profile=profile)
+    backend.load()
+    backend.transcribe(corpus[0][1])
+
+    audio_s = sum(len(audio) for _, audio in corpus) / SAMPLE_RATE * repeat
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for _, audio in corpus:
+            backend.transcribe(audio)
+    decode_s = time.perf_counter() - started
+    return {
+        "profile": profile,
+        "model": model_size,
+        "audio_s": round(audio_s, 2),
+        "decode_s": round(decode_s, 3),
+        "rtf": round(decode_s / audio_s, 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", help="directory of 16 kHz mono WAV files")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--profiles", nargs="+", default=list(DECODE_PROFILES),
+                        choices=list(DECODE_PROFILES))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    corpus = load_wav_corpus(args.corpus)
+    if not corpus:
+        parser.error(f"no usable WAV files in {args.corpus}")
+
+    results = [bench_profile(p, args.model, corpus, args.repeat) for p in args.profiles]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'profile':<10} {'audio s':>9} {'decode s':>9} {'RTF':>7}")
+    for r in results:
+        print(f"{r['profile']:<10} {r['audio_s']:>9.2f} {r['decode_s']:>9.3f} {r['rtf']:>7.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ setup(
         "pyobjc-core>=10.0",
         "pyobjc-framework-Cocoa>=10.0",
         "pyobjc-framework-Quartz>=10.0",
+        "pyobjc-framework-Security>=10.0",
     ],
     entry_points={
         "console_scripts": [
@@ -184,3 +184,36 @@ class TestAccountPreferences:
     def test_add_custom_preference(self):
         acct = update_preferences({"custom_pref": "value"})
         assert acct["preferences"]["custom_pref"] == "value"
+
+
+class TestAccountSnapshot:
+    def setup_method(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self._account_path = os.path.join(self._tmpdir, "account.json")
+        self._patch_dir = patch("muttr.config.APP_SUPPORT_DIR", self._tmpdir)
+        self._patch_path = patch("muttr.account.ACCOUNT_PATH", self._account_path)
+        self._patch_dir.start()
+        self._patch_path.start()
+
+    def teardown_method(self):
+        self._patch_dir.stop()
+        self._patch_path.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_repeat_loads_do_not_reparse(self):
+        update_preferences({"auto_copy": False})
+        with patch("muttr.account._read") as read:
+            assert load_account()["preferences"]["auto_copy"] is False
+            load_account()
+        read.assert_not_called()
+
+    def test_picks_up_external_change(self):
+        load_account()
+        with open(self._account_path, "w") as f:
+            json.dump({"email": "edited@example.com"}, f)
+        assert load_account()["email"] == "edited@example.com"
+
+    def test_snapshot_is_not_shared_with_callers(self):
+        save_account(load_account())
+        load_account()["preferences"]["auto_copy"] = False
+        assert load_account()["preferences"]["auto_copy"] is True
@@ -0,0 +1,79 @@
+"""Tests for muttr.bench -- pipeline benchmark harness."""
+
+import json
+import os
+import shutil
+import tempfile
+import wave
+from unittest.mock import patch
+
+import numpy as np
+
+from muttr import bench, history
+from muttr.transcriber import SAMPLE_RATE
+
+
+class TestPercentiles:
+    def test_reports_milliseconds(self):
+        stats = bench.percentiles([0.001 * i for i in range(1, 101)])
+        assert stats["count"] == 100
+        assert abs(stats["p50_ms"] - 50.5) < 1e-6
+        assert stats["p95_ms"] <= stats["p99_ms"] <= 100.0
+
+    def test_empty(self):
+        assert bench.percentiles([]) == {"count": 0}
+
+
+class TestCorpus:
+    def setup_method(self):
+        self._tmpdir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _write_wav(self, name, samples, rate=SAMPLE_RATE):
+        with wave.open(os.path.join(self._tmpdir, name), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(rate)
+            wav.writeframes(samples.astype(np.int16).tobytes())
+
+    def test_loads_16k_mono_wav_as_float32(self):
+        self._write_wav("a.wav", np.full(1600, 16384))
+        corpus = bench.load_wav_corpus(self._tmpdir)
+        assert [name for name, _ in corpus] == ["a.wav"]
+        assert corpus[0][1].dtype == np.float32
+        assert np.allclose(corpus[0][1], 0.5)
+
+    def test_skips_other_sample_rates(self):
+        self._write_wav("b.wav", np.zeros(800), rate=8000)
+        assert bench.load_wav_corpus(self._tmpdir) == []
+
+    def test_synthetic_corpus_durations(self):
+        corpus = bench.synthetic_corpus(durations=(1.0, 2.5))
+        assert [len(a) for _, a in corpus] == [SAMPLE_RATE, int(2.5 * SAMPLE_RATE)]
+
+
+class TestRun:
+    def test_text_stages_without_transcription(self):
+        db_path = history.DB_PATH
+        report = bench.run(bench.synthetic_corpus(durations=(1.0,)), repeat=2,
+                           transcribe=False)
+        assert report["stages"]["cleanup"]["count"] == 2
+        assert report["stages"]["history"]["count"] == 2
+        assert report["stages"]["transcribe"]["count"] == 0
+        assert report["rtf"] is None
+        assert report["peak_rss_mb"] > 0
+        assert history.DB_PATH == db_path
+
+    def test_main_writes_json(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            out = os.path.join(tmpdir, "bench.json")
+            with patch("builtins.print"):
+                bench.main(["--no-transcribe", "--repeat", "1", "--output", out])
+            with open(out) as f:
+                report = json.load(f)
+            assert set(report["stages"]) == set(bench.STAGES)
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
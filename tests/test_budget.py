@@ -0,0 +1,72 @@
+"""Tests for muttr.budget -- daily word budget with 7-day rollover."""
+
+import os
+import shutil
+import tempfile
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from muttr import budget
+
+
+class TestBudgetLedger:
+    def setup_method(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self._patches = [
+            patch("muttr.budget.APP_SUPPORT_DIR", self._tmpdir),
+            patch("muttr.budget.DB_PATH", os.path.join(self._tmpdir, "budget.db")),
+            patch("muttr.license.get_daily_word_limit", return_value=1000),
+        ]
+        for p in self._patches:
+            p.start()
+        budget._reset_ledger()
+
+    def teardown_method(self):
+        for p in self._patches:
+            p.stop()
+        budget._reset_ledger()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _set_usage(self, days_ago, words):
+        conn = budget._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO word_usage (date, words_used) VALUES (?, ?)",
+                ((date.today() - timedelta(days=days_ago)).isoformat(), words),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def test_fresh_install_has_daily_limit(self):
+        assert budget.words_remaining_today() == 1000
+
+    def test_rollover_only_counts_recorded_days(self):
+        self._set_usage(1, 400)    # 600 unused
+        self._set_usage(3, 1200)   # over the limit, no rollover
+        self._set_usage(8, 0)      # outside the window
+        assert budget.words_remaining_today() == 1600
+
+    def test_record_usage_updates_ledger_without_reload(self):
+        assert budget.words_remaining_today() == 1000
+        with patch("muttr.budget._load_window") as load:
+            budget.record_usage(250)
+            budget.record_usage(50)
+            assert budget.words_remaining_today() == 700
+            assert budget.get_today_usage() == 300
+            load.assert_not_called()
+
+    def test_usage_is_persisted(self):
+        budget.record_usage(100)
+        budget._reset_ledger()
+        assert budget.get_today_usage() == 100
+
+    def test_single_license_lookup(self):
+        with patch("muttr.license.get_daily_word_limit", return_value=500) as limit:
+            budget.words_remaining_today()
+        assert limit.call_count == 1
+
+    def test_unlimited_tier(self):
+        with patch("muttr.license.get_daily_word_limit", return_value=None):
+            assert budget.words_remaining_today() is None
+            assert not budget.is_over_budget()
@@ -1,8 +1,11 @@
 """Tests for muttr.cleanup — proper nouns, lists, paragraphs, slider levels."""
 
+from unittest.mock import patch
+
 import pytest
 from muttr.cleanup import (
     clean_text,
+    clean_texts,
     add_proper_nouns,
     CUSTOM_PROPER_NOUNS,
     _capitalize_proper_nouns,
@@ -11,7 +14,14 @@ from muttr.cleanup import (
     _format_numbered_list,
     _has_bullet_markers,
     _has_numbered_markers,
+    _folded_words,
+    _match_phrase,
+    _phrase_trie,
     _rebuild_proper_noun_map,
+    _remove_false_starts,
+    _remove_fillers,
+    _remove_repeated_words,
+    _tokenize,
 )
 
 
@@ -119,12 +129,81 @@ class TestProperNouns:
         CUSTOM_PROPER_NOUNS.clear()
         _rebuild_proper_noun_map()
 
+    def test_custom_multi_word_proper_noun(self):
+        add_proper_nouns({"acme widgets": "ACME Widgets"})
+        result = clean_text("we ordered from acme widgets again", level=0)
+        assert "ACME Widgets" in result
+        CUSTOM_PROPER_NOUNS.clear()
+        _rebuild_proper_noun_map()
+
+    def test_longest_multi_word_noun_wins(self):
+        add_proper_nouns({"new york city": "New York City"})
+        result = clean_text("i love new york city", level=0)
+        assert "New York City" in result
+        CUSTOM_PROPER_NOUNS.clear()
+        _rebuild_proper_noun_map()
+
     def test_preserves_already_correct_casing(self):
         result = clean_text("I love iPhone and macOS", level=0)
         assert "iPhone" in result
         assert "macOS" in result
 
 
+    def test_multi_word_noun_needs_whole_words(self):
+        assert clean_text("we renew yorkshire leases", level=0) == "We renew yorkshire leases."
+
+    def test_joined_words_are_looked_up_whole(self):
+        assert "Wi-Fi" in clean_text("the wi-fi is down", level=0)
+        assert "john's" in clean_text("it is john's turn", level=0)
+        assert "John-" not in clean_text("ask mary-john", level=0)
+
+    def test_value_with_punctuation(self):
+        assert "Node.js" in clean_text("we use nodejs here", level=0)
+
+
+class TestPhraseTrie:
+    def test_nests_words_and_separators(self):
+        assert _phrase_trie({"new york": 1, "new jersey": 2}) == {
+            "new": {" ": {"york": {None: 1}, "jersey": {None: 2}}},
+        }
+
+    def test_prefers_longest_phrase(self):
+        trie = _phrase_trie({"new york": 1, "new york city": 2})
+        parts = _tokenize("in New York City now")
+        assert _match_phrase(trie, parts, _folded_words(parts), 1) == (3, 2)
+        parts = _tokenize("new york state")
+        assert _match_phrase(trie, parts, _folded_words(parts), 0) == (1, 1)
+
+    def test_separator_must_match(self):
+        trie = _phrase_trie({"new york": 1})
+        parts = _tokenize("new, york")
+        assert _match_phrase(trie, parts, _folded_words(parts), 0) is None
+
+
+class TestTokenStages:
+    def _run(self, stage, text):
+        return "".join(stage(_tokenize(text)))
+
+    def test_repeated_words_need_whitespace_between(self):
+        assert self._run(_remove_repeated_words, "the The the cat") == "the cat"
+        assert self._run(_remove_repeated_words, "the, the cat") == "the, the cat"
+        assert self._run(_remove_repeated_words, "the theory") == "the theory"
+
+    def test_fillers_take_adjoining_commas(self):
+        assert self._run(_remove_fillers, "so, um, we left") == "so we left"
+        assert self._run(_remove_fillers, "I mean it") == " it"
+        assert self._run(_remove_fillers, "you  know it") == "you  know it"
+
+    def test_like_kept_after_keepers(self):
+        assert self._run(_remove_fillers, "it looks LIKE rain") == "it looks like rain"
+        assert self._run(_remove_fillers, "it was like, big") == "it was big"
+
+    def test_false_starts_keep_first_copy(self):
+        assert self._run(_remove_false_starts, "I was I was going") == "I was going"
+        assert self._run(_remove_false_starts, "I  was I was going") == "I  was I was going"
+        assert self._run(_remove_false_starts, "go go now") == "go now"
+
+
 # ── paragraph and line break commands ────────────────────────────────────────
 
 class TestParagraphCommands:
@@ -414,6 +493,47 @@ class TestMixedFormatting:
         assert "basically" not in result.lower()
 
 
+# ── batch API ────────────────────────────────────────────────────────────────
+
+class TestCleanTexts:
+    _TEXTS = [
+        "um i met sarah on monday",
+        "the the api is down",
+        "",
+        "bullet one eggs bullet two milk",
+    ] * 10
+
+    def test_inline_matches_clean_text(self):
+        expected = [clean_text(t, level=1) for t in self._TEXTS]
+        assert list(clean_texts(self._TEXTS, level=1, workers=1)) == expected
+
+    def test_process_pool_preserves_order(self):
+        expected = [clean_text(t, level=2) for t in self._TEXTS]
+        result = list(clean_texts(iter(self._TEXTS), level=2, workers=2, chunk_size=3))
+        assert result == expected
+
+    def test_workers_see_custom_proper_nouns(self):
+        add_proper_nouns({"muttr": "MuttR"})
+        try:
+            result = list(clean_texts(["i love muttr"] * 4, level=0, workers=2, chunk_size=1))
+        finally:
+            CUSTOM_PROPER_NOUNS.clear()
+            _rebuild_proper_noun_map()
+        assert result == ["I love MuttR."] * 4
+
+    def test_frozen_bundle_cleans_in_process(self):
+        expected = [clean_text(t, level=1) for t in self._TEXTS]
+        with patch("sys.frozen", True, create=True), \
+                patch("muttr.cleanup.ProcessPoolExecutor") as pool:
+            assert list(clean_texts(self._TEXTS, level=1, workers=4)) == expected
+        pool.assert_not_called()
+
+    def test_progress_counts_cleaned_texts(self):
+        seen = []
+        list(clean_texts(self._TEXTS, workers=1, chunk_size=15, progress=seen.append))
+        assert seen == [15, 30, 40]
+
+
 # ── edge cases ───────────────────────────────────────────────────────────────
 
 class TestEdgeCases:
@@ -7,6 +7,7 @@ from muttr.confidence import (
     WordInfo,
     TranscriptionResult,
     extract_word_confidence,
+    low_confidence_words,
     should_show_review,
     TIER_HIGH,
     TIER_MEDIUM,
@@ -166,6 +167,21 @@ class TestExtractWordConfidence:
         assert len(result) == 2
 
 
+class TestLowConfidenceWords:
+    def test_reads_transcript_arrays(self):
+        from muttr.transcriber import Transcript
+        w1 = MagicMock(word=" hello", start=0.0, end=0.5, probability=0.95)
+        w2 = MagicMock(word=" wrold", start=0.5, end=1.0, probability=0.2)
+        w3 = MagicMock(word=" there", start=1.0, end=1.4, probability=0.6)
+        seg = MagicMock(text=" hello wrold there", words=[w1, w2, w3], avg_logprob=-0.3)
+
+        assert low_confidence_words(Transcript.from_segments([seg])) == ["wrold", "there"]
+
+    def test_text_only_transcript(self):
+        from muttr.transcriber import Transcript
+        assert low_confidence_words(Transcript(text="hi")) == []
+
+
 # -- should_show_review tests ---
 
 
@@ -108,6 +108,12 @@ class TestConfigLoad:
         cfg = load()
         assert cfg["transcription_engine"] == "whisper"
 
+    def test_load_validates_invalid_decode_profile(self):
+        with open(self._config_path, "w") as f:
+            json.dump({"decode_profile": "ludicrous"}, f)
+        cfg = load()
+        assert cfg["decode_profile"] == DEFAULTS["decode_profile"]
+
     def test_load_rejects_removed_engine_parakeet(self):
         with open(self._config_path, "w") as f:
             json.dump({"transcription_engine": "parakeet"}, f)
@@ -235,3 +241,60 @@ class TestConfigEdgeCases:
              patch("muttr.config.CONFIG_PATH", nested_path):
             cfg = load()
             assert os.path.isdir(nested_dir)
+
+
+class TestConfigCache:
+    def setup_method(self):
+        from muttr import events
+
+        self._tmpdir = tempfile.mkdtemp()
+        self._config_path = os.path.join(self._tmpdir, "config.json")
+        self._patch_dir = patch("muttr.config.APP_SUPPORT_DIR", self._tmpdir)
+        self._patch_path = patch("muttr.config.CONFIG_PATH", self._config_path)
+        self._patch_dir.start()
+        self._patch_path.start()
+        self._changes = []
+        self._listener = lambda **kw: self._changes.append((kw["key"], kw["value"]))
+        events.on("config_changed", self._listener)
+
+    def teardown_method(self):
+        from muttr import events
+
+        events.off("config_changed", self._listener)
+        self._patch_dir.stop()
+        self._patch_path.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_get_does_not_reparse_unchanged_file(self):
+        save({"cleanup_level": 2})
+        with patch("muttr.config._read") as read:
+            assert get("cleanup_level") == 2
+            assert get("paste_delay_ms") == DEFAULTS["paste_delay_ms"]
+        read.assert_not_called()
+
+    def test_reloads_after_external_change(self):
+        save({"cleanup_level": 2})
+        assert get("cleanup_level") == 2
+        with open(self._config_path, "w") as f:
+            json.dump({"cleanup_level": 0, "model": "small.en"}, f)
+        assert get("cleanup_level") == 0
+        assert ("model", "small.en") in self._changes
+
+    def test_set_value_emits_config_changed(self):
+        load()
+        set_value("paste_delay_ms", 120)
+        assert self._changes == [("paste_delay_ms", 120)]
+
+    def test_unchanged_value_emits_nothing(self):
+        set_value("paste_delay_ms", 120)
+        self._changes.clear()
+        set_value("paste_delay_ms", 120)
+        assert self._changes == []
+
+    def test_load_returns_copy(self):
+        load()["cleanup_level"] = 0
+        assert get("cleanup_level") == DEFAULTS["cleanup_level"]
+
+    def test_save_caches_validated_values(self):
+        save({"paste_delay_ms": 9999})
+        assert get("paste_delay_ms") == 500
@@ -0,0 +1,66 @@
+"""Tests for muttr.filecache -- stat-stamped file contents cache."""
+
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+from muttr.filecache import StampedCache, file_stamp
+
+
+class TestStampedCache:
+    def setup_method(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self._path = os.path.join(self._tmpdir, "data.json")
+
+    def teardown_method(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _write(self, text):
+        with open(self._path, "w") as f:
+            f.write(text)
+
+    def test_missing_file_has_no_stamp(self):
+        assert file_stamp(self._path) is None
+        self._write("x")
+        assert file_stamp(self._path) is not None
+
+    def test_reads_once_until_file_changes(self):
+        cache = StampedCache()
+        read = Mock(side_effect=["first", "second"])
+        self._write("a")
+        assert cache.get(self._path, read) == "first"
+        assert cache.get(self._path, read) == "first"
+        assert read.call_count == 1
+
+        self._write("bb")
+        assert cache.get(self._path, read) == "second"
+        assert read.call_count == 2
+
+    def test_put_is_served_without_reading(self):
+        cache = StampedCache()
+        self._write("a")
+        cache.put(self._path, "written")
+        read = Mock()
+        assert cache.get(self._path, read) == "written"
+        read.assert_not_called()
+
+    def test_other_path_is_not_served(self):
+        cache = StampedCache()
+        cache.put(self._path, "missing")
+        other = os.path.join(self._tmpdir, "other.json")
+        assert cache.get(other, lambda: "other") == "other"
+
+    def test_on_replace_sees_previous_data_for_same_path(self):
+        on_replace = Mock()
+        cache = StampedCache(on_replace=on_replace)
+        self._write("a")
+        cache.get(self._path, lambda: "first")
+        on_replace.assert_not_called()
+
+        self._write("bb")
+        cache.get(self._path, lambda: "second")
+        on_replace.assert_called_once_with("first", "second")
+
+        cache.put(os.path.join(self._tmpdir, "other.json"), "other")
+        assert on_replace.call_count == 1
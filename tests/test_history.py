@@ -3,6 +3,7 @@
 import os
 import tempfile
 import shutil
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -209,3 +210,532 @@ class TestHistoryEdgeCases:
         entries = history.get_recent(limit=1)
         ts = entries[0]["timestamp"]
         assert before <= ts <= after
+
+
+class TestReprocessCleanup:
+    def setup_method(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self._db_path = os.path.join(self._tmpdir, "history.db")
+        self._patch_dir = patch("muttr.config.APP_SUPPORT_DIR", self._tmpdir)
+        self._patch_db = patch("muttr.history.DB_PATH", self._db_path)
+        self._patch_dir.start()
+        self._patch_db.start()
+
+    def teardown_method(self):
+        self._patch_dir.stop()
+        self._patch_db.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_rewrites_cleaned_text_from_raw(self):
+        history.add_entry("um i met sarah on monday", "stale")
+        history.add_entry("the the api is down", "stale")
+        updated = history.reprocess_cleanup(level=1, workers=1)
+        assert updated == 2
+        entries = history.get_recent(limit=10)
+        assert entries[0]["cleaned_text"] == "The API is down."
+        assert entries[1]["cleaned_text"] == "I met Sarah on Monday."
+        # Raw text is untouched
+        assert entries[1]["raw_text"] == "um i met sarah on monday"
+
+    def test_reports_progress_per_batch(self):
+        for i in range(5):
+            history.add_entry(f"entry {i}", "stale")
+        calls = []
+        history.reprocess_cleanup(
+            level=0, workers=1, batch_size=2,
+            progress=lambda done, total: calls.append((done, total)),
+        )
+        assert calls == [(2, 5), (4, 5), (5, 5)]
+
+    def test_empty_history(self):
+        assert history.reprocess_cleanup(level=1, workers=1) == 0
+
+
+class TestHistoryConnection:
+    def setup_method(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self._db_path = os.path.join(self._tmpdir, "history.db")
+        self._patch_dir = patch("muttr.config.APP_SUPPORT_DIR", self._tmpdir)
+        self._patch_db = patch("muttr.history.DB_PATH", self._db_path)
+        self._patch_dir.start()
+        self._patch_db.start()
+
+    def teardown_method(self):
+        history.close()
+        self._patch_dir.stop()
+        self._patch_db.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_connection_reused_within_thread(self):
+        assert history._connect() is history._connect()
+
+    def test_wal_journal_mode(self):
+        mode = history._connect().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_each_thread_gets_its_own_connection(self):
+        import threading
+        main_conn = history._connect()
+        seen = []
+        t = threading.Thread(target=lambda: seen.append(history._connect()))
+        t.start()
+        t.join()
+        assert seen[0] is not main_conn
+
+    def test_writes_from_other_thread_are_visible(self):
+        import threading
+        assert history.count() == 0
+        t = threading.Thread(target=lambda: history.add_entry("raw", "cleaned"))
+        t.start()
+        t.join()
+        assert history.count() == 1
+
+    def test_reopens_when_db_path_changes(self):
+        first = history._connect()
+        other = os.path.join(self._tmpdir, "other.db")
+        with patch("muttr.history.DB_PATH", other):
+            assert history._connect() is not first
+            history.add_entry("raw", "cleaned")
+            assert history.count() == 1
+        assert history.count() == 0
+
+    def test_close_then_reconnect(self):
+        history.add_entry("raw", "cleaned")
+        history.close()
+        assert history.count() == 1
+
+
+class TestEncryptedSearchIndex:
+    def setup_method(self):
+        from cryptography.fernet import Fernet
+
+        self._tmpdir = tempfile.mkdtemp()
+        self._db_path = os.path.join(self._tmpdir, "history.db")
+        self._patches = [
+            patch("muttr.config.APP_SUPPORT_DIR", self._tmpdir),
+            patch("muttr.history.DB_PATH", self._db_path),
+            patch("muttr.history._fernet_instance", None),
+            patch("muttr.history._search_key", None),
+        ]
+        for p in self._patches:
+            p.start()
+        history._install_key(Fernet.generate_key())
+
+    def teardown_method(self):
+        history.close()
+        for p in reversed(self._patches):
+            p.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _raw_db(self):
+        import sqlite3
+        return sqlite3.connect(self._db_path)
+
+    def test_finds_word_substring_and_phrase(self):
+        history.add_entry("Hello World", "Hello world.")
+        history.add_entry("grocery list", "Grocery list.")
+        assert len(history.search("hel")) == 1
+        assert len(history.search("ell")) == 1
+        assert len(history.search("lo wor")) == 1
+        assert history.search("GROCERY")[0]["raw_text"] == "grocery list"
+
+    def test_mid_word_and_mid_phrase_queries(self):
+        history.add_entry("Hello World", "Hello world.")
+        history.add_entry("Iceland trip", "Iceland trip.")
+        history.add_entry("edit the configuration file", "Edit the configuration file.")
+        for query in ("ello", "land", "figuration", "o w", "lo wo", "ration file"):
+            assert len(history.search(query)) == 1, query
+
+    def test_short_queries_search_every_row(self):
+        history.add_entry("Hello World", "Hello world.")
+        for i in range(5):
+            history.add_entry(f"note {i}", f"Note {i}.")
+        assert len(history.search("lo")) == 1
+        assert len(history.search("he")) == 1
+        assert len(history.search("o")) == 6
+
+    def test_verifies_candidates_against_full_query(self):
+        history.add_entry("world hello", "world hello")
+        assert history.search("hello world") == []
+
+    def test_ranks_by_hits_then_recency(self):
+        older = history.add_entry("meeting", "meeting")
+        most = history.add_entry("meeting meeting", "meeting meeting")
+        newer = history.add_entry("meeting", "meeting")
+        assert [e["id"] for e in history.search("meeting")] == [most, newer, older]
+        # Hits are summed over every term containing the query word
+        prefix = history.add_entry("meet meetings", "meet meetings")
+        assert [e["id"] for e in history.search("meet")][:2] == [prefix, most]
+
+    def test_stops_decrypting_at_limit(self):
+        history.add_entry("unrelated", "unrelated")
+        for i in range(20):
+            history.add_entry(f"the note {i}", f"The note {i}.")
+        history._cache_invalidate()
+        misses = history.cache_stats()["misses"]
+        assert len(history.search("note", limit=3)) == 3
+        assert history.cache_stats()["misses"] - misses == 3
+
+    def test_no_plaintext_terms_on_disk(self):
+        history.add_entry("confidential", "Confidential.")
+        db = self._raw_db()
+        rows = db.execute("SELECT digest, term FROM search_terms").fetchall()
+        db.close()
+        assert rows
+        for digest, term in rows:
+            assert "confidential" not in digest
+            assert "confidential" not in term
+
+    def test_delete_and_clear_drop_postings(self):
+        keep = history.add_entry("alpha", "alpha")
+        gone = history.add_entry("alpha beta", "alpha beta")
+        history.delete_entry(gone)
+        assert [e["id"] for e in history.search("alpha")] == [keep]
+        history.clear_all()
+        assert history.search("alpha") == []
+        db = self._raw_db()
+        assert db.execute("SELECT COUNT(*) FROM search_postings").fetchone()[0] == 0
+        db.close()
+
+    def test_backfills_existing_rows(self):
+        history.add_entry("first note", "First note.")
+        db = self._raw_db()
+        with db:
+            db.execute("DELETE FROM search_postings")
+            db.execute("PRAGMA user_version = 0")
+        db.close()
+        history._indexed.discard(self._db_path)
+        history.build_search_index()
+        assert len(history.search("note")) == 1
+
+    def test_backfill_commits_in_batches_newest_first(self):
+        ids = [history.add_entry(f"note {i}", f"Note {i}.") for i in range(3)]
+        db = self._raw_db()
+        with db:
+            db.execute("DELETE FROM search_postings")
+            db.execute("PRAGMA user_version = 0")
+        db.close()
+        history._indexed.discard(self._db_path)
+
+        conn = history._connect()
+        key = history._get_search_key()
+        assert not history._backfill_step(conn, key, batch_size=2)
+        # Progress is committed: the newest rows are searchable, and new
+        # writes are indexed as they land.
+        fresh = history.add_entry("note new", "Note new.")
+        with patch("muttr.history.start_search_index"):
+            assert [e["id"] for e in history.search("note")] == [fresh, ids[2], ids[1]]
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+
+        assert not history._backfill_step(conn, key, batch_size=2)
+        assert history._backfill_step(conn, key, batch_size=2)
+        assert len(history.search("note")) == 4
+        assert conn.execute("SELECT COUNT(*) FROM search_index_state").fetchone()[0] == 0
+
+    def test_scans_unindexed_rows_when_index_has_no_candidates(self):
+        old = history.add_entry("first note", "First note.")
+        db = self._raw_db()
+        with db:
+            db.execute("DELETE FROM search_postings")
+            db.execute("PRAGMA user_version = 0")
+        db.close()
+        history._indexed.discard(self._db_path)
+        with patch("muttr.history.start_search_index"):
+            assert [e["id"] for e in history.search("note")] == [old]
+            history.add_entry("second entry", "Second entry.")
+            conn = history._connect()
+            assert not history._backfill_step(conn, history._get_search_key(), batch_size=1)
+            # The newest row is indexed and matches nothing; the older one is scanned.
+            assert [e["id"] for e in history.search("note")] == [old]
+
+    def test_search_starts_background_backfill(self):
+        history.add_entry("first note", "First note.")
+        db = self._raw_db()
+        with db:
+            db.execute("DELETE FROM search_postings")
+            db.execute("PRAGMA user_version = 0")
+        db.close()
+        history._indexed.discard(self._db_path)
+        with patch("muttr.history.start_search_index") as start:
+            history.search("note")
+        start.assert_called_once()
+        history.start_search_index().join()
+        assert len(history.search("note")) == 1
+
+    def test_reprocess_updates_postings(self):
+        history.add_entry("um so the plan", "stale")
+        history.search("plan")  # build the index
+        history.reprocess_cleanup(level=1, workers=1)
+        assert history.search("stale") == []
+        assert len(history.search("plan")) == 1
+
+    def test_falls_back_to_scan_without_words(self):
+        history.add_entry("a -- b", "a -- b")
+        assert len(history.search("--")) == 1
+
+
+class TestRowCache:
+    def setup_method(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self._db_path = os.path.join(self._tmpdir, "history.db")
+        self._patch_dir = patch("muttr.config.APP_SUPPORT_DIR", self._tmpdir)
+        self._patch_db = patch("muttr.history.DB_PATH", self._db_path)
+        self._patch_dir.start()
+        self._patch_db.start()
+
+    def teardown_method(self):
+        history.close()
+        self._patch_dir.stop()
+        self._patch_db.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_repeated_reads_skip_decryption(self):
+        history.add_entry("raw", "cleaned")
+        history.get_recent()
+        with patch("muttr.history._decrypt") as decrypt:
+            entries = history.get_recent()
+        decrypt.assert_not_called()
+        assert entries[0]["cleaned_text"] == "cleaned"
+
+    def test_counts_hits_and_misses(self):
+        entry_id = history.add_entry("raw", "cleaned")
+        history._cache_invalidate([entry_id])
+        before = history.cache_stats()
+        history.get_recent()
+        history.get_recent()
+        after = history.cache_stats()
+        assert after["misses"] - before["misses"] == 1
+        assert after["hits"] - before["hits"] == 1
+
+    def test_returns_copies(self):
+        history.add_entry("raw", "cleaned")
+        history.get_recent()[0]["cleaned_text"] = "mutated"
+        assert history.get_recent()[0]["cleaned_text"] == "cleaned"
+
+    def test_write_through_matches_stored_row(self):
+        history.add_entry("raw", "cleaned", engine="parakeet", duration_s=1.5)
+        cached = history.get_recent()[0]
+        history._cache_invalidate()
+        assert history.get_recent()[0] == cached
+
+    def test_delete_and_clear_invalidate(self):
+        entry_id = history.add_entry("raw", "cleaned")
+        history.get_recent()
+        history.delete_entry(entry_id)
+        assert history.get_recent() == []
+        history.add_entry("raw", "cleaned")
+        history.clear_all()
+        assert all(path != self._db_path for path, _id in history._row_cache)
+
+    def test_reprocess_invalidates(self):
+        history.add_entry("um so the plan", "stale")
+        history.get_recent()
+        history.reprocess_cleanup(level=1, workers=1)
+        assert history.get_recent()[0]["cleaned_text"] != "stale"
+
+    def test_bounded(self):
+        with patch("muttr.history.ROW_CACHE_SIZE", 3):
+            for i in range(5):
+                history.add_entry(f"raw {i}", f"cleaned {i}")
+            assert history.cache_stats()["size"] <= 3
+            assert len(history.get_recent()) == 5
+
+
+class TestEncryptionKey:
+    def setup_method(self):
+        from muttr import keychain
+
+        self._keychain = keychain
+        keychain.set_backend(keychain.MemoryBackend())
+        self._patches = [
+            patch("muttr.history._fernet_instance", None),
+            patch("muttr.history._search_key", None),
+            patch("muttr.history._encryption_unavailable", False),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in reversed(self._patches):
+            p.stop()
+        self._keychain.set_backend(None)
+
+    def test_key_comes_from_keychain(self):
+        from cryptography.fernet import Fernet
+
+        key = Fernet.generate_key()
+        self._keychain.write(self._keychain.ENCRYPTION_KEY_ACCOUNT, key.decode())
+        with patch("muttr.history._get_hardware_uuid") as hw:
+            fernet = history._get_fernet()
+        assert fernet.decrypt(Fernet(key).encrypt(b"x")) == b"x"
+        hw.assert_not_called()
+
+    def test_missing_hardware_uuid_is_tried_once(self):
+        with patch("muttr.history._get_hardware_uuid", side_effect=RuntimeError) as hw:
+            assert history._get_fernet() is None
+            assert history._get_fernet() is None
+        assert hw.call_count == 1
+
+
+class TestBackgroundKey:
+    def setup_method(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self._release = threading.Event()
+        self._patches = [
+            patch("muttr.config.APP_SUPPORT_DIR", self._tmpdir),
+            patch("muttr.history.DB_PATH", os.path.join(self._tmpdir, "history.db")),
+            patch("muttr.history._key_future", None),
+            patch("muttr.history._get_fernet", side_effect=self._slow_key),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def teardown_method(self):
+        self._release.set()
+        history.flush_pending(timeout=5)
+        history.close()
+        for p in reversed(self._patches):
+            p.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _slow_key(self):
+        self._release.wait(5)
+        return None
+
+    def test_writes_are_queued_until_key_is_ready(self):
+        future = history.prepare_key()
+        assert history.prepare_key() is future
+        first = history.add_entry("first", "First.")
+        second = history.add_entry("second", "Second.")
+        assert second == first + 1
+        assert history.count() == 2
+
+        assert not history.flush_pending(timeout=0.01)
+        self._release.set()
+        assert history.flush_pending(timeout=5)
+        recent = history.get_recent()
+        assert [(e["id"], e["raw_text"]) for e in recent] == [(second, "second"), (first, "first")]
+        assert history.count() == 2
+        # Ids keep counting up from the queued ones
+        assert history.add_entry("third", "Third.") == second + 1
+
+    def test_writes_go_straight_through_once_ready(self):
+        self._release.set()
+        history.prepare_key().result(timeout=5)
+        assert isinstance(history.add_entry("now", "Now."), int)
+        assert history.count() == 1
+
+    def test_reads_wait_briefly_then_raise_until_key_is_ready(self):
+        history.prepare_key()
+        history.add_entry("hello there", "Hello there.")
+        with patch("muttr.history.KEY_WAIT_TIMEOUT", 0.01):
+            with pytest.raises(history.HistoryNotReady):
+                history.get_recent()
+            with pytest.raises(history.HistoryNotReady):
+                history.search("hello")
+
+    def test_reads_include_queued_writes_once_key_is_ready(self):
+        history.prepare_key()
+        history.add_entry("hello there", "Hello there.")
+        threading.Timer(0.05, self._release.set).start()
+        with patch("muttr.history.KEY_WAIT_TIMEOUT", 5):
+            assert [e["raw_text"] for e in history.get_recent()] == ["hello there"]
+            assert len(history.search("hello")) == 1
+
+
+class TestBulkImportExport:
+    def setup_method(self):
+        from cryptography.fernet import Fernet
+
+        self._tmpdir = tempfile.mkdtemp()
+        self._db_path = os.path.join(self._tmpdir, "history.db")
+        self._patches = [
+            patch("muttr.config.APP_SUPPORT_DIR", self._tmpdir),
+            patch("muttr.history.DB_PATH", self._db_path),
+            patch("muttr.history._fernet_instance", None),
+            patch("muttr.history._fernet_key", None),
+            patch("muttr.history._search_key", None),
+        ]
+        for p in self._patches:
+            p.start()
+        history._install_key(Fernet.generate_key())
+
+    def teardown_method(self):
+        history.close()
+        for p in reversed(self._patches):
+            p.stop()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _rows(self, n):
+        return [
+            {"raw_text": f"raw {i}", "cleaned_text": f"Cleaned {i}.", "timestamp": 1000.0 + i,
+             "engine": "whisper", "duration_s": i / 10}
+            for i in range(n)
+        ]
+
+    def test_add_entries_batches_and_encrypts(self):
+        ids = history.add_entries(self._rows(25), workers=1, batch_size=10)
+        assert len(ids) == 25 and ids == sorted(ids)
+        assert history.count() == 25
+        import sqlite3
+        stored = sqlite3.connect(self._db_path).execute(
+            "SELECT raw_text FROM transcriptions").fetchall()
+        assert all(not raw.startswith("raw") for (raw,) in stored)
+        assert [e["raw_text"] for e in history.search("raw 7")] == ["raw 7"]
+
+    def test_export_round_trips_into_a_new_database(self):
+        history.add_entries(self._rows(12), workers=1, batch_size=5)
+        exported = list(history.export_entries(workers=1, batch_size=5))
+        assert [e["cleaned_text"] for e in exported] == [f"Cleaned {i}." for i in range(12)]
+
+        history.close()
+        with patch("muttr.history.DB_PATH", os.path.join(self._tmpdir, "copy.db")):
+            history.add_entries(exported, workers=1)
+            copy = list(history.export_entries(workers=1))
+            history.close()
+        strip = lambda e: {k: v for k, v in e.items() if k != "id"}
+        assert [strip(e) for e in copy] == [strip(e) for e in exported]
+
+    def test_import_iterator_yields_ids_per_committed_batch(self):
+        it = history.import_entries(iter(self._rows(6)), workers=1, batch_size=4)
+        first = next(it)
+        assert history.count() == 4
+        assert len([first, *it]) == 6
+
+    def test_worker_pool_matches_in_process(self):
+        with patch("muttr.history.CRYPTO_CHUNK_SIZE", 4):
+            history.add_entries(self._rows(20), workers=2)
+            exported = list(history.export_entries(workers=2))
+        assert [e["raw_text"] for e in exported] == [f"raw {i}" for i in range(20)]
+        assert history.get_recent(limit=1)[0]["cleaned_text"] == "Cleaned 19."
+
+    def test_reprocess_shares_one_pool_for_cleanup_and_crypto(self):
+        from concurrent.futures import ProcessPoolExecutor
+        from muttr.cleanup import CUSTOM_PROPER_NOUNS, _rebuild_proper_noun_map, add_proper_nouns
+
+        history.add_entries([{"raw_text": f"i love muttr {i}", "cleaned_text": "stale"}
+                             for i in range(10)], workers=1)
+        add_proper_nouns({"muttr": "MuttR"})
+        try:
+            with patch("muttr.history.CRYPTO_CHUNK_SIZE", 4), \
+                    patch("muttr.history.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool, \
+                    patch("muttr.cleanup.ProcessPoolExecutor") as cleanup_pool:
+                assert history.reprocess_cleanup(level=0, workers=2, batch_size=10) == 10
+        finally:
+            CUSTOM_PROPER_NOUNS.clear()
+            _rebuild_proper_noun_map()
+        pool.assert_called_once()
+        cleanup_pool.assert_not_called()
+        cleaned = [e["cleaned_text"] for e in history.export_entries(workers=1)]
+        assert cleaned == [f"I love MuttR {i}." for i in range(10)]
+
+    def test_frozen_bundle_runs_in_process(self):
+        history.add_entries([{"raw_text": "the the note", "cleaned_text": "stale"}], workers=1)
+        with patch("sys.frozen", True, create=True), \
+                patch("muttr.history.CRYPTO_CHUNK_SIZE", 1), \
+                patch("muttr.history.ProcessPoolExecutor") as pool, \
+                patch("muttr.cleanup.ProcessPoolExecutor") as cleanup_pool:
+            assert history.reprocess_cleanup(level=1, workers=4) == 1
+            assert len(list(history.export_entries(workers=4))) == 1
+        pool.assert_not_called()
+        cleanup_pool.assert_not_called()
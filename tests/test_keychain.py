@@ -0,0 +1,105 @@
+"""Tests for muttr.keychain -- cached keychain access with pluggable backends."""
+
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import types
+from unittest.mock import patch
+
+import pytest
+
+from muttr import keychain
+
+
+class _SlowBackend(keychain.MemoryBackend):
+    def __init__(self, items=None):
+        super().__init__(items)
+        self.reads = 0
+        self.release = threading.Event()
+
+    def read(self, account):
+        self.reads += 1
+        self.release.wait(5)
+        return super().read(account)
+
+
+class TestCachedAccess:
+    def teardown_method(self):
+        keychain.set_backend(None)
+
+    def test_backend_read_once(self):
+        backend = _SlowBackend({"a": "secret"})
+        backend.release.set()
+        keychain.set_backend(backend)
+        assert keychain.read("a") == "secret"
+        assert keychain.read("a") == "secret"
+        assert keychain.read("missing") is None
+        assert keychain.read("missing") is None
+        assert backend.reads == 2
+
+    def test_write_and_delete_update_cache(self):
+        backend = keychain.MemoryBackend()
+        keychain.set_backend(backend)
+        keychain.write("a", "v1")
+        assert backend.read("a") == "v1"
+        with patch.object(backend, "read") as read:
+            assert keychain.read("a") == "v1"
+            keychain.delete("a")
+            assert keychain.read("a") is None
+            read.assert_not_called()
+
+    def test_prefetch_fills_cache_and_concurrent_read_waits(self):
+        backend = _SlowBackend({keychain.LICENSE_KEY_ACCOUNT: "k"})
+        keychain.set_backend(backend)
+        thread = keychain.prefetch([keychain.LICENSE_KEY_ACCOUNT])
+        result = []
+        reader = threading.Thread(
+            target=lambda: result.append(keychain.read(keychain.LICENSE_KEY_ACCOUNT)),
+        )
+        reader.start()
+        backend.release.set()
+        thread.join(5)
+        reader.join(5)
+        assert result == ["k"]
+        assert backend.reads == 1
+        assert keychain.is_cached(keychain.LICENSE_KEY_ACCOUNT)
+
+    def test_non_macos_default_is_memory(self):
+        with patch("muttr.keychain.sys.platform", "linux"):
+            assert isinstance(keychain.default_backend(), keychain.MemoryBackend)
+
+    def test_macos_default_is_native_when_security_imports(self):
+        with patch("muttr.keychain.sys.platform", "darwin"), \
+                patch.dict("sys.modules", {"Security": types.ModuleType("Security")}):
+            assert isinstance(keychain.default_backend(), keychain.NativeBackend)
+
+    def test_macos_falls_back_to_cli_without_security(self):
+        with patch("muttr.keychain.sys.platform", "darwin"), \
+                patch.dict("sys.modules", {"Security": None}):
+            assert isinstance(keychain.default_backend(), keychain.SecurityCLIBackend)
+
+
+class TestFileBackend:
+    def setup_method(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self._path = os.path.join(self._tmpdir, "keychain.json")
+
+    def teardown_method(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_round_trip_owner_only(self):
+        backend = keychain.FileBackend(self._path)
+        backend.write("a", "secret")
+        assert keychain.FileBackend(self._path).read("a") == "secret"
+        assert stat.S_IMODE(os.stat(self._path).st_mode) == 0o600
+        backend.delete("a")
+        assert backend.read("a") is None
+
+    def test_unwritable_path_raises(self):
+        backend = keychain.FileBackend(os.path.join(self._path, "nested", "x.json"))
+        with open(self._path, "w"):
+            pass  # a file where the directory should be
+        with pytest.raises(keychain.KeychainError):
+            backend.write("a", "b")
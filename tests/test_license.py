@@ -0,0 +1,71 @@
+"""Tests for muttr.license -- license key validation and cached tier."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from muttr import events, keychain, license
+
+
+def _key(tier, expiry):
+    return f"MUTTR-{tier}-{expiry}-{license._compute_signature(tier, str(expiry))}"
+
+
+def _reset_state():
+    license._state.update(loaded=False, key=None, result=None, recheck_at=None)
+
+
+class TestLicenseCache:
+    def setup_method(self):
+        keychain.set_backend(keychain.MemoryBackend())
+        _reset_state()
+        events.clear()
+
+    def teardown_method(self):
+        keychain.set_backend(None)
+        _reset_state()
+        events.clear()
+
+    def test_keychain_read_once(self):
+        key = _key(license.TIER_STANDARD, int(time.time()) + 3600)
+        with patch("muttr.license._load_from_keychain", return_value=key) as load:
+            for _ in range(5):
+                assert license.get_tier() == license.TIER_STANDARD
+                assert license.get_daily_word_limit() == 1000
+        assert load.call_count == 1
+
+    def test_no_key_is_free(self):
+        with patch("muttr.license._load_from_keychain", return_value=None):
+            assert license.get_tier() == license.TIER_FREE
+            assert not license.is_licensed()
+
+    def test_tier_drops_at_expiry_without_keychain_read(self):
+        now = time.time()
+        key = _key(license.TIER_UNLIMITED, int(now) + 60)
+        changes = []
+        events.on("license_changed", lambda tier: changes.append(tier))
+        with patch("muttr.license._load_from_keychain", return_value=key) as load:
+            assert license.get_tier() == license.TIER_UNLIMITED
+            with patch("muttr.license.time.time", return_value=now + 120):
+                assert license.get_tier() == license.TIER_FREE
+        assert load.call_count == 1
+        assert changes == [license.TIER_FREE]
+
+    def test_activate_and_deactivate_update_cache(self):
+        key = _key(license.TIER_LIFETIME, 0)
+        changes = []
+        events.on("license_changed", lambda tier: changes.append(tier))
+        assert license.get_tier() == license.TIER_FREE
+        assert license.activate(key)["valid"]
+        assert keychain.read(keychain.LICENSE_KEY_ACCOUNT) == key
+        assert license.get_tier() == license.TIER_LIFETIME
+        license.deactivate()
+        assert keychain.read(keychain.LICENSE_KEY_ACCOUNT) is None
+        assert license.get_tier() == license.TIER_FREE
+        assert changes == [license.TIER_LIFETIME, license.TIER_FREE]
+
+    @pytest.mark.parametrize("key", ["", "MUTTR-standard-0-deadbeefdeadbeef", "garbage"])
+    def test_invalid_keys_are_free(self, key):
+        with patch("muttr.license._load_from_keychain", return_value=key):
+            assert license.get_tier() == license.TIER_FREE
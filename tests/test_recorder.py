@@ -0,0 +1,170 @@
+"""Tests for muttr.recorder -- in-place arena capture."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from muttr import recorder
+from muttr.recorder import Recorder, BLOCK_SIZE, LEVEL, METER_HISTORY
+
+
+def _block(value, frames=BLOCK_SIZE):
+    return np.full((frames, 1), value, dtype=np.float32)
+
+
+def _feed(rec, *values):
+    for v in values:
+        rec._audio_callback(_block(v), BLOCK_SIZE, None, None)
+
+
+class TestRecorderArena:
+    def test_stop_without_audio_returns_none(self):
+        assert Recorder().stop() is None
+
+    def test_stop_returns_samples_in_order(self):
+        rec = Recorder()
+        _feed(rec, 0.1, 0.2, 0.3)
+        audio = rec.stop()
+        assert audio.dtype == np.float32
+        assert audio.shape == (3 * BLOCK_SIZE,)
+        assert np.allclose(audio[:BLOCK_SIZE], 0.1)
+        assert np.allclose(audio[-BLOCK_SIZE:], 0.3)
+
+    def test_stop_returns_view_of_arena(self):
+        rec = Recorder()
+        arena = rec._arena
+        _feed(rec, 0.5)
+        audio = rec.stop()
+        assert np.shares_memory(audio, arena)
+
+    def test_grows_past_initial_capacity(self):
+        with patch.object(recorder, "INITIAL_CAPACITY", BLOCK_SIZE * 2):
+            rec = Recorder()
+            _feed(rec, 0.1, 0.2, 0.3, 0.4, 0.5)
+        audio = rec.stop()
+        assert len(audio) == 5 * BLOCK_SIZE
+        assert np.allclose(audio[::BLOCK_SIZE], [0.1, 0.2, 0.3, 0.4, 0.5])
+
+    def test_next_recording_does_not_overwrite_previous(self):
+        rec = Recorder()
+        _feed(rec, 0.1)
+        first = rec.stop()
+        rec._reset()
+        _feed(rec, 0.9)
+        second = rec.stop()
+        assert np.allclose(first, 0.1)
+        assert np.allclose(second, 0.9)
+
+    def test_on_block_receives_mono_view(self):
+        rec = Recorder()
+        seen = []
+        rec._on_block = seen.append
+        _feed(rec, 0.25)
+        assert seen[0].shape == (BLOCK_SIZE,)
+        assert np.shares_memory(seen[0], rec._arena)
+
+    def test_level_is_mean_abs(self):
+        rec = Recorder()
+        _feed(rec, -0.4)
+        assert abs(rec.level - 0.4) < 1e-6
+
+
+class TestRecorderMeter:
+    def test_meter_reports_level_rms_and_peak(self):
+        rec = Recorder()
+        block = np.zeros((BLOCK_SIZE, 1), dtype=np.float32)
+        block[::2] = 0.5
+        block[1::2] = -0.5
+        block[0] = 1.0
+        rec._audio_callback(block, BLOCK_SIZE, None, None)
+        level, rms, peak = rec.meter()
+        expected = np.abs(block)
+        assert level == pytest.approx(float(expected.mean()), rel=1e-5)
+        assert rms == pytest.approx(float(np.sqrt((block ** 2).mean())), rel=1e-5)
+        assert peak == pytest.approx(1.0)
+
+    def test_meter_is_zero_before_first_block(self):
+        rec = Recorder()
+        _feed(rec, 0.3)
+        rec.stop()
+        rec._reset()
+        assert rec.meter() == (0.0, 0.0, 0.0)
+        assert rec.level == 0.0
+
+    def test_meter_since_returns_each_new_frame_once(self):
+        rec = Recorder()
+        _feed(rec, 0.1, 0.2)
+        seq, frames = rec.meter_since(0)
+        assert frames[:, LEVEL] == pytest.approx([0.1, 0.2])
+        _feed(rec, 0.3)
+        seq, frames = rec.meter_since(seq)
+        assert frames[:, LEVEL] == pytest.approx([0.3])
+        assert len(rec.meter_since(seq)[1]) == 0
+
+    def test_meter_since_ignores_previous_recording(self):
+        rec = Recorder()
+        _feed(rec, 0.1)
+        rec.stop()
+        rec._reset()
+        _feed(rec, 0.2)
+        _, frames = rec.meter_since(0)
+        assert frames[:, LEVEL] == pytest.approx([0.2])
+
+    def test_meter_since_keeps_only_recent_history(self):
+        rec = Recorder()
+        _feed(rec, *([0.1] * (METER_HISTORY + 5)))
+        _, frames = rec.meter_since(0)
+        assert len(frames) == METER_HISTORY
+
+    def test_meter_since_drops_frames_overwritten_during_copy(self):
+        rec = Recorder()
+        _feed(rec, *[i / 100 for i in range(METER_HISTORY)])
+        ring = rec._meter
+
+        class _WritesDuringCopy:
+            def __getitem__(self, idx):
+                copy = ring[idx]
+                rec._meter = ring
+                _feed(rec, 0.9, 0.9)
+                rec._meter_claimed += 1  # a third block is mid-write
+                return copy
+
+        rec._meter = _WritesDuringCopy()
+        seq, frames = rec.meter_since(0)
+        assert seq == METER_HISTORY
+        expected = [i / 100 for i in range(3, METER_HISTORY)]
+        assert frames[:, LEVEL] == pytest.approx(expected)
+
+    def test_meter_retries_when_its_frame_is_overwritten(self):
+        rec = Recorder()
+        _feed(rec, 0.1)
+        ring = rec._meter
+
+        class _WrapsDuringRead:
+            def __getitem__(self, idx):
+                frame = ring[idx]
+                rec._meter = ring
+                _feed(rec, *([0.5] * METER_HISTORY))
+                return frame
+
+        rec._meter = _WrapsDuringRead()
+        assert rec.meter()[LEVEL] == pytest.approx(0.5)
+
+    def test_counts_input_overflows(self):
+        rec = Recorder()
+        rec._audio_callback(_block(0.1), BLOCK_SIZE, None, _Status(True))
+        rec._audio_callback(_block(0.1), BLOCK_SIZE, None, _Status(False))
+        assert rec.dropped_blocks == 1
+        rec._reset()
+        assert rec.dropped_blocks == 0
+
+
+class _Status:
+    """Stand-in for sounddevice.CallbackFlags."""
+
+    def __init__(self, input_overflow):
+        self.input_overflow = input_overflow
+
+    def __bool__(self):
+        return self.input_overflow
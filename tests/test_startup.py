@@ -0,0 +1,55 @@
+"""Tests for muttr.startup -- launch import-time benchmark."""
+
+import json
+import os
+import tempfile
+
+import pytest
+
+from muttr import startup
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2500 |       2620 | encodings
+import time:        80 |         80 |     encodings.aliases
+"""
+
+
+class TestParseImporttime:
+    def test_parses_rows_and_skips_header(self):
+        rows = startup.parse_importtime(SAMPLE)
+        assert [r["module"] for r in rows] == ["_io", "encodings", "encodings.aliases"]
+        assert rows[1]["self_ms"] == 2.5
+        assert rows[1]["cumulative_ms"] == 2.62
+        assert [r["depth"] for r in rows] == [1, 0, 2]
+
+    def test_ignores_other_stderr(self):
+        assert startup.parse_importtime("Traceback (most recent call last):\n") == []
+
+
+class TestMeasure:
+    def test_cold_import(self):
+        result = startup.measure("json")
+        assert result["import_s"] >= 0
+        assert result["rss_mb"] > 0
+        assert any(i["module"] == "json" for i in result["imports"])
+
+    def test_failed_import_raises(self):
+        with pytest.raises(RuntimeError, match="no_such_module"):
+            startup.measure("no_such_module")
+
+
+class TestMain:
+    def test_writes_json_report(self, capsys):
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            startup.main(["--module", "json", "--repeat", "2", "--top", "3", "--output", path])
+            with open(path) as f:
+                report = json.load(f)
+        finally:
+            os.unlink(path)
+        assert report["runs"] == 2
+        assert len(report["top_imports"]) <= 3
+        assert "import json" in capsys.readouterr().out
@@ -0,0 +1,83 @@
+"""Tests for muttr.trace -- per-stage timing spans."""
+
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from muttr import events, trace
+from muttr.trace import Trace
+
+
+class TestTrace:
+    def setup_method(self):
+        events.clear()
+        trace.clear()
+        self._tmpdir = tempfile.mkdtemp()
+        self._patch_dir = patch("muttr.config.APP_SUPPORT_DIR", self._tmpdir)
+        self._patch_path = patch("muttr.config.CONFIG_PATH",
+                                 os.path.join(self._tmpdir, "config.json"))
+        self._patch_dir.start()
+        self._patch_path.start()
+
+    def teardown_method(self):
+        self._patch_dir.stop()
+        self._patch_path.stop()
+        events.clear()
+        trace.clear()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_records_spans_in_order(self):
+        t = Trace("dictation", audio_s=1.5)
+        with t.span("transcribe"):
+            pass
+        with t.span("cleanup"):
+            pass
+        record = t.finish()
+        assert [s["name"] for s in record["spans"]] == ["transcribe", "cleanup"]
+        assert all(s["duration_ms"] >= 0 for s in record["spans"])
+        assert record["total_ms"] >= record["spans"][-1]["start_ms"]
+        assert record["attrs"] == {"audio_s": 1.5}
+
+    def test_span_error_is_recorded_and_raised(self):
+        t = Trace("dictation")
+        with pytest.raises(ValueError):
+            with t.span("transcribe"):
+                raise ValueError("bad audio")
+        assert t.spans[0]["error"] == "ValueError: bad audio"
+
+    def test_suppressed_span_swallows_error(self):
+        t = Trace("dictation")
+        with t.span("history", suppress=True):
+            raise OSError("disk full")
+        assert t.spans[0]["error"] == "OSError: disk full"
+
+    def test_finish_keeps_ring_buffer(self):
+        with patch.object(trace, "_traces", trace.deque(maxlen=2)):
+            for i in range(3):
+                Trace("dictation", n=i).finish()
+            assert [t["attrs"]["n"] for t in trace.recent_traces()] == [1, 2]
+            assert len(trace.recent_traces(limit=1)) == 1
+
+    def test_finish_emits_event(self):
+        received = []
+        events.on("trace_recorded", lambda **kw: received.append(kw["trace"]))
+        Trace("dictation").finish()
+        assert received[0]["name"] == "dictation"
+
+    def test_no_log_file_by_default(self):
+        Trace("dictation").finish()
+        assert not os.path.exists(os.path.join(self._tmpdir, trace.TRACE_LOG_NAME))
+
+    def test_dumps_jsonl_when_enabled(self):
+        from muttr import config
+        config.set_value("trace_log", True)
+        Trace("dictation").finish()
+        Trace("dictation").finish()
+        with open(os.path.join(self._tmpdir, trace.TRACE_LOG_NAME)) as f:
+            lines = [json.loads(line) for line in f]
+        assert len(lines) == 2
+        assert lines[0]["name"] == "dictation"
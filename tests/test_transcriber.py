@@ -1,5 +1,6 @@
 """Tests for muttr.transcriber -- Whisper transcription backend."""
 
+import time
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -7,11 +8,41 @@ import numpy as np
 
 from muttr.transcriber import (
     WhisperBackend,
+    ModelPool,
     Transcriber,
+    StreamingTranscription,
+    Transcript,
+    TranscriptCache,
     create_transcriber,
+    _drop_repeated_prefix,
+    _find_silence_cut,
+    _split_chunks,
+    DECODE_PROFILES,
+    DEFAULT_DECODE_PROFILE,
     DEFAULT_MODEL,
+    DEFAULT_POOL_BUDGET_MB,
+    MODEL_MEMORY_MB,
     SAMPLE_RATE,
 )
+from muttr.vad import TrimResult
+
+
+def _speech(seconds):
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 0.1).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+def _text(text):
+    return Transcript(text=text)
+
+
+def _feed_blocks(stream, audio, block=1024):
+    for i in range(0, len(audio), block):
+        stream.feed(audio[i:i + block])
 
 
 class TestWhisperBackend:
@@ -49,6 +80,134 @@ class TestWhisperBackend:
         assert "hello world" in result
 
 
+class TestFindSilenceCut:
+    def test_no_silence_returns_none(self):
+        audio = _speech(3)
+        assert _find_silence_cut(audio, 0, len(audio)) is None
+
+    def test_cut_lands_inside_pause(self):
+        audio = np.concatenate([_speech(2), _silence(1), _speech(2)])
+        cut = _find_silence_cut(audio, 0, len(audio))
+        assert 2 * SAMPLE_RATE <= cut <= 3 * SAMPLE_RATE
+
+    def test_short_pause_ignored(self):
+        audio = np.concatenate([_speech(2), _silence(0.1), _speech(2)])
+        assert _find_silence_cut(audio, 0, len(audio)) is None
+
+    def test_pause_threshold_is_the_cadence_floor(self):
+        from muttr.cadence import RMS_FLOOR
+
+        def room(level):
+            return np.full(SAMPLE_RATE, level, dtype=np.float32)
+
+        quiet = np.concatenate([_speech(2), room(RMS_FLOOR * 0.9), _speech(2)])
+        assert _find_silence_cut(quiet, 0, len(quiet)) is not None
+        loud = np.concatenate([_speech(2), room(RMS_FLOOR * 1.1), _speech(2)])
+        assert _find_silence_cut(loud, 0, len(loud)) is None
+
+
+class TestStreamingTranscription:
+    def _wait_for_commit(self, stream, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while stream.committed_seconds == 0 and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    def test_commits_segment_before_finish(self):
+        calls = []
+
+        def decode(audio, prompt):
+            calls.append((len(audio), prompt))
+            return _text(f"part{len(calls)}")
+
+        stream = StreamingTranscription(decode)
+        _feed_blocks(stream, np.concatenate([_speech(10), _silence(1), _speech(3)]))
+        self._wait_for_commit(stream)
+        assert 10 <= stream.committed_seconds <= 11
+        assert len(calls) == 1
+
+        assert stream.finish().text == "part1 part2"
+        # Only the tail is decoded at finish time
+        assert calls[1][0] < 4 * SAMPLE_RATE
+        # Committed text carries forward as the prompt
+        assert calls[1][1] == "part1"
+
+    def test_short_dictation_decodes_once_at_finish(self):
+        calls = []
+        stream = StreamingTranscription(
+            lambda audio, prompt: calls.append(prompt) or _text("hello"),
+            prompt_factory=lambda: "Continue: context",
+        )
+        _feed_blocks(stream, _speech(2))
+        assert stream.finish().text == "hello"
+        assert calls == ["Continue: context"]
+
+    def test_prompt_factory_error_is_ignored(self):
+        def boom():
+            raise RuntimeError("no clipboard")
+
+        stream = StreamingTranscription(lambda audio, prompt: _text("ok"), prompt_factory=boom)
+        _feed_blocks(stream, _speech(1))
+        assert stream.finish().text == "ok"
+
+    def test_preprocess_applies_to_each_segment(self):
+        seen = []
+        stream = StreamingTranscription(
+            lambda audio, prompt: seen.append(len(audio)) or _text("ok"),
+            preprocess=lambda audio: TrimResult(
+                audio[:SAMPLE_RATE // 2], np.array([[0, SAMPLE_RATE // 2]]), len(audio),
+            ),
+        )
+        _feed_blocks(stream, _speech(2))
+        assert stream.finish().text == "ok"
+        assert seen == [SAMPLE_RATE // 2]
+
+    def test_word_times_map_back_through_trim(self):
+        # The decoder sees 0.5 s of speech that sat at 1.0-1.5 s of the recording.
+        word = MagicMock(word=" hi", start=0.2, end=0.4, probability=0.9)
+        seg = MagicMock(text=" hi", words=[word], avg_logprob=-0.1)
+        stream = StreamingTranscription(
+            lambda audio, prompt: Transcript.from_segments([seg]),
+            preprocess=lambda audio: TrimResult(
+                audio[SAMPLE_RATE:SAMPLE_RATE * 3 // 2],
+                np.array([[SAMPLE_RATE, SAMPLE_RATE * 3 // 2]]), len(audio),
+            ),
+        )
+        _feed_blocks(stream, _speech(2))
+        t = stream.finish()
+        assert t.starts[0] == pytest.approx(1.2)
+        assert t.ends[0] == pytest.approx(1.4)
+
+    def test_cancel_skips_decoding(self):
+        decode = MagicMock(return_value=_text("x"))
+        stream = StreamingTranscription(decode)
+        _feed_blocks(stream, _speech(1))
+        stream.cancel()
+        decode.assert_not_called()
+
+    def test_backend_start_stream_uses_model(self):
+        backend = WhisperBackend()
+        backend._model = MagicMock()
+        seg = MagicMock()
+        seg.text = " streamed "
+        backend._model.transcribe.return_value = ([seg], None)
+        stream = backend.start_stream()
+        _feed_blocks(stream, _speech(1))
+        assert stream.finish().text == "streamed"
+
+    def test_word_times_are_offset_by_committed_audio(self):
+        word = MagicMock(word=" hi", start=0.5, end=0.7, probability=0.9)
+        seg = MagicMock(text=" hi", words=[word], avg_logprob=-0.1)
+        stream = StreamingTranscription(lambda audio, prompt: Transcript.from_segments([seg]))
+        _feed_blocks(stream, np.concatenate([_speech(10), _silence(1), _speech(3)]))
+        self._wait_for_commit(stream)
+        committed = stream.committed_seconds
+        t = stream.finish()
+        assert t.words == ("hi", "hi")
+        assert t.starts[0] == pytest.approx(0.5)
+        assert t.starts[1] == pytest.approx(committed + 0.5)
+        assert list(t.segment_offsets) == [0, 1, 2]
+
+
 class TestCreateTranscriber:
     def test_default_creates_whisper(self):
         backend = create_transcriber()
@@ -92,6 +251,13 @@ class TestTranscriberLegacyWrapper:
         assert result == "hello"
         t._backend.transcribe.assert_called_once()
 
+    def test_delegates_start_stream(self):
+        t = Transcriber()
+        t._backend = MagicMock()
+        factory = lambda: ""
+        t.start_stream(prompt_factory=factory)
+        t._backend.start_stream.assert_called_once_with(prompt_factory=factory)
+
     def test_transcribe_passes_kwargs(self):
         t = Transcriber()
         t._backend = MagicMock()
@@ -109,3 +275,336 @@ class TestSampleRateConstant:
 
     def test_default_model_is_base_en(self):
         assert DEFAULT_MODEL == "base.en"
+
+
+class TestModelPool:
+    def _pool(self, budget_mb=DEFAULT_POOL_BUDGET_MB):
+        pool = ModelPool(budget_mb=budget_mb)
+        pool._load = MagicMock(side_effect=lambda size, *options: MagicMock(name=size))
+        return pool
+
+    def test_get_loads_once_and_reuses(self):
+        pool = self._pool()
+        first = pool.get("base.en")
+        assert pool.get("base.en") is first
+        assert pool._load.call_count == 1
+
+    def test_keyed_by_compute_type(self):
+        pool = self._pool()
+        assert pool.get("base.en", compute_type="int8") is not pool.get(
+            "base.en", compute_type="float32")
+
+    def test_evicts_least_recently_used_over_budget(self):
+        budget = MODEL_MEMORY_MB["base.en"] + MODEL_MEMORY_MB["small.en"]
+        pool = self._pool(budget_mb=budget)
+        pool.get("base.en")
+        pool.get("small.en")
+        pool.get("base.en")
+        pool.get("tiny.en")
+        assert pool.is_loaded("base.en")
+        assert pool.is_loaded("tiny.en")
+        assert not pool.is_loaded("small.en")
+
+    def test_keeps_latest_model_even_if_over_budget(self):
+        pool = self._pool(budget_mb=0)
+        pool.get("small.en")
+        assert pool.is_loaded("small.en")
+
+    def test_concurrent_gets_share_one_load(self):
+        import threading
+        pool = self._pool()
+        release = threading.Event()
+
+        def slow_load(size, *options):
+            release.wait(5)
+            return MagicMock()
+        pool._load = MagicMock(side_effect=slow_load)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(pool.get("base.en")))
+                   for _ in range(3)]
+        for t in threads:
+            t.start()
+        release.set()
+        for t in threads:
+            t.join(5)
+        assert pool._load.call_count == 1
+        assert len(results) == 3 and all(r is results[0] for r in results)
+
+    def test_failed_load_can_be_retried(self):
+        pool = self._pool()
+        pool._load.side_effect = [RuntimeError("no model"), MagicMock()]
+        with pytest.raises(RuntimeError):
+            pool.get("base.en")
+        assert pool.get("base.en") is not None
+
+    def test_preload_makes_model_resident(self):
+        pool = self._pool()
+        pool.preload("small.en").join(5)
+        assert pool.is_loaded("small.en")
+
+    def test_backend_loads_through_pool(self):
+        pool = self._pool()
+        a = WhisperBackend("base.en", pool=pool)
+        b = WhisperBackend("base.en", pool=pool)
+        a.load()
+        b.load()
+        assert a._model is b._model
+
+
+class TestDecodeProfiles:
+    def _backend(self, profile):
+        backend = WhisperBackend(profile=profile)
+        backend._model = MagicMock()
+        backend._model.transcribe.return_value = ([], None)
+        return backend
+
+    def test_balanced_keeps_historic_settings(self):
+        backend = self._backend("balanced")
+        backend._decode(np.zeros(16000, dtype=np.float32), None)
+        _, kwargs = backend._model.transcribe.call_args
+        assert kwargs["beam_size"] == 5
+        assert kwargs["vad_filter"] is True
+
+    def test_fast_uses_greedy_decoding(self):
+        backend = self._backend("fast")
+        backend._decode(np.zeros(16000, dtype=np.float32), None)
+        _, kwargs = backend._model.transcribe.call_args
+        assert kwargs["beam_size"] == 1
+        assert kwargs["temperature"] == [0.0]
+
+    def test_unknown_profile_falls_back_to_default(self):
+        assert WhisperBackend(profile="ludicrous").profile == DEFAULT_DECODE_PROFILE
+
+    def test_profile_selects_pooled_model_options(self):
+        pool = MagicMock()
+        WhisperBackend("small.en", pool=pool, profile="accurate").load()
+        args, kwargs = pool.get.call_args
+        assert args == ("small.en",)
+        assert kwargs["compute_type"] == DECODE_PROFILES["accurate"]["compute_type"]
+
+    def test_create_transcriber_passes_profile(self):
+        assert create_transcriber(profile="fast").profile == "fast"
+
+    def test_profiles_match_config_choices(self):
+        from muttr.config import DEFAULTS, VALID_DECODE_PROFILES
+        assert set(DECODE_PROFILES) == VALID_DECODE_PROFILES
+        assert DEFAULTS["decode_profile"] == DEFAULT_DECODE_PROFILE
+
+
+class TestParallelChunkedDecoding:
+    def _backend(self, workers, texts=None):
+        backend = WhisperBackend(workers=workers)
+        backend._model = MagicMock()
+        texts = iter(texts) if texts else None
+        backend._decode_result = MagicMock(
+            side_effect=lambda audio, prompt, words=False: _text(next(texts) if texts else "x"),
+        )
+        return backend
+
+    def test_chunks_cover_audio_in_order(self):
+        audio = _speech(70)
+        spans = _split_chunks(audio)
+        assert spans[0][0] == 0 and spans[-1][1] == len(audio)
+        for (_, prev_end), (start, end) in zip(spans, spans[1:]):
+            assert start < end
+            assert prev_end - start == int(SAMPLE_RATE * 1.0)  # hard cut overlap
+            assert end - start <= 25 * SAMPLE_RATE
+
+    def test_chunks_end_in_pauses_without_overlap(self):
+        audio = np.concatenate([_speech(20), _silence(1), _speech(20), _silence(1), _speech(20)])
+        spans = _split_chunks(audio)
+        assert len(spans) == 3
+        for (_, prev_end), (start, _) in zip(spans, spans[1:]):
+            assert prev_end == start
+
+    def test_drop_repeated_prefix(self):
+        assert _drop_repeated_prefix("we should meet on", "On Thursday then.") == "Thursday then."
+        assert _drop_repeated_prefix("hello there", "general Kenobi") == "general Kenobi"
+
+    def test_long_audio_is_decoded_in_chunks(self):
+        backend = self._backend(2, ["we should meet on", "on Thursday", "at noon"])
+        assert backend.transcribe(_speech(60)) == "we should meet on Thursday at noon"
+        assert backend._decode_result.call_count == 3
+
+    def test_transcribe_result_chunks_long_audio(self):
+        backend = WhisperBackend(workers=2)
+        backend._model = MagicMock()
+        texts = iter(["we should meet on", "on Thursday", "at noon"])
+
+        def decode(audio, prompt, words=False):
+            ws = [MagicMock(word=f" {w}", start=0.1 * i, end=0.1 * i + 0.1, probability=0.9)
+                  for i, w in enumerate(next(texts).split())]
+            seg = MagicMock(text="".join(w.word for w in ws), words=ws, avg_logprob=-0.2)
+            return Transcript.from_segments([seg])
+
+        backend._decode_result = MagicMock(side_effect=decode)
+        t = backend.transcribe_result(_speech(60))
+        assert backend._decode_result.call_count == 3
+        assert t.text == "we should meet on Thursday at noon"
+        assert t.words == ("we", "should", "meet", "on", "Thursday", "at", "noon")
+        # Later chunks are moved to their offset in the recording.
+        assert t.starts[4] == pytest.approx(24.1, abs=1e-3)
+        assert list(t.segment_offsets) == [0, 4, 5, 7]
+        assert t.segment_probability == pytest.approx(np.exp(-0.2))
+
+    def test_short_audio_and_single_worker_skip_chunking(self):
+        for workers, seconds in ((2, 10), (1, 60)):
+            backend = self._backend(workers)
+            backend._model.transcribe.return_value = ([], None)
+            backend.transcribe(_speech(seconds))
+            backend._decode_result.assert_not_called()
+            backend.transcribe_result(_speech(seconds))
+            (audio, _, _), _ = backend._decode_result.call_args
+            assert len(audio) == seconds * SAMPLE_RATE
+
+    def test_workers_share_cpu_threads(self):
+        options = WhisperBackend(workers=4)._model_options()
+        assert options["num_workers"] == 4
+        assert options["cpu_threads"] >= 1
+        assert WhisperBackend()._model_options()["cpu_threads"] == 0
+
+    def test_config_clamps_workers(self):
+        from muttr.config import _validated
+        assert _validated({"parallel_decode_workers": 0})["parallel_decode_workers"] == 1
+        assert _validated({"parallel_decode_workers": 64})["parallel_decode_workers"] == 8
+
+
+class TestTranscriptCache:
+    def _backend(self, cache, profile=DEFAULT_DECODE_PROFILE):
+        backend = WhisperBackend(profile=profile, cache=cache)
+        backend._model = MagicMock()
+        segment = MagicMock()
+        segment.text = " hello world "
+        backend._model.transcribe.return_value = ([segment], None)
+        return backend
+
+    def test_identical_audio_skips_decoding(self):
+        cache = TranscriptCache()
+        backend = self._backend(cache)
+        audio = _speech(2)
+        assert backend.transcribe(audio) == "hello world"
+        assert backend.transcribe(audio.copy()) == "hello world"
+        assert backend._model.transcribe.call_count == 1
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    def test_sub_quantum_noise_hits(self):
+        audio = (np.rint(_speech(1) * 32767) / 32767).astype(np.float32)
+        assert TranscriptCache.fingerprint(audio + 1e-6) == TranscriptCache.fingerprint(audio)
+
+    def test_prompt_and_profile_change_key(self):
+        cache = TranscriptCache()
+        audio = _speech(1)
+        self._backend(cache).transcribe(audio)
+        backend = self._backend(cache)
+        backend.transcribe(audio, initial_prompt="Kubernetes")
+        assert backend._model.transcribe.call_count == 1
+        other = self._backend(cache, profile="fast")
+        other.transcribe(audio)
+        assert other._model.transcribe.call_count == 1
+
+    def test_lru_eviction(self):
+        cache = TranscriptCache(max_entries=2)
+        for key in "abc":
+            cache.put(key, key)
+        assert cache.get("a") is None
+        assert cache.get("c") == "c"
+
+    def test_disk_tier_survives_new_cache(self, tmp_path):
+        TranscriptCache(directory=str(tmp_path)).put("k", "persisted")
+        cache = TranscriptCache(directory=str(tmp_path))
+        assert cache.get("k") == "persisted"
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_segment_requests_bypass_cache(self):
+        cache = TranscriptCache()
+        backend = self._backend(cache)
+        backend.transcribe(_speech(1), word_timestamps=True, _return_segments=True)
+        assert cache.stats()["entries"] == 0
+
+    def test_decode_mode_changes_key(self):
+        cache = TranscriptCache()
+        audio = _speech(60)
+        self._backend(cache).transcribe(audio)
+        chunked = WhisperBackend(workers=2, cache=cache)
+        chunked._model = MagicMock()
+        chunked._decode_result = MagicMock(return_value=_text("x"))
+        chunked.transcribe(audio)
+        assert chunked._decode_result.call_count > 0
+        assert cache.stats()["entries"] == 2
+
+    def test_stream_finish_uses_cache(self):
+        cache = TranscriptCache()
+        backend = self._backend(cache)
+        audio = _speech(2)
+        for _ in range(2):
+            stream = backend.start_stream(prompt_factory=lambda: "ctx")
+            _feed_blocks(stream, audio)
+            assert stream.finish().text == "hello world"
+        assert backend._model.transcribe.call_count == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_stream_key_depends_on_prompt(self):
+        cache = TranscriptCache()
+        backend = self._backend(cache)
+        audio = _speech(2)
+        for prompt in ("one", "two"):
+            stream = backend.start_stream(prompt_factory=lambda: prompt)
+            _feed_blocks(stream, audio)
+            stream.finish()
+        assert backend._model.transcribe.call_count == 2
+
+
+class TestTranscriptResult:
+    def _segments(self):
+        words = [
+            MagicMock(word=" Hello", start=0.0, end=0.4, probability=0.9),
+            MagicMock(word=" there.", start=0.4, end=0.8, probability=0.5),
+            MagicMock(word=" Bye", start=1.0, end=1.3, probability=0.7),
+        ]
+        return [
+            MagicMock(text=" Hello there. ", words=words[:2]),
+            MagicMock(text=" Bye", words=words[2:]),
+        ]
+
+    def test_from_segments_builds_parallel_arrays(self):
+        t = Transcript.from_segments(self._segments())
+        assert t.text == "Hello there. Bye"
+        assert t.words == ("Hello", "there.", "Bye")
+        assert t.starts.dtype == np.float32
+        assert list(t.segment_offsets) == [0, 2, 3]
+        assert t.mean_probability == pytest.approx(0.7)
+
+    def test_empty_transcript(self):
+        t = Transcript(text="")
+        assert not t.has_words
+        assert t.mean_probability == 0.0
+
+    def test_single_decode_with_word_timestamps(self):
+        backend = WhisperBackend()
+        backend._model = MagicMock()
+        backend._model.transcribe.return_value = (self._segments(), None)
+        t = backend.transcribe_result(_speech(1), initial_prompt="ctx")
+        assert t.words == ("Hello", "there.", "Bye")
+        assert backend._model.transcribe.call_count == 1
+        _, kwargs = backend._model.transcribe.call_args
+        assert kwargs["word_timestamps"] is True
+        assert kwargs["initial_prompt"] == "ctx"
+
+    def test_result_is_cached_on_disk(self, tmp_path):
+        cache = TranscriptCache(directory=str(tmp_path))
+        backend = WhisperBackend(cache=cache)
+        backend._model = MagicMock()
+        backend._model.transcribe.return_value = (self._segments(), None)
+        audio = _speech(1)
+        first = backend.transcribe_result(audio)
+        assert backend.transcribe_result(audio) is first
+        assert backend._model.transcribe.call_count == 1
+
+        fresh = WhisperBackend(cache=TranscriptCache(directory=str(tmp_path)))
+        fresh._model = MagicMock()
+        restored = fresh.transcribe_result(audio)
+        fresh._model.transcribe.assert_not_called()
+        assert restored.words == first.words
+        np.testing.assert_array_equal(restored.probabilities, first.probabilities)
+        np.testing.assert_array_equal(restored.segment_offsets, first.segment_offsets)
@@ -0,0 +1,87 @@
+"""Tests for muttr.vad -- silence trimming before transcription."""
+
+import numpy as np
+import pytest
+
+from muttr.cadence import RMS_FLOOR, frame_rms
+from muttr.vad import FRAME_LEN, MAX_PAUSE_MS, PAD_MS, SAMPLE_RATE, trim_silence
+
+
+def _speech(seconds, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 0.1).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+class TestFrameRms:
+    def test_matches_per_frame_rms(self):
+        audio = _speech(0.1)
+        rms = frame_rms(audio, FRAME_LEN)
+        assert len(rms) == len(audio) // FRAME_LEN
+        first = audio[:FRAME_LEN]
+        assert rms[0] == pytest.approx(np.sqrt(np.mean(first ** 2)), rel=1e-5)
+
+    def test_ignores_partial_frame(self):
+        assert len(frame_rms(np.zeros(FRAME_LEN + 10, dtype=np.float32), FRAME_LEN)) == 1
+
+
+class TestTrimSilence:
+    def test_strips_leading_and_trailing_silence(self):
+        audio = np.concatenate([_silence(1), _speech(2), _silence(1.5)])
+        result = trim_silence(audio)
+        pad_s = PAD_MS / 1000
+        assert len(result.audio) / SAMPLE_RATE == pytest.approx(2 + 2 * pad_s, abs=0.07)
+        assert result.trimmed
+
+    def test_shortens_long_internal_pause(self):
+        audio = np.concatenate([_speech(1), _silence(3), _speech(1, seed=1)])
+        result = trim_silence(audio)
+        assert len(result.spans) == 2
+        assert len(result.audio) < 2.6 * SAMPLE_RATE
+
+    def test_keeps_short_internal_pause(self):
+        short = (MAX_PAUSE_MS / 1000) / 2
+        audio = np.concatenate([_speech(1), _silence(short), _speech(1, seed=1)])
+        result = trim_silence(audio)
+        assert len(result.spans) == 1
+        assert not result.trimmed
+
+    def test_all_silence_is_left_to_whisper(self):
+        audio = _silence(2)
+        result = trim_silence(audio)
+        assert result.audio is audio
+        assert not result.trimmed
+
+    def test_quiet_audio_below_floor_is_untouched(self):
+        audio = np.full(SAMPLE_RATE, RMS_FLOOR / 2, dtype=np.float32)
+        assert trim_silence(audio).audio is audio
+
+    def test_offset_map_points_back_to_original(self):
+        speech_b = _speech(1, seed=1)
+        audio = np.concatenate([_silence(1), _speech(1), _silence(3), speech_b])
+        result = trim_silence(audio)
+        # The first sample of the second kept span maps to its original offset
+        second_start = result.spans[1, 0]
+        trimmed_offset = result.spans[0, 1] - result.spans[0, 0]
+        assert result.to_original(trimmed_offset) == second_start
+        assert np.array_equal(
+            result.audio[trimmed_offset:trimmed_offset + 100],
+            audio[second_start:second_start + 100],
+        )
+        assert result.to_original_time(0.0) == pytest.approx(result.spans[0, 0] / SAMPLE_RATE)
+
+    def test_vectorized_time_map_matches_scalar(self):
+        audio = np.concatenate([_silence(1), _speech(1), _silence(3), _speech(1, seed=1)])
+        result = trim_silence(audio)
+        times = np.array([0.0, 0.5, 1.1, 1.6], dtype=np.float32)
+        mapped = result.to_original_times(times)
+        assert mapped == pytest.approx([result.to_original_time(float(t)) for t in times])
+
+    def test_spans_never_overlap(self):
+        audio = np.concatenate([_speech(1), _silence(1), _speech(1, seed=1)])
+        result = trim_silence(audio, pad_ms=900, max_pause_ms=300)
+        assert len(result.audio) <= len(audio)
+        assert np.all(result.spans[1:, 0] >= result.spans[:-1, 1])
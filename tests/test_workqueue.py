@@ -0,0 +1,69 @@
+"""Tests for muttr.workqueue -- ordered background side effects."""
+
+import threading
+
+from muttr.workqueue import WorkQueue
+
+
+class TestWorkQueue:
+    def test_runs_jobs_in_order(self):
+        q = WorkQueue()
+        seen = []
+        for i in range(50):
+            q.submit(seen.append, i)
+        assert q.flush(timeout=5)
+        assert seen == list(range(50))
+        q.shutdown()
+
+    def test_runs_off_the_calling_thread(self):
+        q = WorkQueue()
+        threads = []
+        q.submit(lambda: threads.append(threading.current_thread()))
+        q.flush(timeout=5)
+        assert threads[0] is not threading.current_thread()
+        q.shutdown()
+
+    def test_failing_job_does_not_stop_later_jobs(self):
+        q = WorkQueue()
+        seen = []
+        q.submit(lambda: 1 / 0)
+        q.submit(seen.append, "after")
+        q.flush(timeout=5)
+        assert seen == ["after"]
+        q.shutdown()
+
+    def test_passes_keyword_arguments(self):
+        q = WorkQueue()
+        seen = {}
+        q.submit(seen.update, a=1, b=2)
+        q.flush(timeout=5)
+        assert seen == {"a": 1, "b": 2}
+        q.shutdown()
+
+    def test_shutdown_drains_pending_work(self):
+        q = WorkQueue()
+        gate = threading.Event()
+        seen = []
+        q.submit(gate.wait, 5)
+        q.submit(seen.append, "queued")
+        threading.Timer(0.05, gate.set).start()
+        assert q.shutdown(timeout=5)
+        assert seen == ["queued"]
+
+    def test_flush_times_out_while_blocked(self):
+        q = WorkQueue()
+        gate = threading.Event()
+        q.submit(gate.wait, 5)
+        assert q.flush(timeout=0.05) is False
+        gate.set()
+        q.shutdown()
+
+    def test_submit_after_shutdown_runs_inline(self):
+        q = WorkQueue()
+        q.shutdown()
+        seen = []
+        q.submit(seen.append, threading.current_thread())
+        assert seen == [threading.current_thread()]
+
+    def test_flush_without_jobs(self):
+        assert WorkQueue().flush(timeout=0.1)